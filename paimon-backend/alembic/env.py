@@ -6,7 +6,7 @@ from sqlalchemy.engine import Connection
 from alembic import context
 
 # Import app configuration and models
-from app.core.config import settings
+from app.core.config import get_settings
 from app.models.base import Base
 
 # Import all models to ensure they are registered with Base
@@ -21,7 +21,7 @@ import app.models.portfolio_cache  # noqa: F401
 config = context.config
 
 # Override sqlalchemy.url with value from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", get_settings().DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -56,6 +56,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -63,7 +64,13 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # One transaction per revision so autocommit_block() (used for
+    # CREATE INDEX CONCURRENTLY) only commits the current revision's work
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
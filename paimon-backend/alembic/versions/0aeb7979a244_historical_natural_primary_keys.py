@@ -0,0 +1,131 @@
+"""historical_natural_primary_keys
+
+Revision ID: 0aeb7979a244
+Revises: 27b9d7ca3e21
+Create Date: 2026-10-17 01:26:23.225297
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0aeb7979a244'
+down_revision: Union[str, Sequence[str], None] = '27b9d7ca3e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger("alembic.migration")
+
+# (table, natural key columns, unique constraint replaced by the primary key)
+TABLES = (
+    ("historical_apr", ["pool_address", "timestamp"], "uq_apr_pool_time"),
+    (
+        "historical_rewards",
+        ["user_address", "pool_address", "reward_type", "timestamp"],
+        "uq_rewards_user_time_pool_type",
+    ),
+)
+
+
+def _disable_compression(bind, table: str) -> None:
+    """
+    Decompress a hypertable and turn compression off.
+
+    TimescaleDB rejects constraint and column changes on hypertables with
+    compression enabled. The compression revision later in the chain
+    re-enables it; plain tables and uncompressed hypertables are left alone.
+    """
+    compression_enabled = bind.execute(
+        sa.text(
+            "SELECT compression_enabled FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = :table"
+        ),
+        {"table": table},
+    ).scalar()
+    if not compression_enabled:
+        return
+
+    log.warning(
+        "Decompressing %s to change its primary key", table,
+        extra={"revision": revision},
+    )
+    op.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE);")
+    op.execute(f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{table}') c;")
+    op.execute(f"ALTER TABLE {table} SET (timescaledb.compress = false);")
+
+
+def _partition_columns(bind, table: str) -> list[str]:
+    """Return the hypertable dimension columns of table (time column first)."""
+    return list(
+        bind.execute(
+            sa.text(
+                "SELECT column_name FROM timescaledb_information.dimensions "
+                "WHERE hypertable_name = :table ORDER BY dimension_number"
+            ),
+            {"table": table},
+        ).scalars()
+    )
+
+
+def upgrade() -> None:
+    """
+    Replace the surrogate id primary keys of the historical hypertables.
+
+    The natural key (already unique) becomes the primary key and the serial
+    id column is dropped: 8 bytes per row, one B-tree and one sequence less
+    per table. Both keys include the hypertable time column, as TimescaleDB
+    requires. Tables without an id column are skipped.
+
+    PostgreSQL: compressed hypertables are decompressed first, see
+    _disable_compression.
+    """
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+    inspector = sa.inspect(bind)
+    for table, key_columns, unique_name in TABLES:
+        if not any(c["name"] == "id" for c in inspector.get_columns(table)):
+            continue
+
+        if is_postgresql:
+            _disable_compression(bind, table)
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.drop_constraint(unique_name, type_="unique")
+            batch_op.drop_column("id")
+            batch_op.create_primary_key(f"pk_{table}", key_columns)
+
+
+def downgrade() -> None:
+    """
+    Restore the serial id primary keys and natural-key unique constraints.
+
+    PostgreSQL: the id key is extended with the hypertable partition columns,
+    as in 61ecaf017959.
+    """
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+    for table, key_columns, unique_name in TABLES:
+        if is_postgresql:
+            _disable_compression(bind, table)
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.create_unique_constraint(unique_name, key_columns)
+
+        # Number existing rows
+        if is_postgresql:
+            op.execute(f"ALTER TABLE {table} ADD COLUMN id SERIAL")
+            pk_columns = ["id", *_partition_columns(bind, table)]
+        else:
+            op.add_column(table, sa.Column("id", sa.Integer(), nullable=True))
+            op.execute(f"UPDATE {table} SET id = rowid")
+            pk_columns = ["id"]
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column("id", existing_type=sa.Integer(), nullable=False)
+            batch_op.create_primary_key(f"pk_{table}", pk_columns)
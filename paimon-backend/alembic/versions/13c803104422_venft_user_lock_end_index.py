@@ -0,0 +1,48 @@
+"""venft_user_lock_end_index
+
+Revision ID: 13c803104422
+Revises: 9e815d4f6cff
+Create Date: 2026-10-17 00:11:47.711837
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '13c803104422'
+down_revision: Union[str, Sequence[str], None] = '9e815d4f6cff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Replace idx_venft_user with a (user_address, lock_end) composite.
+
+    Query patterns:
+        SELECT * FROM venft_positions WHERE user_address = ?
+        SELECT * FROM venft_positions WHERE user_address = ? AND lock_end > ?
+    lock_end is a single Unix-timestamp bound, so "locks active at t" is a
+    B-tree range on the second key column; a GiST/tstzrange index would
+    only pay off for two-sided intervals.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_venft_user_lock_end',
+            'venft_positions',
+            ['user_address', 'lock_end'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    # Leading-column prefix of the composite above
+    op.drop_index('idx_venft_user', table_name='venft_positions', if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column user index."""
+    op.create_index('idx_venft_user', 'venft_positions', ['user_address'], unique=False)
+    op.drop_index('idx_venft_user_lock_end', table_name='venft_positions')
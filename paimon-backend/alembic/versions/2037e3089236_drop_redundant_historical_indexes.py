@@ -0,0 +1,48 @@
+"""drop_redundant_historical_indexes
+
+Revision ID: 2037e3089236
+Revises: 9f60e28df0e1
+Create Date: 2026-10-17 01:44:30.571002
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2037e3089236'
+down_revision: Union[str, Sequence[str], None] = '9f60e28df0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, columns) subsumed by the composites of e7d4d1011c63
+REDUNDANT_INDEXES = (
+    # idx_historical_apr_pool_time covers pool_address lookups and time-range scans
+    ('idx_historical_apr_pool_address', 'historical_apr', ['pool_address']),
+    ('idx_apr_time_pool', 'historical_apr', ['timestamp', 'pool_address']),
+    # idx_historical_rewards_user_time covers user_address lookups and per-user time scans
+    ('idx_historical_rewards_user_address', 'historical_rewards', ['user_address']),
+    ('idx_rewards_time_user', 'historical_rewards', ['timestamp', 'user_address']),
+    # idx_rewards_pool_time (pool_address, timestamp) covers pool_address lookups
+    ('idx_historical_rewards_pool_address', 'historical_rewards', ['pool_address']),
+)
+
+
+def upgrade() -> None:
+    """
+    Drop historical indexes that are leading-column prefixes of the composites.
+
+    Each one costs write amplification on every insert without serving a
+    query the composite indexes cannot.
+    """
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column and time-leading historical indexes."""
+    for name, table, columns in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
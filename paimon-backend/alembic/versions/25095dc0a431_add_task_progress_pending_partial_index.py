@@ -0,0 +1,53 @@
+"""add_task_progress_pending_partial_index
+
+Revision ID: 25095dc0a431
+Revises: 601d4340a655
+Create Date: 2026-10-17 00:02:51.616632
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '25095dc0a431'
+down_revision: Union[str, Sequence[str], None] = '601d4340a655'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Serve pending-task polling from a partial index.
+
+    Query pattern: SELECT * FROM task_progress WHERE status = 'PENDING' ORDER BY created_at
+    The index only holds PENDING rows, so its cost does not grow with the
+    number of completed/claimed tasks.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_task_progress_pending',
+            'task_progress',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'PENDING'"),
+            postgresql_concurrently=True,
+            sqlite_where=sa.text("status = 'PENDING'"),
+        )
+
+    # (user_id, status) is never queried; user_id lookups are served by
+    # ix_task_progress_user_id and idx_task_progress_user_task
+    op.drop_index('idx_task_progress_user_status', table_name='task_progress')
+
+
+def downgrade() -> None:
+    """Restore the (user_id, status) composite and drop the partial index."""
+    op.create_index(
+        'idx_task_progress_user_status',
+        'task_progress',
+        ['user_id', 'status'],
+        unique=False
+    )
+    op.drop_index('idx_task_progress_pending', table_name='task_progress')
@@ -0,0 +1,69 @@
+"""users_address_lower_index
+
+Revision ID: 27b9d7ca3e21
+Revises: 97eb727a56af
+Create Date: 2026-10-17 00:29:21.694084
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27b9d7ca3e21'
+down_revision: Union[str, Sequence[str], None] = '97eb727a56af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Index lower(address) so auth lookups hit an index regardless of case.
+
+    Query pattern (get_current_user):
+        SELECT * FROM users WHERE lower(address) = ?
+    Token subjects are lowercased, but rows may have been stored checksummed;
+    the plain ix_users_address B-tree cannot serve lower(address). Unique, so
+    the same wallet cannot be registered twice in different cases.
+
+    Fails before building if users holds case-duplicate addresses (merge or
+    delete them first). A failed concurrent build leaves an INVALID index
+    behind, so it is dropped before re-raising.
+    """
+    bind = op.get_bind()
+    duplicates = bind.execute(
+        sa.text(
+            "SELECT lower(address) FROM users WHERE address IS NOT NULL "
+            "GROUP BY lower(address) HAVING count(*) > 1"
+        )
+    ).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f"users has {len(duplicates)} address(es) registered in more than one "
+            f"case, resolve them before upgrading: {', '.join(duplicates[:20])}"
+        )
+
+    is_postgresql = bind.dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        if is_postgresql:
+            # Leftover INVALID index from an interrupted earlier attempt
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_address_lower")
+        try:
+            op.create_index(
+                'ix_users_address_lower',
+                'users',
+                [sa.text('lower(address)')],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+        except Exception:
+            if is_postgresql:
+                op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_address_lower")
+            raise
+
+
+def downgrade() -> None:
+    """Drop the case-insensitive address index."""
+    op.drop_index('ix_users_address_lower', table_name='users')
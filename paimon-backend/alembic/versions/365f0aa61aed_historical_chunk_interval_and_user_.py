@@ -0,0 +1,97 @@
+"""historical_chunk_interval_and_user_partitions
+
+Revision ID: 365f0aa61aed
+Revises: 0aeb7979a244
+Create Date: 2026-10-17 09:12:44.512307
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '365f0aa61aed'
+down_revision: Union[str, Sequence[str], None] = '0aeb7979a244'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger("alembic.migration")
+
+
+# Hypertable chunk sizing. Retune so a single chunk (plus its indexes) stays
+# around 25% of shared_buffers at the observed ingest rate.
+CHUNK_TIME_INTERVAL = "1 day"
+# TimescaleDB default, restored on downgrade
+DEFAULT_CHUNK_TIME_INTERVAL = "7 days"
+HYPERTABLES = ("historical_apr", "historical_rewards")
+# Hash partitions on user_address so per-user reward queries prune chunks
+REWARDS_USER_PARTITIONS = 4
+
+
+def upgrade() -> None:
+    """
+    Shrink historical chunks to 1 day and hash-partition rewards by user.
+
+    PostgreSQL only. The new interval applies to chunks created from now on;
+    existing chunks keep their size. TimescaleDB can only add a dimension to
+    a hypertable without chunks, so the user_address partition is skipped
+    (with a warning) once historical_rewards holds data.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in HYPERTABLES:
+        op.execute(
+            f"SELECT set_chunk_time_interval('{table}', INTERVAL '{CHUNK_TIME_INTERVAL}');"
+        )
+
+    has_dimension = bind.execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.dimensions "
+            "WHERE hypertable_name = 'historical_rewards' "
+            "AND column_name = 'user_address'"
+        )
+    ).first()
+    if has_dimension:
+        return
+
+    has_chunks = bind.execute(
+        sa.text("SELECT 1 FROM show_chunks('historical_rewards') LIMIT 1")
+    ).first()
+    if has_chunks:
+        log.warning(
+            "historical_rewards already has chunks, skipping user_address partitioning",
+            extra={"revision": revision},
+        )
+        return
+
+    op.execute(
+        f"""
+        SELECT add_dimension(
+            'historical_rewards',
+            'user_address',
+            number_partitions => {REWARDS_USER_PARTITIONS},
+            if_not_exists => TRUE
+        );
+        """
+    )
+
+
+def downgrade() -> None:
+    """
+    Restore the default 7-day chunk interval.
+
+    TimescaleDB cannot remove a dimension, so the user_address partition
+    stays in place.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in HYPERTABLES:
+        op.execute(
+            f"SELECT set_chunk_time_interval('{table}', INTERVAL '{DEFAULT_CHUNK_TIME_INTERVAL}');"
+        )
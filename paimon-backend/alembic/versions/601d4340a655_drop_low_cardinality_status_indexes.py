@@ -0,0 +1,37 @@
+"""drop_low_cardinality_status_indexes
+
+Revision ID: 601d4340a655
+Revises: e7d4d1011c63
+Create Date: 2026-10-17 00:02:09.978020
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '601d4340a655'
+down_revision: Union[str, Sequence[str], None] = 'e7d4d1011c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Drop single-column indexes on low-cardinality status enums.
+
+    Each status column holds 3-4 distinct values, so the planner prefers a
+    sequential scan and the index only adds write overhead on every status
+    UPDATE. Worker polling should rely on partial indexes over the
+    actionable statuses instead.
+    """
+    op.drop_index('ix_task_progress_status', table_name='task_progress')
+    op.drop_index('ix_points_redemptions_status', table_name='points_redemptions')
+
+
+def downgrade() -> None:
+    """Restore the single-column status indexes."""
+    op.create_index('ix_points_redemptions_status', 'points_redemptions', ['status'], unique=False)
+    op.create_index('ix_task_progress_status', 'task_progress', ['status'], unique=False)
@@ -5,6 +5,7 @@ Revises: c7d84fe676d1
 Create Date: 2025-11-15 18:33:39.883695
 
 """
+import logging
 from typing import Sequence, Union
 
 from alembic import op
@@ -17,6 +18,8 @@ down_revision: Union[str, Sequence[str], None] = 'c7d84fe676d1'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+log = logging.getLogger("alembic.migration")
+
 
 def upgrade() -> None:
     """
@@ -27,6 +30,9 @@ def upgrade() -> None:
     """
     bind = op.get_bind()
     is_postgresql = bind.dialect.name == "postgresql"
+    # TimescaleDB requires every unique index on a hypertable to include the
+    # time column; SQLite keeps id alone so it stays the rowid alias
+    pk_columns = ["id", "timestamp"] if is_postgresql else ["id"]
 
     # Create historical_apr table
     op.create_table(
@@ -48,7 +54,7 @@ def upgrade() -> None:
             nullable=False,
             server_default=sa.text("0"),
         ),
-        sa.PrimaryKeyConstraint("id", name=op.f("pk_historical_apr")),
+        sa.PrimaryKeyConstraint(*pk_columns, name=op.f("pk_historical_apr")),
         sa.UniqueConstraint(
             "pool_address", "timestamp", name="uq_apr_pool_time"
         ),
@@ -94,7 +100,7 @@ def upgrade() -> None:
             nullable=False,
             server_default=sa.text("0"),
         ),
-        sa.PrimaryKeyConstraint("id", name=op.f("pk_historical_rewards")),
+        sa.PrimaryKeyConstraint(*pk_columns, name=op.f("pk_historical_rewards")),
         sa.UniqueConstraint(
             "user_address",
             "timestamp",
@@ -185,9 +191,15 @@ def upgrade() -> None:
             """
         )
 
-        print("✅ TimescaleDB hypertables created with 90-day retention policy")
+        log.info(
+            "TimescaleDB hypertables created with 90-day retention policy",
+            extra={"revision": revision},
+        )
     else:
-        print("ℹ️ SQLite detected - using regular tables with timestamp indexes")
+        log.info(
+            "SQLite detected - using regular tables with timestamp indexes",
+            extra={"revision": revision},
+        )
 
 
 def downgrade() -> None:
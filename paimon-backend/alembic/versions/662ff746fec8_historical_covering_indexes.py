@@ -0,0 +1,120 @@
+"""historical_covering_indexes
+
+Revision ID: 662ff746fec8
+Revises: 2037e3089236
+Create Date: 2026-10-17 01:44:53.135898
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '662ff746fec8'
+down_revision: Union[str, Sequence[str], None] = '2037e3089236'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, key columns, INCLUDE payload columns)
+COVERING_INDEXES = (
+    # SELECT pool_address, timestamp, apr, tvl_usd, trading_volume_24h
+    # FROM historical_apr WHERE pool_address = ? AND timestamp >= ?
+    (
+        'idx_historical_apr_pool_time',
+        'historical_apr',
+        'pool_address, timestamp DESC',
+        'apr, tvl_usd, trading_volume_24h',
+    ),
+    # "Latest N rewards for a user": the ORDER BY/LIMIT is only pushed into
+    # this index when timestamp is compared bare (no date_trunc or casts)
+    (
+        'idx_historical_rewards_user_time',
+        'historical_rewards',
+        'user_address, timestamp DESC',
+        'pool_address, reward_type, amount, cumulative_amount',
+    ),
+    (
+        'idx_historical_rewards_user_pool_time',
+        'historical_rewards',
+        'user_address, pool_address, timestamp DESC',
+        'amount, cumulative_amount, reward_type',
+    ),
+)
+
+
+def _rebuild_index(bind, name: str, table: str, columns: str, include: str | None) -> None:
+    """
+    Rebuild an index with (or without) INCLUDE columns without blocking writes.
+
+    Must run inside ``op.get_context().autocommit_block()``. The new index is
+    built under a temporary name, then swapped in by drop and rename, so
+    queries keep an index throughout. TimescaleDB hypertables do not support
+    CONCURRENTLY and are built chunk by chunk instead (one short lock per
+    chunk). Indexes already in the requested shape are left alone.
+    """
+    indexdef = bind.execute(
+        sa.text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"),
+        {"name": name},
+    ).scalar()
+    if indexdef is not None and ("INCLUDE" in indexdef) == bool(include):
+        return
+
+    is_hypertable = bind.execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = :table"
+        ),
+        {"table": table},
+    ).first()
+    covering = f" INCLUDE ({include})" if include else ""
+    tmp_name = f"{name}_tmp"
+
+    # Leftover from an interrupted earlier attempt
+    op.execute(f"DROP INDEX IF EXISTS {tmp_name}")
+    if is_hypertable:
+        op.execute(
+            f"CREATE INDEX {tmp_name} ON {table} ({columns}){covering} "
+            "WITH (timescaledb.transaction_per_chunk)"
+        )
+    else:
+        op.execute(f"CREATE INDEX CONCURRENTLY {tmp_name} ON {table} ({columns}){covering}")
+    op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute(f"ALTER INDEX {tmp_name} RENAME TO {name}")
+
+
+def upgrade() -> None:
+    """
+    Turn the per-user / per-pool historical indexes into covering indexes.
+
+    The INCLUDE payload lets the history endpoints answer from the index
+    alone (index-only scan). Planner statistics are refreshed afterwards;
+    index-only scans also need the visibility map set by VACUUM, which is
+    left to autovacuum / ops rather than run inside a migration.
+
+    PostgreSQL only; SQLite has no INCLUDE clause.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Index builds cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in COVERING_INDEXES:
+            _rebuild_index(bind, name, table, columns, include)
+
+        op.execute("ANALYZE historical_apr")
+        op.execute("ANALYZE historical_rewards")
+
+
+def downgrade() -> None:
+    """Rebuild the historical indexes without INCLUDE columns."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, _ in COVERING_INDEXES:
+            _rebuild_index(bind, name, table, columns, None)
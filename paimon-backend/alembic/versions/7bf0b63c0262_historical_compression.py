@@ -0,0 +1,73 @@
+"""historical_compression
+
+Revision ID: 7bf0b63c0262
+Revises: 662ff746fec8
+Create Date: 2026-10-17 01:45:17.011258
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7bf0b63c0262'
+down_revision: Union[str, Sequence[str], None] = '662ff746fec8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (hypertable, compress_segmentby): segment by the columns queries filter on
+COMPRESSION_SEGMENTBY = (
+    ("historical_apr", "pool_address"),
+    ("historical_rewards", "user_address,pool_address,reward_type"),
+)
+# Compress chunks once they are older than this
+COMPRESS_AFTER = "7 days"
+
+
+def upgrade() -> None:
+    """
+    Enable TimescaleDB native columnar compression on the historical hypertables.
+
+    Chunks are ordered by time so range scans decompress sequentially, and a
+    policy compresses them once they are older than 7 days.
+
+    PostgreSQL only.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, segmentby in COMPRESSION_SEGMENTBY:
+        op.execute(
+            f"""
+            ALTER TABLE {table} SET (
+                timescaledb.compress,
+                timescaledb.compress_segmentby = '{segmentby}',
+                timescaledb.compress_orderby = 'timestamp DESC'
+            );
+            """
+        )
+        op.execute(
+            f"""
+            SELECT add_compression_policy(
+                '{table}',
+                INTERVAL '{COMPRESS_AFTER}',
+                if_not_exists => TRUE
+            );
+            """
+        )
+
+
+def downgrade() -> None:
+    """Decompress all chunks and disable compression."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, _ in reversed(COMPRESSION_SEGMENTBY):
+        op.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE);")
+        op.execute(
+            f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{table}') c;"
+        )
+        op.execute(f"ALTER TABLE {table} SET (timescaledb.compress = false);")
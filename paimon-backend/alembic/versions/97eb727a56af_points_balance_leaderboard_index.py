@@ -0,0 +1,44 @@
+"""points_balance_leaderboard_index
+
+Revision ID: 97eb727a56af
+Revises: 13c803104422
+Create Date: 2026-10-17 00:25:25.269535
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '97eb727a56af'
+down_revision: Union[str, Sequence[str], None] = '13c803104422'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Serve the leaderboard top-N from an index instead of a full sort.
+
+    Query pattern (GET /api/leaderboard):
+        SELECT user_id, total_earned FROM points_balance
+        ORDER BY total_earned DESC LIMIT ?
+    The planner walks the first N index entries; user_id is carried as a
+    covering column on PostgreSQL so the scan need not visit the heap.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_points_balance_leaderboard',
+            'points_balance',
+            [sa.text('total_earned DESC')],
+            unique=False,
+            postgresql_include=['user_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the leaderboard index."""
+    op.drop_index('idx_points_balance_leaderboard', table_name='points_balance')
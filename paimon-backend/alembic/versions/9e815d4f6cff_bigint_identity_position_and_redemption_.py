@@ -0,0 +1,68 @@
+"""bigint_identity_position_and_redemption_ids
+
+Revision ID: 9e815d4f6cff
+Revises: ba25e213e3f4
+Create Date: 2026-10-17 00:09:01.988245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e815d4f6cff'
+down_revision: Union[str, Sequence[str], None] = 'ba25e213e3f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Append-heavy tables whose serial INTEGER ids become BIGINT identity columns
+TABLES = ("lp_positions", "vault_positions", "venft_positions", "points_redemptions")
+
+
+def upgrade() -> None:
+    """
+    Convert serial INTEGER primary keys to BIGINT GENERATED BY DEFAULT AS IDENTITY.
+
+    PostgreSQL only; SQLite keeps INTEGER PRIMARY KEY (its rowid alias).
+    Tables whose id is already an identity column are skipped.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    inspector = sa.inspect(bind)
+    for table in TABLES:
+        id_column = next(c for c in inspector.get_columns(table) if c["name"] == "id")
+        if id_column.get("identity"):
+            continue
+
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+        # Continue numbering after existing rows
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    """Restore serial INTEGER primary keys."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER")
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')"
+        )
@@ -0,0 +1,58 @@
+"""historical_brin_timestamp_indexes
+
+Revision ID: 9f60e28df0e1
+Revises: 365f0aa61aed
+Create Date: 2026-10-17 01:44:11.274471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f60e28df0e1'
+down_revision: Union[str, Sequence[str], None] = '365f0aa61aed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+HYPERTABLES = ("historical_apr", "historical_rewards")
+
+
+def upgrade() -> None:
+    """
+    Replace the B-tree timestamp indexes of the historical hypertables with BRIN.
+
+    Rows arrive in time order, so a block-range index serves time-range scans
+    at a fraction of the B-tree size. The default <table>_timestamp_idx
+    B-trees added by create_hypertable duplicate it and are dropped as well.
+
+    PostgreSQL only; SQLite keeps its B-tree timestamp indexes.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in HYPERTABLES:
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_timestamp;")
+        op.execute(
+            f"""
+            CREATE INDEX idx_{table}_timestamp ON {table}
+            USING BRIN (timestamp) WITH (pages_per_range = 32);
+            """
+        )
+        op.execute(f"DROP INDEX IF EXISTS {table}_timestamp_idx;")
+
+
+def downgrade() -> None:
+    """Restore the B-tree timestamp indexes."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in HYPERTABLES:
+        op.drop_index(f"idx_{table}_timestamp", table_name=table)
+        op.create_index(f"idx_{table}_timestamp", table, ["timestamp"], unique=False)
+        op.create_index(
+            f"{table}_timestamp_idx", table, [sa.text("timestamp DESC")], unique=False
+        )
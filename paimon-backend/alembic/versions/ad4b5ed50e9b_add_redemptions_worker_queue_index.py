@@ -0,0 +1,45 @@
+"""add_redemptions_worker_queue_index
+
+Revision ID: ad4b5ed50e9b
+Revises: b34e36bfec37
+Create Date: 2026-10-17 00:04:59.085182
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad4b5ed50e9b'
+down_revision: Union[str, Sequence[str], None] = 'b34e36bfec37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Serve the redemption worker queue from a partial index.
+
+    Query pattern (RedemptionProcessor.process_pending_redemptions):
+        SELECT * FROM points_redemptions WHERE status = 'PENDING'
+        ORDER BY created_at LIMIT ? FOR UPDATE SKIP LOCKED
+    Only actionable rows are indexed, so dequeue cost tracks the queue depth
+    rather than the COMPLETED/FAILED history.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_redemptions_worker_queue',
+            'points_redemptions',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+            postgresql_concurrently=True,
+            sqlite_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+        )
+
+
+def downgrade() -> None:
+    """Drop the worker queue index."""
+    op.drop_index('idx_redemptions_worker_queue', table_name='points_redemptions')
@@ -0,0 +1,65 @@
+"""portfolio_risk_alerts_jsonb_gin_index
+
+Revision ID: b34e36bfec37
+Revises: 25095dc0a431
+Create Date: 2026-10-17 00:04:24.121727
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b34e36bfec37'
+down_revision: Union[str, Sequence[str], None] = '25095dc0a431'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Store portfolio_summary.risk_alerts as JSONB with a GIN index.
+
+    Query pattern: SELECT * FROM portfolio_summary WHERE risk_alerts @> '[{"type": "HEALTH_FACTOR"}]'
+    PostgreSQL only; SQLite keeps the plain JSON column.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        'portfolio_summary',
+        'risk_alerts',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        server_default=sa.text("'[]'::jsonb"),
+        postgresql_using='risk_alerts::jsonb',
+    )
+    op.create_index(
+        'idx_portfolio_risk_alerts',
+        'portfolio_summary',
+        ['risk_alerts'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'risk_alerts': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Revert risk_alerts to JSON and drop the GIN index."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.drop_index('idx_portfolio_risk_alerts', table_name='portfolio_summary')
+    op.alter_column(
+        'portfolio_summary',
+        'risk_alerts',
+        type_=sa.JSON(),
+        existing_nullable=False,
+        server_default='[]',
+        postgresql_using='risk_alerts::json',
+    )
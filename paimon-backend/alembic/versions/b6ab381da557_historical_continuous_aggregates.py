@@ -0,0 +1,128 @@
+"""historical_continuous_aggregates
+
+Revision ID: b6ab381da557
+Revises: 7bf0b63c0262
+Create Date: 2026-10-17 01:45:33.928304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6ab381da557'
+down_revision: Union[str, Sequence[str], None] = '7bf0b63c0262'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create hourly APR and daily rewards continuous aggregates.
+
+    Created WITH NO DATA; the refresh policies backfill the recent buckets
+    and keep them current, and buckets outside the refresh window are
+    compressed.
+
+    PostgreSQL only.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Continuous aggregates: hourly APR per pool, daily rewards per user
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS historical_apr_hourly
+        WITH (timescaledb.continuous) AS
+        SELECT
+            pool_address,
+            time_bucket(INTERVAL '1 hour', timestamp) AS bucket,
+            avg(apr) AS apr_avg,
+            max(tvl_usd) AS tvl_max,
+            max(trading_volume_24h) AS trading_volume_24h_max
+        FROM historical_apr
+        GROUP BY pool_address, bucket
+        WITH NO DATA;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS historical_rewards_daily
+        WITH (timescaledb.continuous) AS
+        SELECT
+            user_address,
+            reward_type,
+            time_bucket(INTERVAL '1 day', timestamp) AS bucket,
+            sum(amount) AS amount_total,
+            max(cumulative_amount) AS cumulative_amount_max,
+            count(*) AS claim_count
+        FROM historical_rewards
+        GROUP BY user_address, reward_type, bucket
+        WITH NO DATA;
+        """
+    )
+
+    # Incrementally refresh recent buckets only
+    op.execute(
+        """
+        SELECT add_continuous_aggregate_policy(
+            'historical_apr_hourly',
+            start_offset => INTERVAL '7 days',
+            end_offset => INTERVAL '1 hour',
+            schedule_interval => INTERVAL '15 minutes',
+            if_not_exists => TRUE
+        );
+        """
+    )
+
+    op.execute(
+        """
+        SELECT add_continuous_aggregate_policy(
+            'historical_rewards_daily',
+            start_offset => INTERVAL '30 days',
+            end_offset => INTERVAL '1 day',
+            schedule_interval => INTERVAL '1 hour',
+            if_not_exists => TRUE
+        );
+        """
+    )
+
+    # Compress materialized buckets outside the refresh window
+    op.execute(
+        "ALTER MATERIALIZED VIEW historical_apr_hourly SET (timescaledb.compress = true);"
+    )
+    op.execute(
+        "ALTER MATERIALIZED VIEW historical_rewards_daily SET (timescaledb.compress = true);"
+    )
+
+    op.execute(
+        """
+        SELECT add_compression_policy(
+            'historical_apr_hourly',
+            compress_after => INTERVAL '14 days',
+            if_not_exists => TRUE
+        );
+        """
+    )
+
+    op.execute(
+        """
+        SELECT add_compression_policy(
+            'historical_rewards_daily',
+            compress_after => INTERVAL '60 days',
+            if_not_exists => TRUE
+        );
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the continuous aggregates (their policies drop with them)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS historical_rewards_daily;")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS historical_apr_hourly;")
@@ -0,0 +1,62 @@
+"""vault_risk_metrics_double_precision
+
+Revision ID: ba25e213e3f4
+Revises: ad4b5ed50e9b
+Create Date: 2026-10-17 00:05:39.594399
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ba25e213e3f4'
+down_revision: Union[str, Sequence[str], None] = 'ad4b5ed50e9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Store computed vault risk metrics as DOUBLE PRECISION.
+
+    health_factor and liquidation_price are derived ratios, never token
+    amounts, so 15 significant digits suffice and float8 is fixed-width
+    with native arithmetic. Token amounts stay NUMERIC(78, 18).
+    """
+    with op.batch_alter_table('vault_positions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'health_factor',
+            existing_type=sa.Numeric(precision=20, scale=6),
+            type_=sa.Double(),
+            existing_nullable=False,
+            postgresql_using='health_factor::float8',
+        )
+        batch_op.alter_column(
+            'liquidation_price',
+            existing_type=sa.Numeric(precision=20, scale=8),
+            type_=sa.Double(),
+            existing_nullable=False,
+            postgresql_using='liquidation_price::float8',
+        )
+
+
+def downgrade() -> None:
+    """Restore NUMERIC risk metric columns."""
+    with op.batch_alter_table('vault_positions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'liquidation_price',
+            existing_type=sa.Double(),
+            type_=sa.Numeric(precision=20, scale=8),
+            existing_nullable=False,
+            postgresql_using='liquidation_price::numeric(20, 8)',
+        )
+        batch_op.alter_column(
+            'health_factor',
+            existing_type=sa.Double(),
+            type_=sa.Numeric(precision=20, scale=6),
+            existing_nullable=False,
+            postgresql_using='health_factor::numeric(20, 6)',
+        )
@@ -118,7 +118,7 @@ def upgrade() -> None:
         sa.UniqueConstraint('contract_name')
     )
 
-    # Initialize indexer state for contracts
+    # Initialize indexer state for contracts (idempotent for re-runs)
     op.execute(
         """
         INSERT INTO indexer_state (contract_name, last_scanned_block) VALUES
@@ -128,6 +128,7 @@ def upgrade() -> None:
             ('SavingRate', 0),
             ('StabilityPool', 0),
             ('GaugeController', 0)
+        ON CONFLICT (contract_name) DO NOTHING
         """
     )
 
@@ -2,56 +2,47 @@
 FastAPI dependency functions for authentication.
 
 Dependencies:
-- get_current_user: Requires valid JWT token, raises 401 if invalid
+- get_current_user: Requires valid JWT token, raises 401 if invalid (shared CurrentUser)
+- get_current_user_with_kyc: Same as get_current_user, plus the user's KYC record
 - get_current_user_optional: Returns user data if token valid, None otherwise
 """
 
 from typing import Any
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decode_token
+from app.core.dependencies import CurrentUser, token_subject
+from app.core.security import bearer_scheme, decode_token_cached
+from app.models.kyc import KYC
 from app.models.user import User
 
-# HTTP Bearer security scheme for JWT tokens
-http_bearer = HTTPBearer()
+# Auth hot-path statements, built once and reused with bound parameters
+_USER_WITH_KYC = select(User, KYC).outerjoin(KYC, KYC.user_id == User.id)
+_USER_WITH_KYC_BY_ID = _USER_WITH_KYC.where(User.id == bindparam("user_id"))
+_USER_WITH_KYC_BY_ADDRESS = _USER_WITH_KYC.where(
+    func.lower(User.address) == bindparam("address")
+)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def _subject_from_credentials(credentials: HTTPAuthorizationCredentials) -> int | str:
     """
-    FastAPI dependency to extract and validate current user from JWT token.
-
-    Requires valid JWT token in Authorization header.
-    Raises 401 Unauthorized if token is invalid, expired, or missing required claims.
-
-    Args:
-        credentials: HTTP Authorization credentials with Bearer token.
-        db: Database session.
+    Validate the Bearer token and return its subject (see token_subject).
 
     Returns:
-        User: User model instance from database.
+        int | str: User id, or lowercased wallet address.
 
     Raises:
-        HTTPException: 401 Unauthorized if token is invalid or expired.
-        HTTPException: 404 Not Found if user not found in database.
-
-    Example:
-        >>> @app.get("/protected")
-        >>> async def protected_route(current_user: User = Depends(get_current_user)):
-        ...     return {"user_address": current_user.address}
+        HTTPException: 401 Unauthorized if token is invalid, expired, or names no user.
     """
     # Extract token from credentials
     token = credentials.credentials
 
-    # Decode and validate token
-    payload = decode_token(token)
+    # Decode and validate token (cached per raw token)
+    payload = await decode_token_cached(token)
 
     if payload is None:
         raise HTTPException(
@@ -60,31 +51,66 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify required claim 'sub' (subject/wallet address)
-    wallet_address = payload.get("sub")
-    if wallet_address is None:
+    # Verify the token names a user ("user_id", "user_{id}" or wallet "sub")
+    subject = token_subject(payload)
+    if subject is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    user_query = select(User).where(User.address == wallet_address)
-    result = await db.execute(user_query)
-    user = result.scalar_one_or_none()
+    return subject
+
+
+# Same implementation as app.core.dependencies.get_current_user, with the
+# error responses these routes already send (404 for an unknown user).
+get_current_user = CurrentUser(
+    not_found_status=status.HTTP_404_NOT_FOUND,
+    credentials_detail="Could not validate credentials",
+)
+
+
+async def get_current_user_with_kyc(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> tuple[User, KYC | None]:
+    """
+    FastAPI dependency returning the current user and their KYC record.
+
+    Loads both rows with a single outer-joined SELECT instead of one query
+    for the user and another for the KYC record.
 
-    if user is None:
+    Args:
+        credentials: HTTP Authorization credentials with Bearer token.
+        db: Database session.
+
+    Returns:
+        tuple[User, KYC | None]: Authenticated user and KYC record (None if never submitted).
+
+    Raises:
+        HTTPException: 401 Unauthorized if token is invalid or expired.
+        HTTPException: 404 Not Found if user not found in database.
+    """
+    subject = await _subject_from_credentials(credentials)
+
+    if isinstance(subject, int):
+        result = await db.execute(_USER_WITH_KYC_BY_ID, {"user_id": subject})
+    else:
+        result = await db.execute(_USER_WITH_KYC_BY_ADDRESS, {"address": subject})
+    row = result.one_or_none()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User not found: {wallet_address}",
+            detail=f"User not found: {subject}",
         )
 
-    return user
+    return row.User, row.KYC
 
 
-def get_current_user_optional(
-    credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False)),
+async def get_current_user_optional(
+    authorization: str | None = Header(default=None),
 ) -> dict[str, Any] | None:
     """
     FastAPI dependency to optionally extract user from JWT token.
@@ -92,8 +118,11 @@ def get_current_user_optional(
     Returns user data if token is valid, None otherwise.
     Does not raise exception for missing or invalid tokens.
 
+    Reads the Authorization header directly, so anonymous requests return
+    before any credentials object is built.
+
     Args:
-        credentials: HTTP Authorization credentials with Bearer token (optional).
+        authorization: Raw Authorization header value (optional).
 
     Returns:
         dict | None: Decoded token payload if valid, None otherwise.
@@ -105,14 +134,19 @@ def get_current_user_optional(
         ...         return {"authenticated": True, "user": user["sub"]}
         ...     return {"authenticated": False}
     """
-    if credentials is None:
+    if not authorization:
         return None
 
-    # Extract token from credentials
-    token = credentials.credentials
+    # Extract token from "Bearer <token>" (scheme is case-insensitive); one
+    # compare on the 7-char prefix, no split or full-string lowercasing
+    if authorization[:7].lower() != "bearer ":
+        return None
+    token = authorization[7:]
+    if not token:
+        return None
 
-    # Decode and validate token
-    payload = decode_token(token)
+    # Decode and validate token (cached per raw token)
+    payload = await decode_token_cached(token)
 
     # Return None if token is invalid (no exception)
     if payload is None:
@@ -5,15 +5,17 @@ Provides FastAPI dependencies for enforcing KYC tier requirements.
 """
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user
-from app.core.database import get_db
+from app.api.dependencies import get_current_user_with_kyc
 from app.models.kyc import KYC, KYCStatus
 from app.models.user import User
 
 
+# KYC lookup for get_user_tier, built once and reused with bound parameters
+_KYC_BY_USER = select(KYC).where(KYC.user_id == bindparam("user_id"))
+
 # Tier requirement messages
 TIER_MESSAGES = {
     0: "此功能需要完成 KYC 认证。请前往用户中心完成基础认证。",
@@ -22,16 +24,12 @@ TIER_MESSAGES = {
 }
 
 
-async def get_user_tier(
-    user: User,
-    db: AsyncSession,
-) -> int:
+def kyc_tier(kyc_record: KYC | None) -> int:
     """
-    Get user's current KYC tier level.
+    Map a KYC record to the tier it currently grants.
 
     Args:
-        user: User model instance
-        db: Database session
+        kyc_record: User's KYC record, or None if never submitted
 
     Returns:
         int: Tier level (0, 1, or 2)
@@ -41,11 +39,6 @@ async def get_user_tier(
         - KYC status not APPROVED → Tier 0
         - KYC status APPROVED → Return tier from record
     """
-    # Query KYC record
-    kyc_query = select(KYC).where(KYC.user_id == user.id)
-    result = await db.execute(kyc_query)
-    kyc_record = result.scalar_one_or_none()
-
     # No KYC record → Tier 0
     if not kyc_record:
         return 0
@@ -58,6 +51,24 @@ async def get_user_tier(
     return kyc_record.tier.value
 
 
+async def get_user_tier(
+    user: User,
+    db: AsyncSession,
+) -> int:
+    """
+    Get user's current KYC tier level.
+
+    Args:
+        user: User model instance
+        db: Database session
+
+    Returns:
+        int: Tier level (0, 1, or 2), see kyc_tier()
+    """
+    # Query KYC record
+    return kyc_tier(await db.scalar(_KYC_BY_USER, {"user_id": user.id}))
+
+
 class RequireTier:
     """
     FastAPI dependency for tier-based authorization.
@@ -78,36 +89,34 @@ class RequireTier:
             min_tier: Minimum tier level required (0, 1, or 2)
         """
         self.min_tier = min_tier
+        # 403 detail is fixed per requirement, so resolve it once
+        self.message = TIER_MESSAGES.get(
+            min_tier,
+            f"此功能需要 Tier {min_tier} 认证。"
+        )
 
     async def __call__(
         self,
-        current_user: User = Depends(get_current_user),
-        db: AsyncSession = Depends(get_db),
+        user_with_kyc: tuple[User, KYC | None] = Depends(get_current_user_with_kyc),
     ) -> None:
         """
         Verify user meets tier requirement.
 
         Args:
-            current_user: Authenticated user
-            db: Database session
+            user_with_kyc: Authenticated user and KYC record (one joined query)
 
         Raises:
             HTTPException: 403 Forbidden if user tier < min_tier
         """
         # Get user's current tier
-        user_tier = await get_user_tier(current_user, db)
+        _, kyc_record = user_with_kyc
+        user_tier = kyc_tier(kyc_record)
 
         # Check tier requirement
         if user_tier < self.min_tier:
-            # Get appropriate error message
-            message = TIER_MESSAGES.get(
-                self.min_tier,
-                f"此功能需要 Tier {self.min_tier} 认证。"
-            )
-
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=message,
+                detail=self.message,
             )
 
 
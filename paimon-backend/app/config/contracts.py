@@ -7,10 +7,11 @@ Loaded from environment or hardcoded for BSC Testnet.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # BSC Testnet contract addresses
-TESTNET_ADDRESSES = {
+_TESTNET_ADDRESSES = {
     "core": {
         "USDP": "0x6F7021C9B4DCD61b26d1aF5ACd1394A79eb49051",
         "PAIMON": "0x9c85485176fcD2db01eD0af66ed63680Eb9e5CB2",
@@ -45,8 +46,21 @@ TESTNET_ADDRESSES = {
     },
 }
 
+# Read-only views built once at import: nested {category: {name: address}}
+# for listing, and a flat {(category, name): address} for single lookups
+TESTNET_ADDRESSES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {category: MappingProxyType(names) for category, names in _TESTNET_ADDRESSES.items()}
+)
+_ADDRESS_BY_KEY: Mapping[tuple[str, str], str] = MappingProxyType(
+    {
+        (category, name): address
+        for category, names in _TESTNET_ADDRESSES.items()
+        for name, address in names.items()
+    }
+)
+
 # Minimal DEX Pair ABI (Uniswap V2 compatible)
-DEX_PAIR_ABI = [
+DEX_PAIR_ABI = (
     # ERC20
     {
         "type": "function",
@@ -120,10 +134,10 @@ DEX_PAIR_ABI = [
             {"name": "to", "type": "address", "indexed": True},
         ],
     },
-]
+)
 
 # ERC20 Token ABI
-ERC20_ABI = [
+ERC20_ABI = (
     {
         "type": "function",
         "name": "symbol",
@@ -145,10 +159,10 @@ ERC20_ABI = [
         "outputs": [{"name": "", "type": "uint256"}],
         "stateMutability": "view",
     },
-]
+)
 
 # GaugeController ABI (minimal)
-GAUGE_CONTROLLER_ABI = [
+GAUGE_CONTROLLER_ABI = (
     {
         "type": "function",
         "name": "gauges",
@@ -166,10 +180,10 @@ GAUGE_CONTROLLER_ABI = [
         "outputs": [{"name": "", "type": "uint256"}],
         "stateMutability": "view",
     },
-]
+)
 
 # DEXFactory ABI
-DEX_FACTORY_ABI = [
+DEX_FACTORY_ABI = (
     {
         "type": "function",
         "name": "allPairsLength",
@@ -194,10 +208,10 @@ DEX_FACTORY_ABI = [
             {"name": "allPairsLength", "type": "uint256", "indexed": False},
         ],
     },
-]
+)
 
 # USDPVault ABI
-VAULT_ABI = [
+VAULT_ABI = (
     # Collateral management
     {
         "type": "function",
@@ -265,10 +279,10 @@ VAULT_ABI = [
             {"name": "amount", "type": "uint256", "indexed": False},
         ],
     },
-]
+)
 
 # VotingEscrowPaimon (veNFT) ABI
-VENFT_ABI = [
+VENFT_ABI = (
     # Lock data
     {
         "type": "function",
@@ -331,10 +345,10 @@ VENFT_ABI = [
             {"name": "ts", "type": "uint256", "indexed": False},
         ],
     },
-]
+)
 
 # Treasury ABI
-TREASURY_ABI = [
+TREASURY_ABI = (
     # Health factor
     {
         "type": "function",
@@ -351,8 +365,40 @@ TREASURY_ABI = [
         "outputs": [{"name": "", "type": "uint256"}],
         "stateMutability": "view",
     },
-]
+)
+
+
+# Multicall3 (same address on every EVM chain it is deployed to, BSC included)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
+MULTICALL3_ABI = (
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+        "stateMutability": "payable",
+    },
+)
 
 def get_contract_address(category: str, name: str) -> str:
     """
@@ -368,14 +414,14 @@ def get_contract_address(category: str, name: str) -> str:
     Raises:
         KeyError: If contract not found
     """
-    return TESTNET_ADDRESSES[category][name]
+    return _ADDRESS_BY_KEY[(category, name)]
 
 
-def get_all_contract_addresses() -> Dict[str, Dict[str, str]]:
+def get_all_contract_addresses() -> Mapping[str, Mapping[str, str]]:
     """
     Get all contract addresses.
 
     Returns:
-        Dict of {category: {name: address}}
+        Read-only mapping of {category: {name: address}}
     """
     return TESTNET_ADDRESSES
@@ -5,7 +5,8 @@ Defines all point earning and redemption rules.
 """
 
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 
 class PointsAction(str, Enum):
@@ -27,23 +28,25 @@ class RedemptionItem(str, Enum):
 
 
 # Points earning rules
-POINTS_RULES: Dict[PointsAction, int] = {
+POINTS_RULES: Mapping[PointsAction, int] = MappingProxyType({
     PointsAction.TASK_COMPLETION: 100,  # Base points for task
     PointsAction.DAILY_LOGIN: 10,
     PointsAction.REFERRAL_SIGNUP: 500,  # When referral completes KYC
     PointsAction.TRADE_VOLUME: 1,  # 1 point per $1 trading volume
     PointsAction.LIQUIDITY_PROVISION: 2,  # 2 points per $1 TVL per day
     PointsAction.KYC_COMPLETION: 1000,
-}
+})
 
 # Redemption costs (in points)
-REDEMPTION_COSTS: Dict[RedemptionItem, int] = {
+REDEMPTION_COSTS: Mapping[RedemptionItem, int] = MappingProxyType({
     RedemptionItem.FEE_DISCOUNT_5: 5000,  # 5% fee discount for 30 days
     RedemptionItem.FEE_DISCOUNT_10: 15000,  # 10% fee discount for 30 days
     RedemptionItem.PRIORITY_SUPPORT: 10000,  # Priority support for 90 days
     RedemptionItem.EXCLUSIVE_NFT: 50000,  # Exclusive NFT badge
-}
+})
 
 # Leaderboard settings
 LEADERBOARD_TOP_N = 100  # Top 100 users
+LEADERBOARD_REDIS_KEY = "leaderboard:global"  # ZSET: user_id -> total_earned
+LEADERBOARD_SEEDED_KEY = "leaderboard:global:seeded"  # Set once the ZSET holds every user
 LEADERBOARD_UPDATE_INTERVAL = 3600  # Update every hour (seconds)
@@ -1,5 +1,12 @@
 """Core configuration and utilities."""
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-__all__ = ["settings"]
+__all__ = ["get_settings", "settings"]
+
+
+def __getattr__(name: str):
+    """Resolve ``settings`` lazily so importing app.core.* does not load config."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
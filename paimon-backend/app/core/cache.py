@@ -4,13 +4,13 @@ Redis cache module.
 Provides async Redis client and helper class for caching operations.
 """
 
-import json
 from datetime import timedelta
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Global Redis client instance
 _redis_client: aioredis.Redis | None = None
@@ -20,13 +20,17 @@ def get_redis_client() -> aioredis.Redis:
     """
     Get or create Redis client instance.
 
+    Created on first use rather than at import, so importing this module
+    does not touch settings or Redis. There is no await between the check
+    and the assignment, so concurrent coroutines cannot create two clients.
+
     Returns:
         Redis client instance.
     """
     global _redis_client
     if _redis_client is None:
         _redis_client = aioredis.from_url(
-            settings.REDIS_URL,
+            get_settings().REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
             max_connections=20,  # Connection pool size
@@ -34,9 +38,6 @@ def get_redis_client() -> aioredis.Redis:
     return _redis_client
 
 
-# Convenience reference to redis_client
-redis_client = get_redis_client()
-
 
 class RedisCache:
     """
@@ -45,9 +46,26 @@ class RedisCache:
     Provides convenient methods for common caching operations.
     """
 
-    def __init__(self):
-        """Initialize Redis cache helper."""
-        self.client = redis_client
+    def __init__(self, client: aioredis.Redis | None = None):
+        """
+        Initialize Redis cache helper.
+
+        Args:
+            client: Redis client to use (optional). Defaults to the shared
+                client from get_redis_client(), resolved on each access.
+        """
+        self._client = client
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """Redis client backing this cache."""
+        if self._client is not None:
+            return self._client
+        return get_redis_client()
+
+    @client.setter
+    def client(self, client: aioredis.Redis) -> None:
+        self._client = client
 
     async def get(self, key: str) -> str | None:
         """
@@ -87,6 +105,49 @@ class RedisCache:
             # Return False on error (graceful degradation)
             return False
 
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        """
+        Get several values from Redis in one round-trip (MGET).
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Cached values in key order, None for missing keys.
+        """
+        if not keys:
+            return []
+        try:
+            return await self.client.mget(keys)
+        except Exception:
+            # Treat every key as a miss on error (graceful degradation)
+            return [None] * len(keys)
+
+    async def set_many(
+        self, mapping: dict[str, str | bytes], ttl: timedelta | None = None
+    ) -> bool:
+        """
+        Set several values in Redis in one round-trip (non-transactional pipeline).
+
+        Args:
+            mapping: Cache keys and values.
+            ttl: Time to live applied to every key (optional).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not mapping:
+            return True
+        try:
+            ex = int(ttl.total_seconds()) if ttl else None
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, value, ex=ex)
+                await pipe.execute()
+            return True
+        except Exception:
+            return False
+
     async def delete(self, key: str) -> int:
         """
         Delete a key from Redis.
@@ -134,6 +195,76 @@ class RedisCache:
         except Exception:
             return False
 
+    async def zincrby(self, key: str, amount: float, member: str) -> float | None:
+        """
+        Increment a member's score in a sorted set.
+
+        Args:
+            key: Sorted set key.
+            amount: Score increment.
+            member: Sorted set member.
+
+        Returns:
+            New score, or None on error.
+        """
+        try:
+            return await self.client.zincrby(key, amount, member)
+        except Exception:
+            return None
+
+    async def zadd(
+        self, key: str, mapping: dict[str, float], gt: bool = False
+    ) -> bool:
+        """
+        Set scores for several sorted set members in one command.
+
+        Args:
+            key: Sorted set key.
+            mapping: Members and their scores.
+            gt: Only raise existing scores (ZADD GT); new members are always added.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not mapping:
+            return True
+        try:
+            await self.client.zadd(key, mapping, gt=gt)
+            return True
+        except Exception:
+            return False
+
+    async def ztop(self, key: str, n: int) -> list[tuple[str, float]] | None:
+        """
+        Get the n highest-scoring members of a sorted set (ZREVRANGE).
+
+        Args:
+            key: Sorted set key.
+            n: Number of members to return.
+
+        Returns:
+            (member, score) pairs, highest first; None on error.
+        """
+        try:
+            return await self.client.zrevrange(key, 0, n - 1, withscores=True)
+        except Exception:
+            return None
+
+    async def zcard(self, key: str) -> int:
+        """
+        Get the number of members in a sorted set.
+
+        Args:
+            key: Sorted set key.
+
+        Returns:
+            Member count (0 if missing or on error).
+        """
+        try:
+            return await self.client.zcard(key)
+        except Exception:
+            return 0
+
     async def get_json(self, key: str) -> dict[str, Any] | None:
         """
         Get a JSON value from Redis.
@@ -147,11 +278,29 @@ class RedisCache:
         try:
             value = await self.client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception:
             return None
 
+    async def get_json_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get several JSON values from Redis in one round-trip.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Parsed JSON objects in key order, None for missing or invalid values.
+        """
+        results: list[dict[str, Any] | None] = []
+        for value in await self.get_many(keys):
+            try:
+                results.append(orjson.loads(value) if value else None)
+            except orjson.JSONDecodeError:
+                results.append(None)
+        return results
+
     async def set_json(
         self, key: str, value: dict[str, Any], ttl: timedelta | None = None
     ) -> bool:
@@ -167,15 +316,38 @@ class RedisCache:
             True if successful, False otherwise.
         """
         try:
-            json_str = json.dumps(value)
+            # Non-str keys are stringified, matching json.dumps
+            json_bytes = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             if ttl:
-                await self.client.set(key, json_str, ex=int(ttl.total_seconds()))
+                await self.client.set(key, json_bytes, ex=int(ttl.total_seconds()))
             else:
-                await self.client.set(key, json_str)
+                await self.client.set(key, json_bytes)
             return True
         except Exception:
             return False
 
+    async def set_json_many(
+        self, mapping: dict[str, dict[str, Any]], ttl: timedelta | None = None
+    ) -> bool:
+        """
+        Set several JSON values in Redis in one round-trip.
+
+        Args:
+            mapping: Cache keys and dictionaries to cache as JSON.
+            ttl: Time to live applied to every key (optional).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            encoded = {
+                key: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+                for key, value in mapping.items()
+            }
+        except TypeError:
+            return False
+        return await self.set_many(encoded, ttl)
+
 
-# Global cache instance
+# Global cache instance (no connection until first command)
 cache = RedisCache()
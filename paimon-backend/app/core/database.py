@@ -4,31 +4,95 @@ Database connection and session management.
 Provides async SQLAlchemy engine and session factory.
 """
 
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.pool import NullPool
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    poolclass=NullPool if "sqlite" in settings.DATABASE_URL else None,
-    future=True,
-)
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """
+    Return the process-wide async engine, creating it on first call.
+
+    SQLite gets no pool; server databases get an explicit QueuePool size
+    and, on asyncpg, server-side prepared statement caching.
+
+    Returns:
+        AsyncEngine: Cached database engine.
+    """
+    settings = get_settings()
+    if "sqlite" in settings.DATABASE_URL:
+        pool_kwargs: dict = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_pre_ping": True,
+        }
+        if "asyncpg" in settings.DATABASE_URL:
+            pool_kwargs["connect_args"] = {
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            }
+
+    return create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,  # Log SQL queries in debug mode
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        future=True,
+        **pool_kwargs,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the process-wide async session factory bound to get_engine().
+
+    Returns:
+        async_sessionmaker: Cached session factory.
+    """
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+if TYPE_CHECKING:
+    engine: AsyncEngine
+    AsyncSessionLocal: async_sessionmaker[AsyncSession]
+
+
+def __getattr__(name: str):
+    """Resolve the legacy ``engine`` / ``AsyncSessionLocal`` globals lazily (PEP 562)."""
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def dialect_insert(session: AsyncSession) -> Callable[..., Insert]:
+    """Return the INSERT construct (with ON CONFLICT support) for the session's database."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
 
 
 async def get_db() -> AsyncSession:
@@ -44,7 +108,7 @@ async def get_db() -> AsyncSession:
             result = await db.execute(select(User))
             return result.scalars().all()
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
             await session.commit()
@@ -53,3 +117,21 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    Database session context manager for code outside request handling.
+
+    Used by the indexer and background jobs; the caller commits.
+
+    Yields:
+        AsyncSession: Database session.
+
+    Example:
+        async with get_db_session() as session:
+            await session.execute(select(User))
+    """
+    async with get_sessionmaker()() as session:
+        yield session
@@ -2,93 +2,206 @@
 FastAPI dependencies for authentication and authorization.
 
 Dependencies:
-- get_current_user: Verify JWT token and return authenticated user
+- CurrentUser: Verify JWT token and return authenticated user
+- get_current_user: CurrentUser() (401 if the user does not exist)
+
+Helpers:
+- token_subject: User id or wallet address a decoded token refers to
+- load_user: Resolve a token_subject result to a User
+- load_user_by_address: Resolve a wallet address to a User via the id cache
 """
 
+from typing import Any
+
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decode_token
+from app.core.security import (
+    bearer_scheme,
+    cache_user_id,
+    decode_token_cached,
+    get_cached_user_id,
+)
 from app.models.user import User
 
-# HTTP Bearer token scheme for JWT authentication
-security = HTTPBearer()
+# Auth hot-path statements, built once and reused with bound parameters
+# (lower(address) matches ix_users_address_lower, whatever case was stored)
+_USER_BY_ADDRESS = select(User).where(func.lower(User.address) == bindparam("address"))
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def load_user_by_address(db: AsyncSession, address: str) -> User | None:
     """
-    Verify JWT token and return authenticated user.
+    Load a user by wallet address, by primary key when the address is cached.
 
     Args:
-        credentials: HTTP Authorization header with Bearer token.
         db: Database session.
+        address: Wallet address (token subject), matched case-insensitively.
 
     Returns:
-        User: Authenticated user from database.
+        User | None: Matching user, None if no user owns the address.
+    """
+    # Lowercase once so cache keys and the functional index agree
+    address = address.lower()
+
+    user_id = get_cached_user_id(address)
+    if user_id is not None:
+        user = await db.get(User, user_id)
+        # Stale mapping (address re-linked or user removed): fall through
+        if user is not None and user.address.lower() == address:
+            return user
+
+    user = await db.scalar(_USER_BY_ADDRESS, {"address": address})
+
+    if user is not None:
+        cache_user_id(address, user.id)
+
+    return user
 
-    Raises:
-        HTTPException: 401 if token is invalid or user not found.
 
-    Example:
-        >>> # In router:
-        >>> @router.get("/protected")
-        >>> async def protected_route(current_user: User = Depends(get_current_user)):
-        >>>     return {"user_id": current_user.id}
+def token_subject(payload: dict[str, Any]) -> int | str | None:
     """
-    # Extract token from Authorization header
-    token = credentials.credentials
+    Identify the user a decoded token refers to.
 
-    # Decode JWT token
-    payload = decode_token(token)
+    A "user_id" claim takes precedence; otherwise the "sub" claim is either
+    "user_{id}" or a wallet address.
 
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Args:
+        payload: Decoded JWT payload.
 
-    # Extract user identifier from token payload
-    # Token payload contains either "sub" (subject) as address or user_id
-    user_sub = payload.get("sub")
+    Returns:
+        int | str | None: User id, lowercased wallet address, or None if the
+        payload names no user.
+    """
     user_id = payload.get("user_id")
+    if user_id:
+        try:
+            return int(user_id)
+        except (TypeError, ValueError):
+            return None
 
-    if not user_sub and not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    user_sub = payload.get("sub")
+    if not user_sub:
+        return None
 
-    # Query user from database
-    # Try by user_id first (more efficient), then by address
-    if user_id:
-        query = select(User).where(User.id == user_id)
-    else:
-        # user_sub might be address or "user_{id}" format
-        if user_sub.startswith("user_"):
-            try:
-                extracted_id = int(user_sub.split("_")[1])
-                query = select(User).where(User.id == extracted_id)
-            except (IndexError, ValueError):
-                query = select(User).where(User.address == user_sub)
-        else:
-            query = select(User).where(User.address == user_sub)
-
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if user_sub.startswith("user_"):
+        try:
+            return int(user_sub.split("_")[1])
+        except (IndexError, ValueError):
+            pass
+    return user_sub.lower()
 
-    return user
+
+async def load_user(db: AsyncSession, subject: int | str) -> User | None:
+    """
+    Load the user identified by a token_subject() result.
+
+    Args:
+        db: Database session.
+        subject: User id or wallet address.
+
+    Returns:
+        User | None: Matching user, None if it does not exist.
+    """
+    if isinstance(subject, int):
+        return await db.get(User, subject)
+    return await load_user_by_address(db, subject)
+
+
+class CurrentUser:
+    """
+    FastAPI dependency that verifies the JWT token and returns the user.
+
+    The user is identified by token_subject(). Both auth dependency modules
+    share this implementation and differ only in their error responses.
+
+    Usage:
+        get_current_user = CurrentUser()
+        get_current_user_or_404 = CurrentUser(not_found_status=status.HTTP_404_NOT_FOUND)
+    """
+
+    def __init__(
+        self,
+        not_found_status: int = status.HTTP_401_UNAUTHORIZED,
+        credentials_detail: str | None = None,
+    ):
+        """
+        Initialize the dependency.
+
+        Args:
+            not_found_status: HTTP status raised when no user matches a valid token.
+            credentials_detail: 401 detail for every invalid token (default:
+                distinct details for undecodable tokens and bad payloads).
+        """
+        self.not_found_status = not_found_status
+        self.credentials_detail = credentials_detail
+
+    async def __call__(
+        self,
+        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        db: AsyncSession = Depends(get_db),
+    ) -> User:
+        """
+        Verify JWT token and return authenticated user.
+
+        Args:
+            credentials: HTTP Authorization header with Bearer token.
+            db: Database session.
+
+        Returns:
+            User: Authenticated user from database.
+
+        Raises:
+            HTTPException: 401 if token is invalid.
+            HTTPException: not_found_status if the user does not exist.
+        """
+        # Extract token from Authorization header
+        token = credentials.credentials
+
+        # Decode JWT token (cached per raw token)
+        payload = await decode_token_cached(token)
+
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=self.credentials_detail or "Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Extract user identifier (user id or wallet address) from token payload
+        subject = token_subject(payload)
+
+        if subject is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=self.credentials_detail or "Invalid token payload",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Query user from database (by primary key for id subjects)
+        user = await load_user(db, subject)
+
+        if user is None:
+            if self.not_found_status == status.HTTP_401_UNAUTHORIZED:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            raise HTTPException(
+                status_code=self.not_found_status,
+                detail=f"User not found: {subject}",
+            )
+
+        return user
+
+
+# Verify JWT token and return authenticated user (401 if the user does not exist).
+#
+# Example:
+#     >>> @router.get("/protected")
+#     >>> async def protected_route(current_user: User = Depends(get_current_user)):
+#     >>>     return {"user_id": current_user.id}
+get_current_user = CurrentUser()
@@ -6,11 +6,12 @@ Provides unified error response format and centralized exception handling.
 
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request, status
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from app.core.config import get_settings
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -80,6 +81,37 @@ class ValidationException(APIException):
         )
 
 
+def _error_body(code: int, message: Any, **extra: Any) -> bytes:
+    """Serialize the unified error format."""
+    return orjson.dumps(
+        {"success": False, "error": {"code": code, "message": message, **extra}}
+    )
+
+
+# Pre-serialized bodies for frequent static errors, keyed by (status, message)
+_API_ERROR_BODIES: dict[tuple[int, str], bytes] = {
+    key: _error_body(*key, details=None)
+    for key in (
+        (status.HTTP_401_UNAUTHORIZED, "Authentication required"),
+        (status.HTTP_403_FORBIDDEN, "Insufficient permissions"),
+    )
+}
+_HTTP_ERROR_BODIES: dict[tuple[int, str], bytes] = {
+    key: _error_body(*key)
+    for key in (
+        (status.HTTP_401_UNAUTHORIZED, "Invalid or expired token"),
+        (status.HTTP_401_UNAUTHORIZED, "Could not validate credentials"),
+        (status.HTTP_401_UNAUTHORIZED, "Invalid token payload"),
+        (status.HTTP_401_UNAUTHORIZED, "User not found"),
+        (status.HTTP_403_FORBIDDEN, "Not authenticated"),
+    )
+}
+
+_INTERNAL_ERROR_BODY = _error_body(
+    status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error"
+)
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """
     Register global exception handlers for the FastAPI app.
@@ -92,39 +124,40 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def api_exception_handler(request: Request, exc: APIException):
         """Handle custom API exceptions."""
         logger.error(
-            f"API Exception: {exc.message} (status={exc.status_code})",
+            "API Exception: %s (status=%s)",
+            exc.message,
+            exc.status_code,
             extra={"path": request.url.path, "method": request.method},
         )
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "success": False,
-                "error": {
-                    "code": exc.status_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                },
-            },
+        body = None
+        if exc.details is None:
+            body = _API_ERROR_BODIES.get((exc.status_code, exc.message))
+        if body is None:
+            body = _error_body(exc.status_code, exc.message, details=exc.details)
+
+        return Response(
+            content=body, status_code=exc.status_code, media_type="application/json"
         )
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle FastAPI HTTPException."""
         logger.error(
-            f"HTTP Exception: {exc.detail} (status={exc.status_code})",
+            "HTTP Exception: %s (status=%s)",
+            exc.detail,
+            exc.status_code,
             extra={"path": request.url.path, "method": request.method},
         )
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "success": False,
-                "error": {
-                    "code": exc.status_code,
-                    "message": exc.detail,
-                },
-            },
+        body = None
+        if isinstance(exc.detail, str):
+            body = _HTTP_ERROR_BODIES.get((exc.status_code, exc.detail))
+        if body is None:
+            body = _error_body(exc.status_code, exc.detail)
+
+        return Response(
+            content=body, status_code=exc.status_code, media_type="application/json"
         )
 
     @app.exception_handler(RequestValidationError)
@@ -134,7 +167,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
         """Handle Pydantic validation errors."""
         errors = exc.errors()
         logger.warning(
-            f"Validation Error: {len(errors)} validation error(s)",
+            "Validation Error: %d validation error(s)",
+            len(errors),
             extra={"path": request.url.path, "errors": errors},
         )
 
@@ -149,41 +183,36 @@ def setup_exception_handlers(app: FastAPI) -> None:
                 }
             )
 
-        return JSONResponse(
+        return Response(
+            content=_error_body(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "Validation error",
+                details={"errors": formatted_errors},
+            ),
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "success": False,
-                "error": {
-                    "code": status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    "message": "Validation error",
-                    "details": {"errors": formatted_errors},
-                },
-            },
+            media_type="application/json",
         )
 
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception):
         """Handle unexpected exceptions."""
         logger.exception(
-            f"Unexpected Exception: {str(exc)}",
+            "Unexpected Exception: %s",
+            exc,
             extra={"path": request.url.path, "method": request.method},
         )
 
         # In production, don't expose internal error details
-        from app.core.config import settings
-
-        if settings.ENVIRONMENT == "production":
-            message = "Internal server error"
+        if get_settings().ENVIRONMENT == "production":
+            body = _INTERNAL_ERROR_BODY
         else:
-            message = f"Internal server error: {str(exc)}"
+            body = _error_body(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                f"Internal server error: {str(exc)}",
+            )
 
-        return JSONResponse(
+        return Response(
+            content=body,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "success": False,
-                "error": {
-                    "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    "message": message,
-                },
-            },
+            media_type="application/json",
         )
@@ -3,18 +3,22 @@ Logging configuration module.
 
 Provides centralized logging setup with console and file handlers,
 log rotation, and environment-specific log levels.
+
+Records are handed to the root logger's QueueHandler and written by a
+QueueListener thread, so log calls on the event loop never block on I/O.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-# Global logger configuration
-_loggers: dict[str, logging.Logger] = {}
-_setup_complete = False
+# Background writer for the console and file handlers (see setup_logging)
+_listener: logging.handlers.QueueListener | None = None
 
 
 def setup_logging(
@@ -32,10 +36,11 @@ def setup_logging(
         max_bytes: Maximum size of log file before rotation
         backup_count: Number of backup log files to keep
     """
-    global _setup_complete
+    global _listener
 
     # Determine log level based on environment if not specified
     if log_level is None:
+        settings = get_settings()
         if settings.ENVIRONMENT == "development":
             log_level = "DEBUG"
         elif settings.ENVIRONMENT == "production":
@@ -63,14 +68,17 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates (flushes pending records)
     root_logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
 
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(getattr(logging, log_level.upper()))
-    root_logger.addHandler(console_handler)
 
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -81,17 +89,52 @@ def setup_logging(
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(getattr(logging, log_level.upper()))
-    root_logger.addHandler(file_handler)
 
-    _setup_complete = True
+    # Root logger only enqueues; the listener thread formats and writes
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     # Log setup completion
     root_logger.info(
-        f"Logging configured: level={log_level}, file={log_file}, "
-        f"max_bytes={max_bytes}, backup_count={backup_count}"
+        "Logging configured: level=%s, file=%s, max_bytes=%d, backup_count=%d",
+        log_level,
+        log_file,
+        max_bytes,
+        backup_count,
     )
 
 
+def get_log_handlers() -> tuple[logging.Handler, ...]:
+    """
+    Get the console and file handlers fed by the logging queue.
+
+    Returns:
+        Handlers attached to the queue listener (empty before setup)
+    """
+    if _listener is None:
+        return ()
+    return _listener.handlers
+
+
+def flush_logs() -> None:
+    """Block until all queued log records have been written."""
+    if _listener is None:
+        return
+    # stop() drains the queue before joining the writer thread
+    _listener.stop()
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Write out queued records at interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given name.
@@ -102,26 +145,11 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    global _loggers, _setup_complete
-
-    # Setup logging if not already done
-    if not _setup_complete:
-        setup_logging()
-
-    # Return cached logger if exists
-    if name in _loggers:
-        return _loggers[name]
-
-    # Get root logger (which has all handlers configured)
-    root_logger = logging.getLogger()
-
-    # For tests, return root logger to access handlers
-    # In production, named loggers inherit from root
-    logger = logging.getLogger(name) if name != "root" else root_logger
-    _loggers[name] = logger
-
-    return logger
+    # logging.getLogger is already memoized (and maps "root" to the root
+    # logger); setup_logging has run at import time
+    return logging.getLogger(name)
 
 
 # Setup logging on module import
 setup_logging()
+atexit.register(_stop_listener)
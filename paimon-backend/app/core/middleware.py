@@ -2,126 +2,232 @@
 FastAPI middleware for unified response format and request logging.
 
 Provides automatic response wrapping, request logging, and timing tracking.
+Wrapping normally happens in WrappedORJSONResponse while the route result is
+first serialized, so response bodies are not buffered and re-encoded. JSON
+responses it did not render (explicit JSONResponse returns, routes
+registered before setup_middleware) are wrapped by the middleware instead.
 """
 
+import re
+import secrets
 import time
-import uuid
-from collections.abc import Callable
+from contextvars import ContextVar
 from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class ResponseFormatterMiddleware(BaseHTTPMiddleware):
+class _WrapState:
+    """Wrapping state of the request being served."""
+
+    __slots__ = ("request_id", "rendered")
+
+    def __init__(self, request_id: str) -> None:
+        self.request_id = request_id
+        # Set once WrappedORJSONResponse has rendered the response body
+        self.rendered = False
+
+
+# State of the request being served, None when its response is not wrapped
+# (no middleware installed, or an excluded path)
+_wrap_state: ContextVar[_WrapState | None] = ContextVar("wrap_state", default=None)
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp built
+_timestamp_second: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time in ISO 8601 with microseconds and a +00:00 offset.
+
+    Only formats the date/time part once per second; within a second the
+    string is the cached prefix plus the microseconds.
     """
-    Middleware to wrap API responses in a unified format.
+    global _timestamp_second
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_second = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
+def _envelope(content: Any, request_id: str) -> dict[str, Any]:
+    """Unified success envelope around a response payload."""
+    return {
+        "success": True,
+        "data": content,
+        "timestamp": _utc_timestamp(),
+        "request_id": request_id,
+    }
+
+
+def _wrap_body(body: bytes, request_id: str) -> bytes:
+    """Envelope a serialized JSON body (unchanged if invalid or already wrapped)."""
+    try:
+        content = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body
+    if isinstance(content, dict) and "success" in content:
+        return body
+    return orjson.dumps(_envelope(content, request_id))
+
+
+class WrappedORJSONResponse(ORJSONResponse):
+    """
+    JSON response that wraps route results in the unified format.
 
     Wraps successful responses in:
     {
         "success": true,
         "data": <original_response>,
         "timestamp": <iso_timestamp>,
-        "request_id": <uuid>
+        "request_id": <16-char hex id>
     }
+
+    Error responses and payloads that already carry 'success' are
+    serialized unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content, adding the envelope in the same orjson call."""
+        state = _wrap_state.get()
+        if state is not None:
+            state.rendered = True
+            if self.status_code < 400 and not (
+                isinstance(content, dict) and "success" in content
+            ):
+                content = _envelope(content, state.request_id)
+        return super().render(content)
+
+
+class ResponseFormatterMiddleware:
     """
+    ASGI middleware assigning request IDs and logging request timing.
 
-    # Paths to exclude from response wrapping
-    EXCLUDED_PATHS = [
+    Marks the request for wrapping by WrappedORJSONResponse unless its path
+    is excluded. Implemented as plain ASGI (not BaseHTTPMiddleware), so the
+    app runs in the caller's task and response messages pass straight
+    through. Successful JSON responses that WrappedORJSONResponse did not
+    render are buffered and wrapped here.
+    """
+
+    # Paths to exclude from response wrapping (and their sub-paths)
+    EXCLUDED_PATHS = frozenset({
         "/health",
         "/docs",
         "/redoc",
         "/openapi.json",
-    ]
+    })
+    _EXCLUDED_PREFIX_RE = re.compile(
+        "^(?:" + "|".join(re.escape(path) for path in EXCLUDED_PATHS) + ")/"
+    )
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def _is_plain_json(headers: list[tuple[bytes, bytes]]) -> bool:
+        """Whether response headers describe an uncompressed JSON body."""
+        content_type = b""
+        for name, value in headers:
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value
+        return b"application/json" in content_type
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and log its timing."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate request ID (16 hex chars from one os.urandom call)
+        request_id = secrets.token_hex(8)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and wrap response."""
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        # Skip wrapping for excluded paths
+        path = scope["path"]
+        excluded = (
+            path in self.EXCLUDED_PATHS
+            or self._EXCLUDED_PREFIX_RE.match(path) is not None
+        )
+        state = None if excluded else _WrapState(request_id)
+        token = _wrap_state.set(state)
+
+        status_code = 500
+        # Held response start and body chunks of a response wrapped here
+        held_start: Message | None = None
+        held_body: list[bytes] = []
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code, held_start
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if (
+                    state is not None
+                    and not state.rendered
+                    and status_code < 400
+                    and self._is_plain_json(message["headers"])
+                ):
+                    held_start = message
+                    return
+            elif held_start is not None and message["type"] == "http.response.body":
+                held_body.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                body = _wrap_body(b"".join(held_body), request_id)
+                headers = [
+                    (name, value)
+                    for name, value in held_start["headers"]
+                    if name != b"content-length"
+                ]
+                headers.append((b"content-length", str(len(body)).encode()))
+                await send({**held_start, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(message)
 
         # Track request start time
         start_time = time.time()
 
         # Call next middleware/handler
-        response = await call_next(request)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _wrap_state.reset(token)
 
         # Calculate response time
         response_time = time.time() - start_time
 
         # Log request
+        method = scope["method"]
         logger.info(
-            f"{request.method} {request.url.path} - {response.status_code} "
-            f"({response_time:.3f}s)",
+            "%s %s - %s (%.3fs)",
+            method,
+            path,
+            status_code,
+            response_time,
             extra={
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
                 "response_time": response_time,
                 "request_id": request_id,
             },
         )
 
-        # Skip wrapping for excluded paths
-        if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
-            return response
-
-        # Skip wrapping for non-200 status codes (errors are already wrapped)
-        if response.status_code >= 400:
-            return response
-
-        # Skip wrapping if response is not JSON
-        if "application/json" not in response.headers.get("content-type", ""):
-            return response
-
-        # Read original response body
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
-        # Try to parse as JSON
-        try:
-            import json
-
-            original_data = json.loads(response_body.decode())
-
-            # Check if already wrapped (has 'success' field)
-            if isinstance(original_data, dict) and "success" in original_data:
-                # Already wrapped, return as-is
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
-
-            # Wrap response
-            wrapped_response = {
-                "success": True,
-                "data": original_data,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "request_id": request_id,
-            }
-
-            return JSONResponse(
-                content=wrapped_response,
-                status_code=response.status_code,
-            )
-
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            # Not JSON or decode error, return original
-            return Response(
-                content=response_body,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.media_type,
-            )
-
 
 def setup_middleware(app: FastAPI) -> None:
     """
@@ -130,6 +236,10 @@ def setup_middleware(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
+    # Wrap route responses while serializing them (routes registered after this
+    # call); other JSON responses are wrapped by the middleware
+    app.router.default_response_class = WrappedORJSONResponse
+
     # Add response formatter middleware
     app.add_middleware(ResponseFormatterMiddleware)
 
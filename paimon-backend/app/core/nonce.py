@@ -5,9 +5,12 @@ Provides functions for:
 - Generating unique nonces for wallet addresses
 - Validating nonces before use
 - Consuming nonces (single use)
+- Validating and consuming in one atomic call (login hot path)
 - Managing nonce expiration (default 5 minutes)
 
 Storage: Redis for high-performance, automatic expiration
+
+Callers normalize the address (lowercase) once per request and pass it in.
 """
 
 import uuid
@@ -15,42 +18,63 @@ from typing import Optional
 
 import redis.asyncio as aioredis
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Default nonce TTL: 5 minutes (300 seconds)
 DEFAULT_NONCE_TTL = 300
 
+# Connections shared by all nonce operations
+NONCE_POOL_MAX_CONNECTIONS = 64
+
+# Shared connection pool, created on first use
+_pool: aioredis.ConnectionPool | None = None
+
 
 def _get_redis() -> aioredis.Redis:
     """
     Get Redis client for nonce operations.
 
-    Creates a new connection each time to avoid event loop conflicts in tests.
+    Clients are cheap wrappers around one module-level connection pool, so
+    each auth operation reuses an open socket instead of reconnecting.
+    Replies are left as bytes: nonce operations only read integer replies.
 
     Returns:
         Redis client instance.
     """
-    return aioredis.from_url(
-        settings.REDIS_URL,
-        encoding="utf-8",
-        decode_responses=True,
-    )
+    global _pool
+    if _pool is None:
+        _pool = aioredis.ConnectionPool.from_url(
+            get_settings().REDIS_URL,
+            max_connections=NONCE_POOL_MAX_CONNECTIONS,
+        )
+    return aioredis.Redis(connection_pool=_pool)
+
+
+async def reset_pool() -> None:
+    """
+    Close and drop the shared connection pool.
+
+    Pooled connections are bound to the event loop that opened them; tests
+    that run each case on a new loop call this between cases.
+    """
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.aclose()
 
 
-def _nonce_key(address: str, nonce: str) -> str:
+def _nonce_key(address: str, nonce: str) -> bytes:
     """
     Generate Redis key for nonce storage.
 
     Args:
-        address: Ethereum wallet address.
+        address: Lowercased Ethereum wallet address.
         nonce: Unique nonce string.
 
     Returns:
-        str: Redis key in format "nonce:{address}:{nonce}".
+        bytes: Redis key in format "nonce:{address}:{nonce}".
     """
-    # Normalize address to lowercase for consistency
-    address_lower = address.lower()
-    return f"nonce:{address_lower}:{nonce}"
+    return f"nonce:{address}:{nonce}".encode()
 
 
 async def generate_nonce(address: str, ttl_seconds: int = DEFAULT_NONCE_TTL) -> str:
@@ -58,7 +82,7 @@ async def generate_nonce(address: str, ttl_seconds: int = DEFAULT_NONCE_TTL) ->
     Generate a unique nonce for a wallet address.
 
     Args:
-        address: Ethereum wallet address.
+        address: Lowercased Ethereum wallet address.
         ttl_seconds: Time-to-live in seconds (default 300 = 5 minutes).
 
     Returns:
@@ -85,7 +109,7 @@ async def validate_nonce(address: str, nonce: str) -> bool:
     Validate that a nonce exists and is valid.
 
     Args:
-        address: Ethereum wallet address.
+        address: Lowercased Ethereum wallet address.
         nonce: Nonce to validate.
 
     Returns:
@@ -109,7 +133,7 @@ async def consume_nonce(address: str, nonce: str) -> bool:
     Consume a nonce (delete it, preventing reuse).
 
     Args:
-        address: Ethereum wallet address.
+        address: Lowercased Ethereum wallet address.
         nonce: Nonce to consume.
 
     Returns:
@@ -131,12 +155,37 @@ async def consume_nonce(address: str, nonce: str) -> bool:
     return deleted > 0
 
 
+async def validate_and_consume_nonce(address: str, nonce: str) -> bool:
+    """
+    Validate and consume a nonce in a single atomic Redis call.
+
+    A DEL reports whether the key existed, so one round-trip both checks
+    the nonce and prevents reuse; two concurrent logins with the same nonce
+    cannot both succeed.
+
+    Args:
+        address: Lowercased Ethereum wallet address.
+        nonce: Nonce to validate and consume.
+
+    Returns:
+        bool: True if the nonce existed and is now consumed, False otherwise.
+
+    Example:
+        >>> nonce = await generate_nonce("0x123...")
+        >>> await validate_and_consume_nonce("0x123...", nonce)
+        True
+        >>> await validate_and_consume_nonce("0x123...", nonce)
+        False
+    """
+    return await consume_nonce(address, nonce)
+
+
 async def get_nonce_ttl(address: str, nonce: str) -> Optional[int]:
     """
     Get remaining time-to-live for a nonce.
 
     Args:
-        address: Ethereum wallet address.
+        address: Lowercased Ethereum wallet address.
         nonce: Nonce to check.
 
     Returns:
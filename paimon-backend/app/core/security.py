@@ -4,12 +4,42 @@ Security utilities for JWT authentication.
 Provides functions for creating and validating JWT tokens.
 """
 
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, UTC
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TLRUCache, TTLCache
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPBearer
+from jwt import InvalidTokenError
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+# HTTP Bearer scheme shared by every authenticated dependency (one OpenAPI scheme)
+bearer_scheme = HTTPBearer()
+
+# Verified token payloads keyed by SHA-256 of the raw token. An entry lives
+# TOKEN_CACHE_TTL seconds at most and never outlives the token's exp claim.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL = 60
+
+
+def _token_ttu(_key: bytes, payload: dict[str, Any], now: float) -> float:
+    """Expiry time (cache timer clock) for a cached token payload."""
+    return now + min(TOKEN_CACHE_TTL, payload.get("exp", 0) - time.time())
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttu=_token_ttu)
+_token_cache_lock = threading.Lock()
+
+# Wallet address -> users.id, so repeat requests resolve the user by primary key
+USER_ID_CACHE_MAX_SIZE = 5000
+USER_ID_CACHE_TTL = 30
+_user_cache: TTLCache = TTLCache(maxsize=USER_ID_CACHE_MAX_SIZE, ttl=USER_ID_CACHE_TTL)
+_user_cache_lock = threading.Lock()
 
 
 def create_access_token(
@@ -30,6 +60,7 @@ def create_access_token(
         >>> token = create_access_token({"sub": "0x123..."})
         >>> # token is valid for 15 minutes
     """
+    settings = get_settings()
     to_encode = data.copy()
 
     # Set expiration time
@@ -65,6 +96,7 @@ def create_refresh_token(data: dict[str, Any]) -> str:
         >>> refresh_token = create_refresh_token({"sub": "0x123..."})
         >>> # token is valid for 7 days
     """
+    settings = get_settings()
     to_encode = data.copy()
 
     # Set long expiration for refresh token
@@ -96,15 +128,65 @@ def decode_token(token: str) -> dict[str, Any] | None:
         '0x123...'
     """
     try:
+        settings = get_settings()
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
-    except JWTError:
+    except InvalidTokenError:
         # Token is invalid, expired, or tampered
         return None
 
 
+async def decode_token_cached(token: str) -> dict[str, Any] | None:
+    """
+    Decode and validate a JWT token, reusing the payload of repeated tokens.
+
+    Cache misses verify the signature in the threadpool so concurrent
+    requests do not serialize on the event loop. Failed verifications are
+    never cached.
+
+    Args:
+        token: JWT token to decode.
+
+    Returns:
+        dict | None: Decoded payload if valid, None if invalid or expired.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = await run_in_threadpool(decode_token, token)
+    if payload is not None:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+
+    return payload
+
+
+def get_cached_user_id(address: str) -> int | None:
+    """Return the cached user id for a lowercased wallet address, if any."""
+    with _user_cache_lock:
+        return _user_cache.get(address)
+
+
+def cache_user_id(address: str, user_id: int) -> None:
+    """Remember which user owns a wallet address (keyed lowercased)."""
+    with _user_cache_lock:
+        _user_cache[address] = user_id
+
+
+def invalidate_cached_user(address: str | None) -> None:
+    """Forget a wallet address mapping (call when a user's address changes)."""
+    if address is None:
+        return
+    with _user_cache_lock:
+        _user_cache.pop(address.lower(), None)
+
+
 def refresh_access_token(refresh_token: str) -> str | None:
     """
     Create a new access token from a valid refresh token.
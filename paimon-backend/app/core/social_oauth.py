@@ -9,21 +9,31 @@ Provides functions for:
 Supported providers: email, google, x (Twitter)
 """
 
-import random
+import asyncio
+import secrets
 import string
+from datetime import datetime
 from typing import Any
 
 import httpx
-from sqlalchemy import select
+import jwt
+from jwt import PyJWKClient, PyJWTError
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.core.database import AsyncSessionLocal
+from app.core.config import get_settings
+from app.core.database import dialect_insert, get_sessionmaker
+from app.core.security import invalidate_cached_user
 from app.models.user import User
 
 # Constants
 OAUTH_REQUEST_TIMEOUT = 5.0  # seconds
+OAUTH_MAX_KEEPALIVE_CONNECTIONS = 32
+OAUTH_MAX_CONNECTIONS = 128
 REFERRAL_CODE_LENGTH = 8  # characters
+REFERRAL_CODE_ALPHABET = string.ascii_uppercase + string.digits
+REFERRAL_CODE_MAX_ATTEMPTS = 5  # inserts tried before giving up on collisions
 
 # OAuth provider endpoints (Reown/WalletConnect OAuth)
 OAUTH_VERIFY_ENDPOINTS = {
@@ -32,6 +42,45 @@ OAUTH_VERIFY_ENDPOINTS = {
     "x": "https://api.twitter.com/2/users/me",  # X (Twitter) API
 }
 
+# Google ID tokens (JWTs) are verified locally against Google's signing keys
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_JWKS_CACHE_SECONDS = 3600
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# Fetches the key set on first use, then serves it from memory until it expires
+_google_jwks = PyJWKClient(GOOGLE_JWKS_URL, lifespan=GOOGLE_JWKS_CACHE_SECONDS)
+
+# Shared client for provider calls, created on first use. Keep-alive
+# connections let repeat verifies skip the TCP + TLS handshake.
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client for OAuth provider requests.
+
+    Returns:
+        httpx.AsyncClient: Pooled client with the OAuth request timeout.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=OAUTH_REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=OAUTH_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=OAUTH_MAX_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared OAuth HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
 
 def _generate_referral_code(length: int = REFERRAL_CODE_LENGTH) -> str:
     """
@@ -48,7 +97,36 @@ def _generate_referral_code(length: int = REFERRAL_CODE_LENGTH) -> str:
         >>> len(code)
         8
     """
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
+    return "".join(secrets.choice(REFERRAL_CODE_ALPHABET) for _ in range(length))
+
+
+async def _verify_google_id_token(token: str) -> dict[str, Any] | None:
+    """
+    Verify a Google ID token locally with the cached Google JWKS.
+
+    Args:
+        token: Google ID token (RS256-signed JWT).
+
+    Returns:
+        dict | None: Token claims, or None if the token is invalid.
+    """
+    try:
+        # Key lookup may fetch the JWKS (blocking urllib call) on a cold cache
+        signing_key = await asyncio.to_thread(_google_jwks.get_signing_key_from_jwt, token)
+        claims = jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=["RS256"],
+            audience=get_settings().GOOGLE_CLIENT_ID,
+            issuer=GOOGLE_ISSUERS,
+        )
+    except PyJWTError:
+        # Bad signature/claims, unknown key id, or JWKS fetch failure
+        return None
+
+    if "email" not in claims or "sub" not in claims:
+        return None
+    return claims
 
 
 async def verify_oauth_token(token: str, provider: str) -> dict[str, Any] | None:
@@ -56,7 +134,7 @@ async def verify_oauth_token(token: str, provider: str) -> dict[str, Any] | None
     Verify OAuth token with provider API.
 
     Args:
-        token: OAuth access token from Reown AppKit.
+        token: OAuth access token (or Google ID token) from Reown AppKit.
         provider: OAuth provider (email, google, x).
 
     Returns:
@@ -71,47 +149,53 @@ async def verify_oauth_token(token: str, provider: str) -> dict[str, Any] | None
     if provider not in OAUTH_VERIFY_ENDPOINTS:
         return None
 
+    # Google ID tokens need no network round-trip once the JWKS is cached;
+    # opaque access tokens still go through the tokeninfo endpoint
+    if provider == "google" and get_settings().GOOGLE_CLIENT_ID and token.count(".") == 2:
+        return await _verify_google_id_token(token)
+
     endpoint = OAUTH_VERIFY_ENDPOINTS[provider]
 
     try:
-        async with httpx.AsyncClient(timeout=OAUTH_REQUEST_TIMEOUT) as client:
-            if provider == "google":
-                # Google tokeninfo endpoint
-                response = await client.get(endpoint, params={"access_token": token})
-            elif provider == "email":
-                # Reown Email OAuth (POST)
-                response = await client.post(
-                    endpoint, json={"token": token}, headers={"Content-Type": "application/json"}
-                )
-            elif provider == "x":
-                # X (Twitter) API requires Bearer token
-                response = await client.get(
-                    endpoint,
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={"user.fields": "id,username,name"},
-                )
-
-            # Check response status
-            if response.status_code != 200:
+        client = _get_http_client()
+
+        if provider == "google":
+            # Google tokeninfo endpoint
+            response = await client.get(endpoint, params={"access_token": token})
+        elif provider == "email":
+            # Reown Email OAuth (POST)
+            response = await client.post(
+                endpoint, json={"token": token}, headers={"Content-Type": "application/json"}
+            )
+        elif provider == "x":
+            # X (Twitter) API requires Bearer token
+            response = await client.get(
+                endpoint,
+                headers={"Authorization": f"Bearer {token}"},
+                params={"user.fields": "id,username,name"},
+            )
+
+        # Check response status
+        if response.status_code != 200:
+            return None
+
+        # Parse response
+        user_info = response.json()
+
+        # Validate response has required fields
+        if provider == "google":
+            if "email" not in user_info or "sub" not in user_info:
                 return None
+        elif provider == "email":
+            if "email" not in user_info:
+                return None
+        elif provider == "x":
+            # X may not have email, use username
+            if "data" not in user_info:
+                return None
+            user_info = user_info["data"]  # Extract data object
 
-            # Parse response
-            user_info = response.json()
-
-            # Validate response has required fields
-            if provider == "google":
-                if "email" not in user_info or "sub" not in user_info:
-                    return None
-            elif provider == "email":
-                if "email" not in user_info:
-                    return None
-            elif provider == "x":
-                # X may not have email, use username
-                if "data" not in user_info:
-                    return None
-                user_info = user_info["data"]  # Extract data object
-
-            return user_info
+        return user_info
 
     except (httpx.RequestError, ValueError, KeyError):
         # Network error, JSON parsing error, or missing keys
@@ -139,12 +223,52 @@ async def get_or_create_user(
     """
     # Create session if not provided
     if session is None:
-        async with AsyncSessionLocal() as session:
+        async with get_sessionmaker()() as session:
             return await _get_or_create_user_internal(oauth_data, provider, session)
     else:
         return await _get_or_create_user_internal(oauth_data, provider, session)
 
 
+async def _insert_user(
+    session: AsyncSession, values: dict[str, Any], upsert_on_email: bool = False
+) -> User:
+    """
+    Insert a user with a fresh referral code, retrying on code collisions.
+
+    The unique index on referral_code rejects the rare duplicate code, so the
+    common case is a single statement. With upsert_on_email, an existing row
+    for the same email is updated instead (INSERT ... ON CONFLICT (email)
+    DO UPDATE ... RETURNING), which also settles concurrent signups.
+    """
+    insert = dialect_insert(session)
+    attempt = 1
+    while True:
+        stmt = insert(User).values(**values, referral_code=_generate_referral_code())
+        if upsert_on_email:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.email],
+                set_={
+                    "social_provider": stmt.excluded.social_provider,
+                    "social_id": func.coalesce(stmt.excluded.social_id, User.social_id),
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+        stmt = stmt.returning(User).execution_options(populate_existing=True)
+
+        try:
+            result = await session.execute(stmt)
+            user = result.scalar_one()
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            if attempt >= REFERRAL_CODE_MAX_ATTEMPTS:
+                raise
+            attempt += 1
+            continue
+
+        return user
+
+
 async def _get_or_create_user_internal(
     oauth_data: dict[str, Any], provider: str, session: AsyncSession
 ) -> User:
@@ -153,53 +277,34 @@ async def _get_or_create_user_internal(
     email = oauth_data.get("email")
     social_id = oauth_data.get("sub") or oauth_data.get("id")
 
-    # Try to find existing user by email or social_id
-    query = select(User)
+    # New users have no wallet address yet (can be linked later) and no referrer
+    values = {
+        "email": email,
+        "social_provider": provider,
+        "social_id": str(social_id) if social_id else None,
+        "address": None,
+        "referred_by": None,
+    }
+
     if email:
-        query = query.where(User.email == email)
-    elif social_id:
-        query = query.where(User.social_id == str(social_id))
-    else:
+        # Get-or-create by email in one round-trip
+        return await _insert_user(session, values, upsert_on_email=True)
+
+    if not social_id:
         raise ValueError("OAuth data must contain email or sub/id")
 
-    result = await session.execute(query)
+    # social_id has no unique constraint to upsert on: look it up first
+    result = await session.execute(select(User).where(User.social_id == str(social_id)))
     user = result.scalar_one_or_none()
 
     if user:
-        # User exists, update if needed
+        # User exists, update provider
         user.social_provider = provider
-        user.social_id = str(social_id) if social_id else user.social_id
         await session.commit()
         await session.refresh(user)
         return user
-    else:
-        # Create new user
-        # Generate unique referral code
-        referral_code = _generate_referral_code()
-
-        # Ensure referral code is unique
-        while True:
-            check_query = select(User).where(User.referral_code == referral_code)
-            existing = await session.execute(check_query)
-            if existing.scalar_one_or_none() is None:
-                break
-            referral_code = _generate_referral_code()
-
-        # Create user without address (can be linked later)
-        new_user = User(
-            email=email,
-            social_provider=provider,
-            social_id=str(social_id) if social_id else None,
-            address=None,  # No wallet address yet
-            referral_code=referral_code,
-            referred_by=None,  # Can be set later via referral code
-        )
 
-        session.add(new_user)
-        await session.commit()
-        await session.refresh(new_user)
-
-        return new_user
+    return await _insert_user(session, values)
 
 
 async def link_wallet_address(
@@ -221,6 +326,10 @@ async def link_wallet_address(
         >>> user.address
         '0x1234567890abcdef1234567890abcdef12345678'
     """
+    # Drop cached address -> user mappings for the old and new address
+    invalidate_cached_user(user.address)
+    invalidate_cached_user(address.lower())
+
     # Normalize address to lowercase
     user.address = address.lower()
 
@@ -232,5 +341,5 @@ async def link_wallet_address(
 
 async def get_db_session():
     """Get database session for dependency injection in tests."""
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
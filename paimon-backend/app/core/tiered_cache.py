@@ -4,8 +4,9 @@ Tiered cache implementation with L1 (memory) and L2 (Redis).
 Provides fast in-memory caching with Redis fallback for distributed systems.
 """
 
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 from datetime import timedelta
+import asyncio
 import logging
 from cachetools import TTLCache
 
@@ -14,6 +15,42 @@ from app.core.cache import cache as redis_cache
 logger = logging.getLogger(__name__)
 
 
+class FastTTLCache(TTLCache):
+    """
+    TTLCache with an inlined expiry sweep.
+
+    TTLCache runs expire() on every insert and removes each expired item
+    through Cache.__delitem__. This override pops the internal dicts
+    directly in one loop and returns early when nothing has expired.
+    Relies on private cachetools 5.x attributes (the TTLCache link list and
+    the Cache data/size dicts), which pyproject.toml does not pin exactly;
+    test_tiered_cache fails if a cachetools upgrade removes them.
+    """
+
+    def expire(self, time=None):
+        """Remove expired items from the cache."""
+        if time is None:
+            time = self.timer()
+        root = self._TTLCache__root
+        curr = root.next
+        if curr is root or time < curr.expires:
+            return
+
+        links = self._TTLCache__links
+        data = self._Cache__data
+        sizes = self._Cache__size
+        freed = 0
+        while curr is not root and not (time < curr.expires):
+            key = curr.key
+            del data[key]
+            freed += sizes.pop(key)
+            del links[key]
+            next_link = curr.next
+            curr.unlink()
+            curr = next_link
+        self._Cache__currsize -= freed
+
+
 class TieredCache:
     """
     Two-tier cache: L1 (in-memory) + L2 (Redis).
@@ -21,41 +58,148 @@ class TieredCache:
     Fast local cache with distributed Redis backup.
     """
 
-    def __init__(self, l1_max_size: int = 1000, l1_ttl: int = 60):
+    def __init__(
+        self, l1_max_size: int = 1000, l1_ttl: int = 60, negative_ttl: int = 5
+    ):
         """
         Initialize tiered cache.
 
         Args:
             l1_max_size: Max items in L1 cache
             l1_ttl: L1 TTL in seconds (default 60s)
+            negative_ttl: Seconds an L2 miss is remembered locally (default 5s)
         """
-        self.l1_cache = TTLCache(maxsize=l1_max_size, ttl=l1_ttl)
+        self.l1_cache = FastTTLCache(maxsize=l1_max_size, ttl=l1_ttl)
         self.l2_cache = redis_cache
 
+        # Keys recently missing from L2; repeat lookups skip Redis. Kept apart
+        # from L1 so misses expire on their own, much shorter, TTL.
+        self._l1_misses = FastTTLCache(maxsize=l1_max_size, ttl=negative_ttl)
+
+        # Running get_or_set producers by key, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task] = {}
+
+        # Bound L1 accessors for the hot path
+        self._l1_get = self.l1_cache.__getitem__
+        self._l1_set = self.l1_cache.__setitem__
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from L1, fallback to L2."""
-        # Try L1 first
-        if key in self.l1_cache:
-            logger.debug(f"L1 cache hit: {key}")
-            return self.l1_cache[key]
+        # Try L1 first (single lookup; expired entries raise KeyError)
+        try:
+            value = self._l1_get(key)
+        except KeyError:
+            pass
+        else:
+            logger.debug("L1 cache hit: %s", key)
+            return value
+
+        if key in self._l1_misses:
+            logger.debug("Cached miss: %s", key)
+            return None
 
         # Fallback to L2 (Redis)
         value = await self.l2_cache.get_json(key)
         if value is not None:
-            logger.debug(f"L2 cache hit: {key}")
-            self.l1_cache[key] = value  # Promote to L1
+            logger.debug("L2 cache hit: %s", key)
+            self._l1_set(key, value)  # Promote to L1
             return value
 
-        logger.debug(f"Cache miss: {key}")
+        logger.debug("Cache miss: %s", key)
+        self._l1_misses[key] = True
         return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values: L1 first, then all L1 misses from L2 in one MGET.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Found keys and their values (missing keys are omitted).
+        """
+        found: dict[str, Any] = {}
+        misses: list[str] = []
+        l1_get = self._l1_get
+        known_misses = self._l1_misses
+        for key in keys:
+            try:
+                found[key] = l1_get(key)
+            except KeyError:
+                if key not in known_misses:
+                    misses.append(key)
+
+        if misses:
+            l1_set = self._l1_set
+            values = await self.l2_cache.get_json_many(misses)
+            for key, value in zip(misses, values):
+                if value is not None:
+                    found[key] = value
+                    l1_set(key, value)  # Promote to L1
+                else:
+                    known_misses[key] = True
+
+        logger.debug("Cache get_many: %d/%d found", len(found), len(keys))
+        return found
+
+    async def get_or_set(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: Optional[timedelta] = None,
+    ) -> Any:
+        """
+        Get a value, computing and caching it on a miss.
+
+        Concurrent misses for the same key share one producer call; the
+        other callers await its result instead of recomputing.
+
+        Args:
+            key: Cache key
+            producer: Coroutine function computing the value
+            ttl: L2 TTL for the computed value (optional)
+
+        Returns:
+            Cached or freshly computed value (None values are not cached)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            # Another caller may have started the producer while we awaited L2
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._produce(key, producer, ttl))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller's cancellation does not cancel the shared fill
+        return await asyncio.shield(task)
+
+    async def _produce(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: Optional[timedelta],
+    ) -> Any:
+        """Run the producer and store its result in both tiers."""
+        value = await producer()
+        if value is not None:
+            await self.set(key, value, ttl)
+        return value
+
     async def set(self, key: str, value: Any, ttl: Optional[timedelta] = None):
         """Set value in both L1 and L2."""
-        self.l1_cache[key] = value  # L1
+        self._l1_misses.pop(key, None)
+        self._l1_set(key, value)  # L1
         await self.l2_cache.set_json(key, value, ttl)  # L2
 
     async def delete(self, key: str):
         """Delete from both caches."""
+        self._l1_misses.pop(key, None)
         self.l1_cache.pop(key, None)  # L1
         await self.l2_cache.delete(key)  # L2
 
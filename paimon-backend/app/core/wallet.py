@@ -7,10 +7,28 @@ Provides functions for:
 - Supporting MetaMask, WalletConnect, and other standard wallets
 """
 
-from eth_account import Account
-from eth_account.messages import encode_defunct
-from eth_keys.exceptions import BadSignature
-from eth_utils import to_checksum_address
+from coincurve import PublicKey
+from coincurve.context import GLOBAL_CONTEXT
+from eth_utils import keccak, to_checksum_address
+
+# Process-wide secp256k1 context, created once by coincurve at import and
+# reused for every recovery (context creation costs far more than a recovery)
+_SECP256K1_CONTEXT = GLOBAL_CONTEXT
+
+# EIP-191 personal_sign prefix (what encode_defunct / wallets prepend)
+_SIGNED_MESSAGE_PREFIX = b"\x19Ethereum Signed Message:\n"
+
+
+def _message_hash(message: str) -> bytes:
+    """Hash a text message the way wallets do for personal_sign."""
+    data = message.encode()
+    return keccak(_SIGNED_MESSAGE_PREFIX + str(len(data)).encode() + data)
+
+
+def _normalize_address(address: str) -> str:
+    """Lowercase an address and ensure its '0x' prefix."""
+    address = address.lower()
+    return address if address.startswith("0x") else "0x" + address
 
 
 def verify_signature(message: str, signature: str, expected_address: str) -> bool:
@@ -37,16 +55,13 @@ def verify_signature(message: str, signature: str, expected_address: str) -> boo
     """
     try:
         # Recover signer address from signature
-        recovered_address = recover_address(message, signature)
+        recovered_address = _recover_address_hex(message, signature)
 
         if recovered_address is None:
             return False
 
-        # Normalize both addresses to checksum format for comparison
-        recovered_checksum = to_checksum_address(recovered_address)
-        expected_checksum = to_checksum_address(expected_address)
-
-        return recovered_checksum == expected_checksum
+        # Compare lowercase hex; checksumming either side would cost a keccak
+        return recovered_address == _normalize_address(expected_address)
 
     except (ValueError, TypeError, AttributeError):
         # Invalid signature format, address format, or other errors
@@ -75,23 +90,50 @@ def recover_address(message: str, signature: str) -> str | None:
         >>> recovered.lower() == account.address.lower()
         True
     """
+    recovered_address = _recover_address_hex(message, signature)
+    if recovered_address is None:
+        return None
+    return to_checksum_address(recovered_address)
+
+
+def _recover_address_hex(message: str, signature: str) -> str | None:
+    """
+    Recover the signer address as lowercase '0x' hex (no checksum).
+
+    Args:
+        message: Original message that was signed.
+        signature: Hex-encoded signature (with or without '0x' prefix).
+
+    Returns:
+        str | None: Lowercase recovered address, or None if invalid.
+    """
     try:
-        # Ensure signature has '0x' prefix
-        if not signature.startswith("0x"):
-            signature = "0x" + signature
+        # Strip optional '0x' prefix
+        if signature.startswith("0x"):
+            signature = signature[2:]
 
-        # Validate signature length (65 bytes = 130 hex chars + 2 for '0x')
-        if len(signature) != 132:
+        # Validate signature length (65 bytes = 130 hex chars)
+        if len(signature) != 130:
             return None
 
-        # Encode message in the same way wallets do
-        message_hash = encode_defunct(text=message)
+        # Signature is r (32) || s (32) || v (1); v is 27/28 or 0/1
+        sig = bytes.fromhex(signature)
+        recovery_id = sig[64] - 27 if sig[64] >= 27 else sig[64]
+        if recovery_id not in (0, 1):
+            return None
 
-        # Recover address from signature
-        recovered_address = Account.recover_message(message_hash, signature=signature)
+        # Recover public key with libsecp256k1 (message is already hashed)
+        public_key = PublicKey.from_signature_and_message(
+            sig[:64] + bytes((recovery_id,)),
+            _message_hash(message),
+            hasher=None,
+            context=_SECP256K1_CONTEXT,
+        )
 
-        return recovered_address
+        # Address is the last 20 bytes of keccak(uncompressed key without 0x04)
+        public_key_bytes = public_key.format(compressed=False)[1:]
+        return "0x" + keccak(public_key_bytes)[-20:].hex()
 
-    except (ValueError, TypeError, AttributeError, BadSignature):
+    except (ValueError, TypeError, AttributeError):
         # Invalid signature format, recovery failure, or bad signature
         return None
@@ -6,19 +6,36 @@ Scans blockchain events and updates database cache.
 
 import asyncio
 import logging
+import time
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
+from eth_utils import event_abi_to_log_topic
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import AsyncWeb3
 from web3.contract import AsyncContract
-from web3.types import EventData, FilterParams
+from web3.types import EventData, FilterParams, LogReceipt
 
-from app.core.database import get_db_session
+from app.core.database import dialect_insert, get_db_session
 from app.models.indexer import IndexerState
 
 logger = logging.getLogger(__name__)
 
+# Scan progress is checkpointed every N batches or T seconds, whichever
+# comes first (handlers are idempotent, so a crash re-scans at most that much)
+STATE_SAVE_EVERY_BATCHES = 10
+STATE_SAVE_INTERVAL_SECONDS = 30.0
+
+# Batches whose logs are fetched ahead of the batch being processed
+SCAN_PREFETCH_BATCHES = 8
+
+# eth_getLogs attempts per batch (prefetching makes transient rate-limit
+# errors likely), with exponential backoff between attempts
+FETCH_LOGS_ATTEMPTS = 4
+FETCH_LOGS_BACKOFF_SECONDS = 0.5
+
 
 class EventListener:
     """
@@ -48,9 +65,20 @@ class EventListener:
         self.contract = contract
         self.start_block = start_block
 
+        # Contract address for eth_getLogs, resolved once
+        self._address = contract.address
+
         # Event handlers registry: {event_name: handler_function}
         self.event_handlers: Dict[str, Callable] = {}
 
+        # Registered events by topic0: {topic0: (event_name, process_log, handler)}
+        self._events_by_topic: Dict[
+            bytes, Tuple[str, Callable[[LogReceipt], EventData], Callable]
+        ] = {}
+
+        # eth_getLogs topic filter for all registered events (hex topic0 list)
+        self._topic_filter: List[str] = []
+
         # Scanning state
         self.is_syncing = False
         self.last_scanned_block = start_block
@@ -68,40 +96,53 @@ class EventListener:
             handler: Async handler function
         """
         self.event_handlers[event_name] = handler
+
+        # Index the event by topic0 so scans can fetch all events in one call
+        event = getattr(self.contract.events, event_name, None)
+        if not event:
+            logger.warning(
+                f"Event {event_name} not found in {self.contract_name}"
+            )
+        else:
+            # Resolve ABI, topic and decoder once, not per scanned log
+            event = event()
+            self._events_by_topic[event_abi_to_log_topic(event.abi)] = (
+                event_name,
+                event.process_log,
+                handler,
+            )
+            self._topic_filter = [
+                "0x" + topic.hex() for topic in self._events_by_topic
+            ]
+
         logger.info(f"Registered handler for {self.contract_name}.{event_name}")
 
     async def load_state(self, session: AsyncSession) -> None:
         """
         Load scanning state from database.
 
+        A contract without a state row starts at start_block; the row is
+        created by the first save_state (an upsert).
+
         Args:
             session: Database session
         """
         from sqlalchemy import select
 
-        stmt = select(IndexerState).where(
+        stmt = select(IndexerState.last_scanned_block).where(
             IndexerState.contract_name == self.contract_name
         )
-        result = await session.execute(stmt)
-        state = result.scalar_one_or_none()
+        last_scanned_block = await session.scalar(stmt)
 
-        if state:
-            self.last_scanned_block = state.last_scanned_block
+        if last_scanned_block is not None:
+            self.last_scanned_block = last_scanned_block
             logger.info(
                 f"Loaded state for {self.contract_name}: "
                 f"last_scanned_block={self.last_scanned_block}"
             )
         else:
-            # Initialize state if not exists
-            state = IndexerState(
-                contract_name=self.contract_name,
-                last_scanned_block=self.start_block,
-                last_scanned_at=datetime.utcnow(),
-                is_syncing=False,
-            )
-            session.add(state)
-            await session.commit()
-            logger.info(f"Initialized state for {self.contract_name}")
+            self.last_scanned_block = self.start_block
+            logger.info(f"No saved state for {self.contract_name}")
 
     async def save_state(
         self,
@@ -112,21 +153,23 @@ class EventListener:
         """
         Save scanning state to database.
 
+        Upserts the contract's row, so the first save also creates it.
+
         Args:
             session: Database session
             last_block: Last scanned block number
             is_syncing: Whether currently syncing
         """
-        from sqlalchemy import select, update
-
-        stmt = (
-            update(IndexerState)
-            .where(IndexerState.contract_name == self.contract_name)
-            .values(
-                last_scanned_block=last_block,
-                last_scanned_at=datetime.utcnow(),
-                is_syncing=is_syncing,
-            )
+        values = {
+            "last_scanned_block": last_block,
+            "last_scanned_at": datetime.utcnow(),  # Naive UTC column
+            "is_syncing": is_syncing,
+        }
+        stmt = dialect_insert(session)(IndexerState).values(
+            contract_name=self.contract_name, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IndexerState.contract_name], set_=values
         )
         await session.execute(stmt)
         await session.commit()
@@ -134,69 +177,120 @@ class EventListener:
         self.last_scanned_block = last_block
         self.is_syncing = is_syncing
 
-    async def scan_events(
-        self,
-        from_block: int,
-        to_block: int,
-        session: AsyncSession,
-    ) -> int:
+    async def _fetch_logs(self, from_block: int, to_block: int) -> List[LogReceipt]:
         """
-        Scan events in block range.
+        Fetch logs of all registered events in block range.
+
+        Uses a single eth_getLogs call (topic0 OR-filter), retried with
+        exponential backoff. Errors that persist are raised, never reported as
+        an empty range: the call covers every registered event, and treating
+        a failure as "no events" would let the scan checkpoint move past them.
 
         Args:
             from_block: Starting block
             to_block: Ending block
-            session: Database session
 
         Returns:
-            Number of events processed
-        """
-        total_events = 0
+            Raw logs in chain order
 
-        for event_name, handler in self.event_handlers.items():
+        Raises:
+            Exception: If the last eth_getLogs attempt fails
+        """
+        if not self._topic_filter:
+            return []
+
+        params: FilterParams = {
+            "address": self._address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [self._topic_filter],
+        }
+        for attempt in range(1, FETCH_LOGS_ATTEMPTS + 1):
             try:
-                # Get event from contract
-                event = getattr(self.contract.events, event_name, None)
-                if not event:
-                    logger.warning(
-                        f"Event {event_name} not found in {self.contract_name}"
-                    )
-                    continue
-
-                # Create filter
-                event_filter = await event.create_filter(
-                    fromBlock=from_block,
-                    toBlock=to_block,
+                return await self.w3.eth.get_logs(params)
+            except Exception as e:
+                if attempt == FETCH_LOGS_ATTEMPTS:
+                    raise
+                delay = FETCH_LOGS_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Error fetching {self.contract_name} logs for blocks "
+                    f"{from_block}-{to_block} (attempt {attempt}/"
+                    f"{FETCH_LOGS_ATTEMPTS}), retrying in {delay:.1f}s: {e}"
                 )
+                await asyncio.sleep(delay)
 
-                # Get all events
-                events = await event_filter.get_all_entries()
-
-                # Process each event
-                for event_data in events:
-                    try:
-                        await handler(event_data, session)
-                        total_events += 1
-                    except Exception as e:
-                        logger.error(
-                            f"Error processing {event_name} event "
-                            f"at block {event_data['blockNumber']}: {e}",
-                            exc_info=True,
-                        )
+    async def _process_logs(
+        self,
+        logs: List[LogReceipt],
+        session: AsyncSession,
+    ) -> int:
+        """
+        Decode logs and run their handlers in order.
+
+        Each handler runs in a savepoint, so a failing event only rolls back
+        its own writes; the batch is committed once at the end.
 
-                if events:
-                    logger.info(
-                        f"Processed {len(events)} {event_name} events "
-                        f"from {self.contract_name}"
-                    )
+        Args:
+            logs: Raw logs from _fetch_logs
+            session: Database session
 
+        Returns:
+            Number of events processed
+        """
+        processed: Counter[str] = Counter()
+        events_by_topic = self._events_by_topic
+
+        # Process each event
+        for log in logs:
+            event_name, process_log, handler = events_by_topic[
+                bytes(log["topics"][0])
+            ]
+            try:
+                async with session.begin_nested():
+                    await handler(process_log(log), session)
+                processed[event_name] += 1
             except Exception as e:
                 logger.error(
-                    f"Error scanning {event_name} events: {e}",
+                    f"Error processing {event_name} event "
+                    f"at block {log['blockNumber']}: {e}",
                     exc_info=True,
                 )
 
-        return total_events
+        await session.commit()
+
+        for event_name, count in processed.items():
+            logger.info(
+                f"Processed {count} {event_name} events "
+                f"from {self.contract_name}"
+            )
+
+        return processed.total()
+
+    async def scan_events(
+        self,
+        from_block: int,
+        to_block: int,
+        session: AsyncSession,
+    ) -> int:
+        """
+        Scan events in block range.
+
+        Fetches logs of all registered events with a single eth_getLogs call
+        (topic0 OR-filter), then decodes and handles them in chain order.
+
+        Args:
+            from_block: Starting block
+            to_block: Ending block
+            session: Database session
+
+        Returns:
+            Number of events processed
+
+        Raises:
+            Exception: If fetching the logs fails
+        """
+        logs = await self._fetch_logs(from_block, to_block)
+        return await self._process_logs(logs, session)
 
     async def sync(
         self,
@@ -206,6 +300,10 @@ class EventListener:
         """
         Sync events from last scanned block to current block.
 
+        A failed log fetch stops the sync (the error is raised) with progress
+        saved up to the last fully processed batch, so the failed range is
+        scanned again on the next sync.
+
         Args:
             batch_size: Number of blocks to scan per batch
             max_blocks: Maximum blocks to scan (None for unlimited)
@@ -236,31 +334,67 @@ class EventListener:
             # Mark as syncing
             await self.save_state(session, self.last_scanned_block, is_syncing=True)
 
+            # Last block of the last fully scanned batch
+            scanned_to = self.last_scanned_block
+
             try:
-                # Scan in batches
+                # Scan in batches: logs for the next SCAN_PREFETCH_BATCHES
+                # batches are fetched concurrently while the current batch is
+                # processed; handlers still run strictly in block order
                 total_events = 0
-                current = from_block
-
-                while current <= to_block:
-                    batch_end = min(current + batch_size - 1, to_block)
-
-                    # Scan batch
-                    events_count = await self.scan_events(
-                        from_block=current,
-                        to_block=batch_end,
-                        session=session,
-                    )
-                    total_events += events_count
+                batches_since_save = 0
+                last_save = time.monotonic()
 
-                    # Save progress
-                    await self.save_state(session, batch_end, is_syncing=True)
-
-                    logger.info(
-                        f"Scanned {self.contract_name} blocks {current}-{batch_end} "
-                        f"({events_count} events)"
-                    )
+                ranges = iter(
+                    range(start, min(start + batch_size - 1, to_block) + 1)
+                    for start in range(from_block, to_block + 1, batch_size)
+                )
+                pending: Deque[Tuple[range, asyncio.Task]] = deque()
 
-                    current = batch_end + 1
+                def prefetch() -> None:
+                    for blocks in islice(ranges, SCAN_PREFETCH_BATCHES - len(pending)):
+                        task = asyncio.ensure_future(
+                            self._fetch_logs(blocks.start, blocks.stop - 1)
+                        )
+                        pending.append((blocks, task))
+
+                try:
+                    prefetch()
+                    while pending:
+                        blocks, task = pending.popleft()
+                        logs = await task
+                        prefetch()
+
+                        current, batch_end = blocks.start, blocks.stop - 1
+
+                        # Process batch
+                        events_count = await self._process_logs(logs, session)
+                        total_events += events_count
+                        scanned_to = batch_end
+
+                        # Checkpoint progress periodically (final save in finally)
+                        batches_since_save += 1
+                        if (
+                            batches_since_save >= STATE_SAVE_EVERY_BATCHES
+                            or time.monotonic() - last_save
+                            >= STATE_SAVE_INTERVAL_SECONDS
+                        ):
+                            await self.save_state(session, batch_end, is_syncing=True)
+                            batches_since_save = 0
+                            last_save = time.monotonic()
+
+                        logger.info(
+                            f"Scanned {self.contract_name} blocks "
+                            f"{current}-{batch_end} ({events_count} events)"
+                        )
+                finally:
+                    # Drop prefetches left over after an error (consuming the
+                    # errors of any that already failed, so none go unretrieved)
+                    for _, task in pending:
+                        if task.done() and not task.cancelled():
+                            task.exception()
+                        else:
+                            task.cancel()
 
                 logger.info(
                     f"Sync complete for {self.contract_name}: "
@@ -268,8 +402,8 @@ class EventListener:
                 )
 
             finally:
-                # Mark as not syncing
-                await self.save_state(session, to_block, is_syncing=False)
+                # Save final progress and mark as not syncing
+                await self.save_state(session, scanned_to, is_syncing=False)
 
     async def start_continuous_sync(
         self,
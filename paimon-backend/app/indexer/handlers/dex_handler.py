@@ -5,19 +5,27 @@ Processes Mint, Burn, and Swap events from DEX pairs.
 """
 
 import logging
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 from web3.types import EventData
 
+from app.config.contracts import ERC20_ABI
+from app.core.database import dialect_insert
+from app.indexer.multicall import Multicall3
 from app.models.indexer import LPPosition
 
 logger = logging.getLogger(__name__)
 
+# Decimal constants (built once, not per event)
+WAD = Decimal(10) ** 18  # 18-decimal token unit
+HUNDRED = Decimal(100)
+CENT = Decimal("0.01")
+
 
 class DEXEventHandler:
     """
@@ -47,6 +55,13 @@ class DEXEventHandler:
         self.gauge_controller = gauge_controller
         self.price_oracle = price_oracle
 
+        # Batches the per-position view calls into one eth_call
+        self.multicall = Multicall3(w3)
+
+        # Immutable pair metadata (fetched once per pair):
+        # {pair_address: (token0, token1, token0_symbol, token1_symbol)}
+        self.pair_metadata: dict[str, tuple[str, str, str, str]] = {}
+
     async def handle_mint(
         self,
         event: EventData,
@@ -131,140 +146,106 @@ class DEXEventHandler:
             user_address: User address
             session: Database session
         """
-        try:
-            # Get pair contract
-            pair = self.pair_contracts.get(pair_address)
-            if not pair:
-                logger.warning(f"Pair contract not found: {pair_address}")
-                return
-
-            # Query on-chain data
-            lp_balance = await pair.functions.balanceOf(user_address).call()
-            total_supply = await pair.functions.totalSupply().call()
-            reserves = await pair.functions.getReserves().call()
-            token0_addr = await pair.functions.token0().call()
-            token1_addr = await pair.functions.token1().call()
-
-            # If user has no balance, delete position
-            if lp_balance == 0:
-                await self._delete_lp_position(pair_address, user_address, session)
-                return
+        # Get pair contract
+        pair = self.pair_contracts.get(pair_address)
+        if not pair:
+            logger.warning(f"Pair contract not found: {pair_address}")
+            return
+
+        # Query on-chain data (one Multicall3 eth_call, same-block reads);
+        # token addresses only until the pair's metadata is cached
+        pair_meta = self.pair_metadata.get(pair_address)
+        calls = [
+            pair.functions.balanceOf(user_address),
+            pair.functions.totalSupply(),
+            pair.functions.getReserves(),
+        ]
+        if pair_meta is None:
+            calls += [pair.functions.token0(), pair.functions.token1()]
+
+        results = await self.multicall.aggregate(calls)
+        lp_balance, total_supply, reserves = results[:3]
+
+        # If user has no balance, delete position
+        if lp_balance == 0:
+            await self._delete_lp_position(pair_address, user_address, session)
+            return
+
+        if pair_meta is None:
+            token0_addr, token1_addr = results[3:]
 
             # Get token contracts
-            from web3 import Web3
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "symbol",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function",
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"name": "", "type": "uint8"}],
-                    "type": "function",
-                },
-            ]
-
-            token0 = self.w3.eth.contract(address=token0_addr, abi=erc20_abi)
-            token1 = self.w3.eth.contract(address=token1_addr, abi=erc20_abi)
-
-            token0_symbol = await token0.functions.symbol().call()
-            token1_symbol = await token1.functions.symbol().call()
-
-            # Calculate share percentage
-            share_percentage = Decimal(lp_balance) / Decimal(total_supply) * 100
-
-            # Calculate token amounts
-            token0_amount = (
-                Decimal(lp_balance) / Decimal(total_supply) * Decimal(reserves[0])
-            )
-            token1_amount = (
-                Decimal(lp_balance) / Decimal(total_supply) * Decimal(reserves[1])
-            )
+            token0 = self.w3.eth.contract(address=token0_addr, abi=ERC20_ABI)
+            token1 = self.w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
 
-            # Calculate liquidity USD (simplified: assume USDC/USDP = $1)
-            # In production, use price oracle
-            liquidity_usd = await self._calculate_liquidity_usd(
-                token0_symbol,
-                token1_symbol,
-                token0_amount,
-                token1_amount,
+            token0_symbol, token1_symbol = await self.multicall.aggregate(
+                [token0.functions.symbol(), token1.functions.symbol()]
             )
 
-            # Get APR from GaugeController
-            current_apr = await self._get_pair_apr(pair_address)
+            pair_meta = (token0_addr, token1_addr, token0_symbol, token1_symbol)
+            self.pair_metadata[pair_address] = pair_meta
 
-            # Get pending rewards (TODO: implement)
-            pending_rewards = Decimal(0)
+        _, _, token0_symbol, token1_symbol = pair_meta
 
-            # Create pool name
-            pool_name = f"{token0_symbol}/{token1_symbol}"
+        # Calculate share percentage
+        share = Decimal(lp_balance) / Decimal(total_supply)
+        share_percentage = share * HUNDRED
 
-            # Update or create position
-            stmt = select(LPPosition).where(
-                LPPosition.user_address == user_address,
-                LPPosition.pair_address == pair_address,
-            )
-            result = await session.execute(stmt)
-            position = result.scalar_one_or_none()
-
-            # Convert Wei to decimals (assuming 18 decimals)
-            lp_balance_decimal = Decimal(lp_balance) / Decimal(10**18)
-            token0_amount_decimal = token0_amount / Decimal(10**18)
-            token1_amount_decimal = token1_amount / Decimal(10**18)
-
-            if position:
-                # Update existing position
-                position.lp_token_balance = lp_balance_decimal
-                position.share_percentage = share_percentage
-                position.liquidity_usd = liquidity_usd
-                position.token0_amount = token0_amount_decimal
-                position.token1_amount = token1_amount_decimal
-                position.token0_symbol = token0_symbol
-                position.token1_symbol = token1_symbol
-                position.current_apr = current_apr
-                position.pending_rewards = pending_rewards
-
-                logger.info(
-                    f"Updated LP position for {user_address[:10]}... "
-                    f"in {pool_name}: {lp_balance_decimal} LP tokens"
-                )
-            else:
-                # Create new position
-                position = LPPosition(
-                    user_address=user_address,
-                    pair_address=pair_address,
-                    pool_name=pool_name,
-                    lp_token_balance=lp_balance_decimal,
-                    share_percentage=share_percentage,
-                    liquidity_usd=liquidity_usd,
-                    token0_amount=token0_amount_decimal,
-                    token1_amount=token1_amount_decimal,
-                    token0_symbol=token0_symbol,
-                    token1_symbol=token1_symbol,
-                    current_apr=current_apr,
-                    pending_rewards=pending_rewards,
-                )
-                session.add(position)
-
-                logger.info(
-                    f"Created LP position for {user_address[:10]}... "
-                    f"in {pool_name}: {lp_balance_decimal} LP tokens"
-                )
-
-            await session.commit()
+        # Calculate token amounts
+        token0_amount = share * Decimal(reserves[0])
+        token1_amount = share * Decimal(reserves[1])
 
-        except Exception as e:
-            logger.error(
-                f"Error updating LP position for {user_address} "
-                f"in pair {pair_address}: {e}",
-                exc_info=True,
-            )
-            await session.rollback()
+        # Calculate liquidity USD (simplified: assume USDC/USDP = $1)
+        # In production, use price oracle
+        liquidity_usd = await self._calculate_liquidity_usd(
+            token0_symbol,
+            token1_symbol,
+            token0_amount,
+            token1_amount,
+        )
+
+        # Get APR from GaugeController
+        current_apr = await self._get_pair_apr(pair_address)
+
+        # Get pending rewards (TODO: implement)
+        pending_rewards = Decimal(0)
+
+        # Create pool name
+        pool_name = f"{token0_symbol}/{token1_symbol}"
+
+        # Convert Wei to decimals (assuming 18 decimals)
+        lp_balance_decimal = Decimal(lp_balance) / WAD
+        token0_amount_decimal = token0_amount / WAD
+        token1_amount_decimal = token1_amount / WAD
+
+        # Update or create position (one INSERT ... ON CONFLICT DO UPDATE)
+        values = {
+            "lp_token_balance": lp_balance_decimal,
+            "share_percentage": share_percentage,
+            "liquidity_usd": liquidity_usd,
+            "token0_amount": token0_amount_decimal,
+            "token1_amount": token1_amount_decimal,
+            "token0_symbol": token0_symbol,
+            "token1_symbol": token1_symbol,
+            "current_apr": current_apr,
+            "pending_rewards": pending_rewards,
+        }
+        stmt = dialect_insert(session)(LPPosition).values(
+            user_address=user_address,
+            pair_address=pair_address,
+            pool_name=pool_name,
+            **values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LPPosition.user_address, LPPosition.pair_address],
+            set_={**values, "updated_at": datetime.utcnow()},
+        )
+        await session.execute(stmt)
+
+        logger.info(
+            f"Upserted LP position for {user_address[:10]}... "
+            f"in {pool_name}: {lp_balance_decimal} LP tokens"
+        )
 
     async def _delete_lp_position(
         self,
@@ -287,7 +268,6 @@ class DEXEventHandler:
             LPPosition.pair_address == pair_address,
         )
         await session.execute(stmt)
-        await session.commit()
 
         logger.info(
             f"Deleted LP position for {user_address[:10]}... "
@@ -321,17 +301,17 @@ class DEXEventHandler:
 
         # If both are stablecoins, sum them
         if token0_symbol in stablecoins and token1_symbol in stablecoins:
-            total_usd = (token0_amount + token1_amount) / Decimal(10**18)
-            return total_usd.quantize(Decimal("0.01"))
+            total_usd = (token0_amount + token1_amount) / WAD
+            return total_usd.quantize(CENT)
 
         # If one is stablecoin, double it (assume equal value)
         if token0_symbol in stablecoins:
-            total_usd = (token0_amount * 2) / Decimal(10**18)
-            return total_usd.quantize(Decimal("0.01"))
+            total_usd = (token0_amount * 2) / WAD
+            return total_usd.quantize(CENT)
 
         if token1_symbol in stablecoins:
-            total_usd = (token1_amount * 2) / Decimal(10**18)
-            return total_usd.quantize(Decimal("0.01"))
+            total_usd = (token1_amount * 2) / WAD
+            return total_usd.quantize(CENT)
 
         # Otherwise, return 0 (need price oracle)
         logger.warning(
@@ -4,7 +4,9 @@ Vault event handler for collateral and debt position indexing.
 Processes Deposit, Withdraw, Borrow, and Repay events from USDPVault.
 """
 
+import asyncio
 import logging
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
@@ -14,10 +16,19 @@ from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 from web3.types import EventData
 
+from app.config.contracts import ERC20_ABI
+from app.core.database import dialect_insert
+from app.indexer.multicall import Multicall3
 from app.models.indexer import VaultPosition
 
 logger = logging.getLogger(__name__)
 
+# Decimal constants (built once, not per event)
+WAD = Decimal(10) ** 18  # 18-decimal token unit
+BPS = Decimal(10000)  # basis points per 1.0
+CENT = Decimal("0.01")
+PRICE_QUANTUM = Decimal("0.00000001")
+
 
 class VaultEventHandler:
     """
@@ -44,9 +55,13 @@ class VaultEventHandler:
         self.vault = vault_contract
         self.price_oracle = price_oracle
 
+        # Batches the per-position view calls into one eth_call
+        self.multicall = Multicall3(w3)
+
         # Vault parameters (fetch once during init)
         self.ltv_ratios: dict[str, Decimal] = {}  # {collateral_address: ltv_ratio}
         self.liquidation_thresholds: dict[str, Decimal] = {}
+        self.asset_symbols: dict[str, str] = {}  # {collateral_address: symbol}
 
     async def handle_deposit(
         self,
@@ -152,11 +167,60 @@ class VaultEventHandler:
         # Repay affects all collaterals, update all positions
         await self._update_all_user_positions(user_address, session)
 
+    async def _fetch_vault_state(
+        self,
+        user_address: str,
+        collateral_address: str,
+    ) -> tuple[int, int, str, Decimal, Decimal, Decimal]:
+        """
+        Read on-chain state for a vault position.
+
+        Position data comes from one Multicall3 eth_call, issued alongside the
+        per-collateral metadata lookups.
+
+        Args:
+            user_address: User address
+            collateral_address: Collateral token address
+
+        Returns:
+            (collateral_amount, total_debt, asset_name, collateral_price,
+            ltv_ratio, liquidation_threshold)
+        """
+        (
+            (collateral_amount, total_debt),
+            asset_name,
+            collateral_price,
+            ltv_ratio,
+            liquidation_threshold,
+        ) = await asyncio.gather(
+            self.multicall.aggregate(
+                [
+                    self.vault.functions.getCollateralBalance(
+                        user_address, collateral_address
+                    ),
+                    self.vault.functions.getDebt(user_address),
+                ]
+            ),
+            self._get_asset_symbol(collateral_address),
+            self._get_collateral_price(collateral_address),
+            self._get_ltv_ratio(collateral_address),
+            self._get_liquidation_threshold(collateral_address),
+        )
+        return (
+            collateral_amount,
+            total_debt,
+            asset_name,
+            collateral_price,
+            ltv_ratio,
+            liquidation_threshold,
+        )
+
     async def _update_vault_position(
         self,
         user_address: str,
         collateral_address: str,
         session: AsyncSession,
+        state: Optional[tuple[int, int, str, Decimal, Decimal, Decimal]] = None,
     ) -> None:
         """
         Update vault position for specific collateral.
@@ -165,125 +229,80 @@ class VaultEventHandler:
             user_address: User address
             collateral_address: Collateral token address
             session: Database session
+            state: On-chain state from _fetch_vault_state (fetched if None)
         """
-        try:
-            # Query on-chain collateral data
-            collateral_amount = await self.vault.functions.getCollateralBalance(
-                user_address, collateral_address
-            ).call()
-
-            # If no collateral, delete position
-            if collateral_amount == 0:
-                await self._delete_vault_position(
-                    user_address, collateral_address, session
-                )
-                return
-
-            # Get collateral metadata
-            asset_name = await self._get_asset_symbol(collateral_address)
-
-            # Get collateral price
-            collateral_price = await self._get_collateral_price(collateral_address)
-
-            # Calculate collateral value in USD
-            # Assume 18 decimals for collateral
-            collateral_value_usd = (
-                Decimal(collateral_amount) / Decimal(10**18) * collateral_price
+        if state is None:
+            state = await self._fetch_vault_state(user_address, collateral_address)
+        (
+            collateral_amount,
+            total_debt,
+            asset_name,
+            collateral_price,
+            ltv_ratio,
+            liquidation_threshold,
+        ) = state
+
+        # If no collateral, delete position
+        if collateral_amount == 0:
+            await self._delete_vault_position(user_address, collateral_address, session)
+            return
+
+        # Calculate collateral value in USD
+        # Assume 18 decimals for collateral
+        collateral_amount_decimal = Decimal(collateral_amount) / WAD
+        collateral_value_usd = collateral_amount_decimal * collateral_price
+
+        debt_amount = Decimal(total_debt) / WAD
+
+        # Calculate health factor
+        # Health Factor = (Collateral Value * Liquidation Threshold) / Total Debt
+        # If health factor < 1.0, position can be liquidated
+        if debt_amount > 0:
+            health_factor = (
+                collateral_value_usd * liquidation_threshold / debt_amount
             )
-
-            # Get user total debt
-            total_debt = await self.vault.functions.getDebt(user_address).call()
-            debt_amount = Decimal(total_debt) / Decimal(10**18)
-
-            # Get LTV ratio and liquidation threshold
-            ltv_ratio = await self._get_ltv_ratio(collateral_address)
-            liquidation_threshold = await self._get_liquidation_threshold(
-                collateral_address
+        else:
+            health_factor = Decimal("999999")  # No debt = infinite health
+
+        # Calculate liquidation price
+        # Liquidation Price = (Total Debt) / (Collateral Amount * Liquidation Threshold)
+        if collateral_amount > 0:
+            liquidation_price = (
+                debt_amount * WAD /
+                (Decimal(collateral_amount) * liquidation_threshold)
             )
+        else:
+            liquidation_price = Decimal(0)
+
+        # Update or create position (one INSERT ... ON CONFLICT DO UPDATE)
+        values = {
+            "collateral_amount": collateral_amount_decimal,
+            "collateral_value_usd": collateral_value_usd.quantize(CENT),
+            "debt_amount": debt_amount,
+            "ltv_ratio": ltv_ratio,
+            "health_factor": health_factor,
+            "liquidation_price": liquidation_price.quantize(PRICE_QUANTUM),
+        }
+        stmt = dialect_insert(session)(VaultPosition).values(
+            user_address=user_address,
+            collateral_address=collateral_address,
+            asset_name=asset_name,
+            **values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                VaultPosition.user_address,
+                VaultPosition.collateral_address,
+            ],
+            set_={**values, "updated_at": datetime.utcnow()},
+        )
+        await session.execute(stmt)
 
-            # Calculate health factor
-            # Health Factor = (Collateral Value * Liquidation Threshold) / Total Debt
-            # If health factor < 1.0, position can be liquidated
-            if debt_amount > 0:
-                health_factor = (
-                    collateral_value_usd * liquidation_threshold / debt_amount
-                )
-            else:
-                health_factor = Decimal("999999")  # No debt = infinite health
-
-            # Calculate liquidation price
-            # Liquidation Price = (Total Debt) / (Collateral Amount * Liquidation Threshold)
-            if collateral_amount > 0:
-                liquidation_price = (
-                    debt_amount * Decimal(10**18) /
-                    (Decimal(collateral_amount) * liquidation_threshold)
-                )
-            else:
-                liquidation_price = Decimal(0)
-
-            # Update or create position
-            stmt = select(VaultPosition).where(
-                VaultPosition.user_address == user_address,
-                VaultPosition.collateral_address == collateral_address,
-            )
-            result = await session.execute(stmt)
-            position = result.scalar_one_or_none()
-
-            # Convert amounts
-            collateral_amount_decimal = Decimal(collateral_amount) / Decimal(10**18)
-
-            if position:
-                # Update existing position
-                position.collateral_amount = collateral_amount_decimal
-                position.collateral_value_usd = collateral_value_usd.quantize(
-                    Decimal("0.01")
-                )
-                position.debt_amount = debt_amount
-                position.ltv_ratio = ltv_ratio
-                position.health_factor = health_factor
-                position.liquidation_price = liquidation_price.quantize(
-                    Decimal("0.00000001")
-                )
-
-                logger.info(
-                    f"Updated Vault position for {user_address[:10]}... "
-                    f"{asset_name}: collateral=${collateral_value_usd:.2f} "
-                    f"debt=${debt_amount:.2f} health={health_factor:.2f}"
-                )
-            else:
-                # Create new position
-                position = VaultPosition(
-                    user_address=user_address,
-                    collateral_address=collateral_address,
-                    asset_name=asset_name,
-                    collateral_amount=collateral_amount_decimal,
-                    collateral_value_usd=collateral_value_usd.quantize(
-                        Decimal("0.01")
-                    ),
-                    debt_amount=debt_amount,
-                    ltv_ratio=ltv_ratio,
-                    health_factor=health_factor,
-                    liquidation_price=liquidation_price.quantize(
-                        Decimal("0.00000001")
-                    ),
-                )
-                session.add(position)
-
-                logger.info(
-                    f"Created Vault position for {user_address[:10]}... "
-                    f"{asset_name}: collateral=${collateral_value_usd:.2f} "
-                    f"debt=${debt_amount:.2f} health={health_factor:.2f}"
-                )
-
-            await session.commit()
-
-        except Exception as e:
-            logger.error(
-                f"Error updating Vault position for {user_address} "
-                f"collateral {collateral_address}: {e}",
-                exc_info=True,
-            )
-            await session.rollback()
+        logger.info(
+            f"Upserted Vault position for {user_address[:10]}... "
+            f"{asset_name}: collateral=${collateral_value_usd:.2f} "
+            f"debt=${debt_amount:.2f} health={health_factor:.2f}"
+        )
 
     async def _update_all_user_positions(
         self,
@@ -298,15 +317,33 @@ class VaultEventHandler:
             session: Database session
         """
         # Get all collaterals for this user
-        stmt = select(VaultPosition).where(
+        stmt = select(VaultPosition.collateral_address).where(
             VaultPosition.user_address == user_address
         )
         result = await session.execute(stmt)
-        positions = result.scalars().all()
+        collaterals = result.scalars().all()
+
+        # Read on-chain state for all collaterals concurrently; the session
+        # is not safe for concurrent use, so positions are written in order
+        states = await asyncio.gather(
+            *(
+                self._fetch_vault_state(user_address, collateral_address)
+                for collateral_address in collaterals
+            ),
+            return_exceptions=True,
+        )
+
+        for collateral_address, state in zip(collaterals, states):
+            if isinstance(state, Exception):
+                logger.error(
+                    f"Error updating Vault position for {user_address} "
+                    f"collateral {collateral_address}: {state}",
+                    exc_info=state,
+                )
+                continue
 
-        for position in positions:
             await self._update_vault_position(
-                user_address, position.collateral_address, session
+                user_address, collateral_address, session, state=state
             )
 
     async def _delete_vault_position(
@@ -328,7 +365,6 @@ class VaultEventHandler:
             VaultPosition.collateral_address == collateral_address,
         )
         await session.execute(stmt)
-        await session.commit()
 
         logger.info(
             f"Deleted Vault position for {user_address[:10]}... "
@@ -345,19 +381,15 @@ class VaultEventHandler:
         Returns:
             Asset symbol (e.g., "HYD", "USDC")
         """
+        # Cache asset symbols
+        if collateral_address in self.asset_symbols:
+            return self.asset_symbols[collateral_address]
+
         try:
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "symbol",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function",
-                }
-            ]
-
-            token = self.w3.eth.contract(address=collateral_address, abi=erc20_abi)
+            token = self.w3.eth.contract(address=collateral_address, abi=ERC20_ABI)
             symbol = await token.functions.symbol().call()
+
+            self.asset_symbols[collateral_address] = symbol
             return symbol
         except Exception as e:
             logger.warning(
@@ -400,7 +432,7 @@ class VaultEventHandler:
             ltv_bps = await self.vault.functions.collateralLTVRatio(
                 collateral_address
             ).call()
-            ltv_ratio = Decimal(ltv_bps) / Decimal(10000)
+            ltv_ratio = Decimal(ltv_bps) / BPS
 
             self.ltv_ratios[collateral_address] = ltv_ratio
             return ltv_ratio
@@ -429,7 +461,7 @@ class VaultEventHandler:
             threshold_bps = await self.vault.functions.liquidationThreshold(
                 collateral_address
             ).call()
-            threshold = Decimal(threshold_bps) / Decimal(10000)
+            threshold = Decimal(threshold_bps) / BPS
 
             self.liquidation_thresholds[collateral_address] = threshold
             return threshold
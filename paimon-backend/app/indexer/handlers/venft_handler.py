@@ -19,6 +19,9 @@ from app.models.indexer import VeNFTPosition
 
 logger = logging.getLogger(__name__)
 
+# 18-decimal token unit (built once, not per event)
+WAD = Decimal(10) ** 18
+
 
 class VeNFTEventHandler:
     """
@@ -141,80 +144,70 @@ class VeNFTEventHandler:
             user_address: Owner address
             session: Database session
         """
-        try:
-            # Query on-chain lock data
-            lock_data = await self.venft.functions.locked(token_id).call()
-            locked_amount = lock_data[0]  # amount
-            lock_end = lock_data[1]  # end timestamp
-
-            # If no lock, delete position
-            if locked_amount == 0:
-                await self._delete_venft_position(token_id, session)
-                return
-
-            # Calculate voting power (linear decay)
-            current_time = datetime.utcnow().timestamp()
-            voting_power = self._calculate_voting_power(
-                locked_amount, lock_end, current_time
+        # Query on-chain lock data
+        lock_data = await self.venft.functions.locked(token_id).call()
+        locked_amount = lock_data[0]  # amount
+        lock_end = lock_data[1]  # end timestamp
+
+        # If no lock, delete position
+        if locked_amount == 0:
+            await self._delete_venft_position(token_id, session)
+            return
+
+        # Calculate voting power (linear decay)
+        current_time = datetime.utcnow().timestamp()
+        voting_power = self._calculate_voting_power(
+            locked_amount, lock_end, current_time
+        )
+
+        # Calculate remaining days
+        remaining_seconds = max(0, lock_end - current_time)
+        remaining_days = int(remaining_seconds / 86400)
+
+        # Check if expired
+        is_expired = lock_end <= current_time
+
+        # Convert amounts
+        locked_amount_decimal = Decimal(locked_amount) / WAD
+        voting_power_decimal = voting_power / WAD
+
+        # Update or create position
+        stmt = select(VeNFTPosition).where(VeNFTPosition.token_id == token_id)
+        result = await session.execute(stmt)
+        position = result.scalar_one_or_none()
+
+        if position:
+            # Update existing position
+            position.user_address = user_address
+            position.locked_amount = locked_amount_decimal
+            position.lock_end = lock_end
+            position.voting_power = voting_power_decimal
+            position.remaining_days = remaining_days
+            position.is_expired = is_expired
+
+            logger.info(
+                f"Updated veNFT position tokenId={token_id} "
+                f"locked={locked_amount_decimal} vp={voting_power_decimal} "
+                f"days_left={remaining_days}"
+            )
+        else:
+            # Create new position
+            position = VeNFTPosition(
+                user_address=user_address,
+                token_id=token_id,
+                locked_amount=locked_amount_decimal,
+                lock_end=lock_end,
+                voting_power=voting_power_decimal,
+                remaining_days=remaining_days,
+                is_expired=is_expired,
             )
+            session.add(position)
 
-            # Calculate remaining days
-            remaining_seconds = max(0, lock_end - current_time)
-            remaining_days = int(remaining_seconds / 86400)
-
-            # Check if expired
-            is_expired = lock_end <= current_time
-
-            # Convert amounts
-            locked_amount_decimal = Decimal(locked_amount) / Decimal(10**18)
-            voting_power_decimal = voting_power / Decimal(10**18)
-
-            # Update or create position
-            stmt = select(VeNFTPosition).where(VeNFTPosition.token_id == token_id)
-            result = await session.execute(stmt)
-            position = result.scalar_one_or_none()
-
-            if position:
-                # Update existing position
-                position.user_address = user_address
-                position.locked_amount = locked_amount_decimal
-                position.lock_end = lock_end
-                position.voting_power = voting_power_decimal
-                position.remaining_days = remaining_days
-                position.is_expired = is_expired
-
-                logger.info(
-                    f"Updated veNFT position tokenId={token_id} "
-                    f"locked={locked_amount_decimal} vp={voting_power_decimal} "
-                    f"days_left={remaining_days}"
-                )
-            else:
-                # Create new position
-                position = VeNFTPosition(
-                    user_address=user_address,
-                    token_id=token_id,
-                    locked_amount=locked_amount_decimal,
-                    lock_end=lock_end,
-                    voting_power=voting_power_decimal,
-                    remaining_days=remaining_days,
-                    is_expired=is_expired,
-                )
-                session.add(position)
-
-                logger.info(
-                    f"Created veNFT position tokenId={token_id} "
-                    f"locked={locked_amount_decimal} vp={voting_power_decimal} "
-                    f"days_left={remaining_days}"
-                )
-
-            await session.commit()
-
-        except Exception as e:
-            logger.error(
-                f"Error updating veNFT position for token {token_id}: {e}",
-                exc_info=True,
+            logger.info(
+                f"Created veNFT position tokenId={token_id} "
+                f"locked={locked_amount_decimal} vp={voting_power_decimal} "
+                f"days_left={remaining_days}"
             )
-            await session.rollback()
 
     async def _delete_venft_position(
         self,
@@ -230,7 +223,6 @@ class VeNFTEventHandler:
         """
         stmt = delete(VeNFTPosition).where(VeNFTPosition.token_id == token_id)
         await session.execute(stmt)
-        await session.commit()
 
         logger.info(f"Deleted veNFT position tokenId={token_id}")
 
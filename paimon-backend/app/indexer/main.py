@@ -14,6 +14,7 @@ from web3 import AsyncWeb3, AsyncHTTPProvider
 from app.config.contracts import (
     DEX_FACTORY_ABI,
     DEX_PAIR_ABI,
+    ERC20_ABI,
     GAUGE_CONTROLLER_ABI,
     get_contract_address,
 )
@@ -112,20 +113,8 @@ async def main():
 
         # Get token symbols (simplified, assumes standard ERC20)
         try:
-            from web3 import Web3
-
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "symbol",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function",
-                }
-            ]
-
-            token0 = w3.eth.contract(address=token0_addr, abi=erc20_abi)
-            token1 = w3.eth.contract(address=token1_addr, abi=erc20_abi)
+            token0 = w3.eth.contract(address=token0_addr, abi=ERC20_ABI)
+            token1 = w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
 
             symbol0 = await token0.functions.symbol().call()
             symbol1 = await token1.functions.symbol().call()
@@ -0,0 +1,83 @@
+"""
+Multicall3 client for batching contract reads.
+
+Packs several view calls into one Multicall3.aggregate3 eth_call, so a
+position update costs a single RPC request and all values are read at
+the same block.
+"""
+
+from typing import Any, Optional, Sequence
+
+from eth_utils import function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+from web3 import AsyncWeb3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.async_contract import AsyncContractFunction
+
+from app.config.contracts import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+
+def _abi_types(params: Sequence[dict[str, Any]]) -> list[str]:
+    """ABI type strings of function inputs/outputs (tuples collapsed)."""
+    return [collapse_if_tuple(param) for param in params]
+
+
+class Multicall3:
+    """
+    Batches contract function calls through Multicall3.aggregate3.
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str = MULTICALL3_ADDRESS):
+        """
+        Initialize Multicall3 client.
+
+        Args:
+            w3: Web3 instance
+            address: Multicall3 contract address
+        """
+        self.w3 = w3
+        self.contract = w3.eth.contract(address=address, abi=MULTICALL3_ABI)
+
+    async def aggregate(
+        self,
+        calls: Sequence[AsyncContractFunction],
+        allow_failure: bool = False,
+    ) -> list[Any]:
+        """
+        Execute view calls in a single eth_call.
+
+        Args:
+            calls: Contract function calls with arguments bound,
+                e.g. pair.functions.balanceOf(user)
+            allow_failure: If False, any reverting call fails the whole batch;
+                if True, reverted calls yield None
+
+        Returns:
+            Decoded results in call order (single return values unwrapped,
+            as with ContractFunction.call())
+        """
+        codec = self.w3.codec
+        requests = []
+        for fn in calls:
+            call_data = function_abi_to_4byte_selector(fn.abi) + codec.encode(
+                _abi_types(fn.abi["inputs"]), fn.args
+            )
+            requests.append((fn.address, allow_failure, call_data))
+
+        responses = await self.contract.functions.aggregate3(requests).call()
+
+        results: list[Optional[Any]] = []
+        for fn, (success, return_data) in zip(calls, responses):
+            if not success:
+                results.append(None)
+                continue
+            output_types = _abi_types(fn.abi["outputs"])
+            # Same normalization as ContractFunction.call() (checksum addresses)
+            values = map_abi_data(
+                BASE_RETURN_NORMALIZERS,
+                output_types,
+                codec.decode(output_types, return_data),
+            )
+            results.append(values[0] if len(values) == 1 else list(values))
+        return results
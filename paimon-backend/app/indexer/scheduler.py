@@ -15,6 +15,7 @@ from web3 import AsyncWeb3, AsyncHTTPProvider
 from app.config.contracts import (
     DEX_FACTORY_ABI,
     DEX_PAIR_ABI,
+    ERC20_ABI,
     GAUGE_CONTROLLER_ABI,
     TREASURY_ABI,
     VAULT_ABI,
@@ -135,18 +136,8 @@ class IndexerScheduler:
                 token0_addr = await pair_contract.functions.token0().call()
                 token1_addr = await pair_contract.functions.token1().call()
 
-                erc20_abi = [
-                    {
-                        "constant": True,
-                        "inputs": [],
-                        "name": "symbol",
-                        "outputs": [{"name": "", "type": "string"}],
-                        "type": "function",
-                    }
-                ]
-
-                token0 = self.w3.eth.contract(address=token0_addr, abi=erc20_abi)
-                token1 = self.w3.eth.contract(address=token1_addr, abi=erc20_abi)
+                token0 = self.w3.eth.contract(address=token0_addr, abi=ERC20_ABI)
+                token1 = self.w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
 
                 symbol0 = await token0.functions.symbol().call()
                 symbol1 = await token1.functions.symbol().call()
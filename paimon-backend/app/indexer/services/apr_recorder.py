@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 
+from app.config.contracts import ERC20_ABI
 from app.models.historical import HistoricalAPR
 
 logger = logging.getLogger(__name__)
@@ -219,20 +220,9 @@ class APRRecorder:
         Returns:
             Pool name (e.g., "USDC/USDP")
         """
-        # ERC20 symbol ABI
-        erc20_abi = [
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "symbol",
-                "outputs": [{"name": "", "type": "string"}],
-                "type": "function",
-            }
-        ]
-
         try:
-            token0_contract = self.w3.eth.contract(address=token0, abi=erc20_abi)
-            token1_contract = self.w3.eth.contract(address=token1, abi=erc20_abi)
+            token0_contract = self.w3.eth.contract(address=token0, abi=ERC20_ABI)
+            token1_contract = self.w3.eth.contract(address=token1, abi=ERC20_ABI)
 
             symbol0 = await token0_contract.functions.symbol().call()
             symbol1 = await token1_contract.functions.symbol().call()
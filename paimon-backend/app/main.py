@@ -13,9 +13,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
-from app.core.config import settings
-from app.core.database import engine
-from app.core.cache import redis_client
+from app.core.config import get_settings
+from app.core.database import get_engine
+from app.core.cache import get_redis_client
+from app.core.social_oauth import close_http_client
 from app.routers import auth, user, kyc, features, tasks, points, referral, portfolio, historical, leaderboard, redemption, analytics, social_auth
 from app.websocket.events import sio
 
@@ -27,6 +28,8 @@ async def lifespan(app: FastAPI):
 
     Handles application initialization and cleanup.
     """
+    settings = get_settings()
+
     # Startup
     print(f"🚀 Starting {settings.PROJECT_NAME} v{settings.VERSION}")
     print(f"📝 Environment: {settings.ENVIRONMENT}")
@@ -37,13 +40,14 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print(f"👋 Shutting down {settings.PROJECT_NAME}")
+    await close_http_client()
 
 
 # Create FastAPI application
 app = FastAPI(
-    title=settings.PROJECT_NAME,
-    version=settings.VERSION,
-    description=settings.DESCRIPTION,
+    title=get_settings().PROJECT_NAME,
+    version=get_settings().VERSION,
+    description=get_settings().DESCRIPTION,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -60,7 +64,7 @@ app = FastAPI(
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origins=get_settings().ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -91,6 +95,7 @@ async def root():
     Returns:
         dict: API name, version, and status.
     """
+    settings = get_settings()
     return {
         "name": settings.PROJECT_NAME,
         "version": settings.VERSION,
@@ -123,7 +128,7 @@ async def health_check():
 
     # Check database connection
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             # Simple ping to verify connection
             await conn.execute(text("SELECT 1"))
             health_status["database"]["connected"] = True
@@ -134,7 +139,7 @@ async def health_check():
 
     # Check Redis connection
     try:
-        await redis_client.ping()
+        await get_redis_client().ping()
         health_status["redis"]["connected"] = True
     except Exception as e:
         health_status["redis"]["connected"] = False
@@ -157,7 +162,7 @@ async def generic_exception_handler(request, exc):
     Returns:
         JSONResponse: Error response with status 500.
     """
-    if settings.DEBUG:
+    if get_settings().DEBUG:
         # In debug mode, show full error details
         return JSONResponse(
             status_code=500,
@@ -186,6 +191,7 @@ socket_app = socketio.ASGIApp(sio, app)
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
         "app.main:socket_app",
         host="0.0.0.0",
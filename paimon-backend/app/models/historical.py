@@ -7,7 +7,7 @@ These models store APR trends and reward claims for portfolio analytics.
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Index, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import DateTime, Index, Numeric, PrimaryKeyConstraint, String, desc
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -24,11 +24,8 @@ class HistoricalAPR(Base):
 
     __tablename__ = "historical_apr"
 
-    # Primary key (auto-increment, INTEGER for SQLite compatibility)
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-
     # Pool identification
-    pool_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
+    pool_address: Mapped[str] = mapped_column(String(42), nullable=False)
     pool_name: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Time dimension (hypertable partition key)
@@ -44,10 +41,11 @@ class HistoricalAPR(Base):
     )
 
     __table_args__ = (
-        # Composite unique constraint (prevent duplicate snapshots)
-        UniqueConstraint("pool_address", "timestamp", name="uq_apr_pool_time"),
-        # Time-range query optimization
-        Index("idx_apr_time_pool", "timestamp", "pool_address"),
+        # Natural key (one snapshot per pool per timestamp); includes the
+        # hypertable time column as TimescaleDB requires
+        PrimaryKeyConstraint("pool_address", "timestamp", name="pk_historical_apr"),
+        # Per-pool time-range queries (also serves pool_address lookups)
+        Index("idx_historical_apr_pool_time", "pool_address", desc("timestamp")),
     )
 
     def __repr__(self) -> str:
@@ -64,12 +62,9 @@ class HistoricalRewards(Base):
 
     __tablename__ = "historical_rewards"
 
-    # Primary key (auto-increment, INTEGER for SQLite compatibility)
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-
     # User and pool identification
-    user_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
-    pool_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
+    user_address: Mapped[str] = mapped_column(String(42), nullable=False)
+    pool_address: Mapped[str] = mapped_column(String(42), nullable=False)
 
     # Time dimension (hypertable partition key)
     timestamp: Mapped[datetime] = mapped_column(
@@ -88,16 +83,16 @@ class HistoricalRewards(Base):
     )
 
     __table_args__ = (
-        # Composite unique constraint (prevent duplicate claims)
-        UniqueConstraint(
+        # Natural key (one claim per user/pool/type per timestamp)
+        PrimaryKeyConstraint(
             "user_address",
-            "timestamp",
             "pool_address",
             "reward_type",
-            name="uq_rewards_user_time_pool_type",
+            "timestamp",
+            name="pk_historical_rewards",
         ),
         # Time-range query optimization for user history
-        Index("idx_rewards_time_user", "timestamp", "user_address"),
+        Index("idx_historical_rewards_user_time", "user_address", desc("timestamp")),
         # Pool reward aggregation queries
         Index("idx_rewards_pool_time", "pool_address", "timestamp"),
     )
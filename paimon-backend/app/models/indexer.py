@@ -11,7 +11,9 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     DateTime,
+    Double,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     JSON,
@@ -19,6 +21,7 @@ from sqlalchemy import (
     String,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -38,7 +41,9 @@ class LPPosition(Base, TimestampMixin):
 
     __tablename__ = "lp_positions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), Identity(), primary_key=True
+    )
 
     # User relationship
     user_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
@@ -104,7 +109,9 @@ class VaultPosition(Base, TimestampMixin):
 
     __tablename__ = "vault_positions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), Identity(), primary_key=True
+    )
 
     # User relationship
     user_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
@@ -126,15 +133,15 @@ class VaultPosition(Base, TimestampMixin):
         Numeric(precision=78, scale=18), nullable=False, default=0
     )
 
-    # Risk metrics
+    # Risk metrics (computed ratios, stored as DOUBLE PRECISION)
     ltv_ratio: Mapped[Decimal] = mapped_column(
         Numeric(precision=10, scale=4), nullable=False
     )
     health_factor: Mapped[Decimal] = mapped_column(
-        Numeric(precision=20, scale=6), nullable=False
+        Double(asdecimal=True), nullable=False
     )
     liquidation_price: Mapped[Decimal] = mapped_column(
-        Numeric(precision=20, scale=8), nullable=False
+        Double(asdecimal=True), nullable=False
     )
 
     # Metadata
@@ -166,7 +173,9 @@ class VeNFTPosition(Base, TimestampMixin):
 
     __tablename__ = "venft_positions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), Identity(), primary_key=True
+    )
 
     # User relationship
     user_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)
@@ -195,7 +204,8 @@ class VeNFTPosition(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index('idx_venft_user', 'user_address'),
+        # Per-user positions and active-lock windows (lock_end > now)
+        Index('idx_venft_user_lock_end', 'user_address', 'lock_end'),
         Index('idx_venft_expiry', 'lock_end'),
         Index('idx_venft_token_id', 'token_id', unique=True),
     )
@@ -240,8 +250,10 @@ class PortfolioSummary(Base, TimestampMixin):
         Numeric(precision=20, scale=2), nullable=False, default=0
     )
 
-    # Risk alerts (JSON array)
-    risk_alerts: Mapped[dict] = mapped_column(JSON, nullable=False, default=list)
+    # Risk alerts (JSON array; JSONB + GIN index idx_portfolio_risk_alerts on PostgreSQL)
+    risk_alerts: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list
+    )
 
     # Cache control
     cache_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
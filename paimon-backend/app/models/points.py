@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Index,
     UniqueConstraint,
+    desc,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -54,6 +55,15 @@ class PointsBalance(Base, TimestampMixin):
         "PointsTransaction", back_populates="balance"
     )
 
+    __table_args__ = (
+        # Leaderboard top-N (ORDER BY total_earned DESC LIMIT N)
+        Index(
+            "idx_points_balance_leaderboard",
+            desc("total_earned"),
+            postgresql_include=["user_id"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<PointsBalance(user_id={self.user_id}, balance={self.balance})>"
 
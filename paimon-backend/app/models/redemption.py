@@ -12,9 +12,12 @@ from sqlalchemy import (
     BigInteger,
     DateTime,
     ForeignKey,
+    Identity,
+    Index,
     Integer,
     Numeric,
     String,
+    text,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -43,8 +46,19 @@ class PointsRedemption(Base, TimestampMixin):
     """
 
     __tablename__ = "points_redemptions"
+    __table_args__ = (
+        # Worker queue polling (partial index: actionable rows only)
+        Index(
+            "idx_redemptions_worker_queue",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')"),
+            sqlite_where=text("status IN ('PENDING', 'PROCESSING')"),
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), Identity(), primary_key=True
+    )
 
     # User relationship
     user_id: Mapped[int] = mapped_column(
@@ -59,7 +73,7 @@ class PointsRedemption(Base, TimestampMixin):
 
     # Transaction details
     status: Mapped[RedemptionStatus] = mapped_column(
-        SQLEnum(RedemptionStatus), default=RedemptionStatus.PENDING, nullable=False, index=True
+        SQLEnum(RedemptionStatus), default=RedemptionStatus.PENDING, nullable=False
     )
     transaction_hash: Mapped[str | None] = mapped_column(String(66), index=True)  # 0x + 64 hex chars
     block_number: Mapped[int | None] = mapped_column(BigInteger)
@@ -12,11 +12,13 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     Numeric,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy import (
     Enum as SQLEnum,
@@ -53,6 +55,13 @@ class TaskProgress(Base, TimestampMixin):
     __table_args__ = (
         # Ensure user cannot have duplicate task progress records
         UniqueConstraint("user_id", "task_id", name="uq_user_task"),
+        # Pending-task polling (partial index: PENDING rows only)
+        Index(
+            "idx_task_progress_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -73,7 +82,7 @@ class TaskProgress(Base, TimestampMixin):
 
     # Progress status
     status: Mapped[TaskStatus] = mapped_column(
-        SQLEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True
+        SQLEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False
     )
 
     # Task configuration (TaskOn API config, RWA verification rules, referral targets)
@@ -6,7 +6,7 @@ Stores user account information including wallet address and social login.
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -23,6 +23,10 @@ class User(Base, TimestampMixin):
     """User model for authentication and profile."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive address lookups (auth): lower(address) = :address
+        Index("ix_users_address_lower", text("lower(address)"), unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
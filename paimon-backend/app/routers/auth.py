@@ -12,7 +12,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.nonce import DEFAULT_NONCE_TTL, consume_nonce, generate_nonce, validate_nonce
+from app.core.nonce import DEFAULT_NONCE_TTL, generate_nonce, validate_and_consume_nonce
 from app.core.security import create_access_token, create_refresh_token
 from app.core.social_oauth import get_or_create_user, link_wallet_address, verify_oauth_token
 from app.core.wallet import verify_signature
@@ -53,8 +53,8 @@ async def get_nonce(address: str) -> NonceResponse:
             detail="Invalid Ethereum address format",
         )
 
-    # Generate nonce
-    nonce = await generate_nonce(address)
+    # Generate nonce (nonce keys use the lowercased address)
+    nonce = await generate_nonce(address.lower())
 
     return NonceResponse(nonce=nonce, address=address, expires_in=DEFAULT_NONCE_TTL)
 
@@ -65,11 +65,10 @@ async def login(request: LoginRequest, response: Response) -> TokenResponse:
     Authenticate user with wallet signature.
 
     Flow:
-    1. Validate nonce (check existence and not expired)
-    2. Verify signature matches address
-    3. Consume nonce (prevent reuse)
-    4. Generate JWT tokens
-    5. Set httpOnly cookie with refresh token
+    1. Verify signature matches address
+    2. Validate and consume nonce atomically (exists, not expired, single use)
+    3. Generate JWT tokens
+    4. Set httpOnly cookie with refresh token
 
     Args:
         request: Login request with address, message, signature, nonce.
@@ -90,16 +89,10 @@ async def login(request: LoginRequest, response: Response) -> TokenResponse:
             "nonce": "a1b2c3d4..."
         }
     """
-    # Step 1: Validate nonce
-    is_nonce_valid = await validate_nonce(request.address, request.nonce)
-
-    if not is_nonce_valid:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired nonce",
-        )
+    # Normalize once; nonce keys and the token subject use the lowercased address
+    address = request.address.lower()
 
-    # Step 2: Verify signature
+    # Step 1: Verify signature (local check, leaves the nonce usable on failure)
     is_signature_valid = verify_signature(
         message=request.message, signature=request.signature, expected_address=request.address
     )
@@ -110,23 +103,22 @@ async def login(request: LoginRequest, response: Response) -> TokenResponse:
             detail="Invalid signature",
         )
 
-    # Step 3: Consume nonce (prevent reuse)
-    consumed = await consume_nonce(request.address, request.nonce)
+    # Step 2: Validate and consume nonce in one Redis call (prevents reuse)
+    is_nonce_valid = await validate_and_consume_nonce(address, request.nonce)
 
-    if not consumed:
-        # Nonce was already consumed (double use attempt)
+    if not is_nonce_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Nonce already used",
+            detail="Invalid or expired nonce",
         )
 
-    # Step 4: Generate JWT tokens
-    token_data = {"sub": request.address}  # Subject = wallet address
+    # Step 3: Generate JWT tokens
+    token_data = {"sub": address}  # Subject = wallet address
 
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
 
-    # Step 5: Set httpOnly cookie with refresh token
+    # Step 4: Set httpOnly cookie with refresh token
     response.set_cookie(
         key="refresh_token",
         value=refresh_token,
@@ -10,10 +10,10 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
+from app.core.database import get_db
 from app.models.historical import HistoricalAPR, HistoricalRewards
 
 router = APIRouter(prefix="/api/v2/historical", tags=["historical"])
@@ -75,7 +75,7 @@ class RewardsHistoryResponse(BaseModel):
 async def get_apr_history(
     pool_address: str,
     period: str = Query("30d", regex="^(7d|30d|90d)$"),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> APRHistoryResponse:
     """
     Get APR history for a pool.
@@ -143,7 +143,8 @@ async def get_rewards_history(
     pool_address: Optional[str] = None,
     reward_type: Optional[str] = Query(None, regex="^(lp|debt|boost|ecosystem)$"),
     period: str = Query("30d", regex="^(7d|30d|90d)$"),
-    session: AsyncSession = Depends(get_db_session),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    session: AsyncSession = Depends(get_db),
 ) -> RewardsHistoryResponse:
     """
     Get rewards history for a user.
@@ -153,10 +154,12 @@ async def get_rewards_history(
         pool_address: Filter by pool (optional)
         reward_type: Filter by type (optional)
         period: Time period (7d, 30d, 90d)
+        limit: Return only the latest N rewards (optional)
         session: Database session
 
     Returns:
-        Rewards history with total earnings
+        Rewards history with total earnings over the whole period (not just
+        the returned rewards when limited)
     """
     # Normalize addresses
     user_address = user_address.lower()
@@ -167,26 +170,49 @@ async def get_rewards_history(
     period_days = {"7d": 7, "30d": 30, "90d": 90}[period]
     start_time = datetime.now(timezone.utc) - timedelta(days=period_days)
 
-    # Build query
-    stmt = select(HistoricalRewards).where(
+    # Build query: select only the columns carried by idx_historical_rewards_user_time
+    # and keep timestamp bare so ORDER BY ... LIMIT is served from the index
+    filters = [
         HistoricalRewards.user_address == user_address,
         HistoricalRewards.timestamp >= start_time,
-    )
+    ]
 
     if pool_address:
-        stmt = stmt.where(HistoricalRewards.pool_address == pool_address)
+        filters.append(HistoricalRewards.pool_address == pool_address)
 
     if reward_type:
-        stmt = stmt.where(HistoricalRewards.reward_type == reward_type)
+        filters.append(HistoricalRewards.reward_type == reward_type)
 
-    stmt = stmt.order_by(HistoricalRewards.timestamp.desc())
+    stmt = (
+        select(
+            HistoricalRewards.user_address,
+            HistoricalRewards.pool_address,
+            HistoricalRewards.timestamp,
+            HistoricalRewards.reward_type,
+            HistoricalRewards.amount,
+            HistoricalRewards.cumulative_amount,
+        )
+        .where(*filters)
+        .order_by(HistoricalRewards.timestamp.desc())
+    )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
     # Execute query
     result = await session.execute(stmt)
-    rewards = result.scalars().all()
-
-    # Calculate total earned
-    total_earned = sum((r.amount for r in rewards), Decimal("0"))
+    rewards = result.all()
+
+    # Calculate total earned over the period; a limited page only holds the
+    # latest rewards, so sum them in SQL over all matching rows
+    if limit is None:
+        total_earned = sum((r.amount for r in rewards), Decimal("0"))
+    else:
+        total_earned = await session.scalar(
+            select(func.coalesce(func.sum(HistoricalRewards.amount), 0)).where(
+                *filters
+            )
+        )
 
     return RewardsHistoryResponse(
         user_address=user_address,
@@ -200,7 +226,7 @@ async def get_rewards_history(
 
 @router.get("/apr/pools/all", response_model=List[APRSnapshot])
 async def get_latest_apr_all_pools(
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> List[APRSnapshot]:
     """
     Get latest APR snapshot for all pools.
@@ -15,9 +15,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
 from app.core.cache import cache
-from app.core.config import settings
+from app.core.config import get_settings
 from app.core.database import get_db
-from app.core.webhook_security import verify_blockpass_signature
+from app.core.webhook_security import verify_blockpass_signature_async
 from app.models.kyc import KYC, KYCStatus, KYCTier
 from app.models.user import User
 from app.schemas.kyc import (
@@ -97,7 +97,7 @@ async def blockpass_webhook(
         )
 
     # Verify signature
-    if not settings.BLOCKPASS_SECRET:
+    if not get_settings().BLOCKPASS_SECRET:
         logger.warning("BLOCKPASS_SECRET not configured, skipping signature verification")
     elif not x_hub_signature:
         logger.error("Missing X-Hub-Signature header")
@@ -108,10 +108,10 @@ async def blockpass_webhook(
     else:
         # Read raw request body for signature verification
         raw_body = await request.body()
-        is_valid = verify_blockpass_signature(
+        is_valid = await verify_blockpass_signature_async(
             payload_bytes=raw_body,
             signature_header=x_hub_signature,
-            secret=settings.BLOCKPASS_SECRET,
+            secret=get_settings().BLOCKPASS_SECRET,
         )
 
         if not is_valid:
@@ -1,14 +1,21 @@
 """Points Leaderboard API."""
 
+from datetime import datetime, UTC
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
+from app.core.cache import cache
 from app.core.database import get_db
 from app.models.user import User
 from app.models.points import PointsBalance
-from app.config.points_rules import LEADERBOARD_TOP_N
+from app.config.points_rules import (
+    LEADERBOARD_REDIS_KEY,
+    LEADERBOARD_SEEDED_KEY,
+    LEADERBOARD_TOP_N,
+)
 
 router = APIRouter(prefix="/api/leaderboard", tags=["Leaderboard"])
 
@@ -28,41 +35,104 @@ class LeaderboardResponse(BaseModel):
     updated_at: str
 
 
+async def _rebuild_leaderboard(db: AsyncSession) -> bool:
+    """
+    Seed the leaderboard sorted set from points_balance (cold start / Redis flush).
+
+    Scores are written with ZADD GT, so totals awarded after the snapshot was
+    read are never lowered. The seeded marker is set only after the ZADD
+    succeeds.
+
+    Returns:
+        True if the sorted set was seeded, False on Redis error.
+    """
+    result = await db.execute(
+        select(PointsBalance.user_id, PointsBalance.total_earned).where(
+            PointsBalance.total_earned > 0
+        )
+    )
+    seeded = await cache.zadd(
+        LEADERBOARD_REDIS_KEY,
+        {str(row.user_id): row.total_earned for row in result},
+        gt=True,
+    )
+    return seeded and await cache.set(LEADERBOARD_SEEDED_KEY, "1")
+
+
 @router.get("", response_model=LeaderboardResponse)
 async def get_leaderboard(
     limit: int = LEADERBOARD_TOP_N,
     db: AsyncSession = Depends(get_db),
 ) -> LeaderboardResponse:
-    """Get points leaderboard."""
-    from datetime import datetime, UTC
-
-    # Query top users by points
-    stmt = (
-        select(
-            PointsBalance.user_id,
-            PointsBalance.total_earned,
-            User.wallet_address,
-        )
-        .join(User, PointsBalance.user_id == User.id)
-        .order_by(PointsBalance.total_earned.desc())
-        .limit(limit)
-    )
+    """
+    Get points leaderboard.
+
+    Served from the Redis sorted set maintained by PointsService.award_points
+    (ZREVRANGE), falling back to an indexed SQL top-N when Redis is down.
+    The set is reseeded from the database whenever its seeded marker is
+    missing.
+    """
+    top = await cache.ztop(LEADERBOARD_REDIS_KEY, limit)
+
+    if top is not None and not await cache.exists(LEADERBOARD_SEEDED_KEY):
+        # Redis is up but the sorted set was never seeded (or was flushed):
+        # it may hold only users awarded since, so reseed from the database
+        if await _rebuild_leaderboard(db):
+            top = await cache.ztop(LEADERBOARD_REDIS_KEY, limit)
+        else:
+            top = None  # Partial set: serve from the database this time
 
-    result = await db.execute(stmt)
-    rows = result.all()
+    if top is not None:
+        # Resolve addresses for the top-N user ids in one query
+        user_ids = [int(member) for member, _ in top]
+        addresses = {}
+        if user_ids:
+            result = await db.execute(
+                select(User.id, User.address).where(User.id.in_(user_ids))
+            )
+            addresses = {row.id: row.address for row in result}
 
-    leaderboard = [
-        LeaderboardEntry(
-            rank=idx + 1,
-            user_address=row.wallet_address,
-            total_points=row.total_earned,
+        leaderboard = [
+            LeaderboardEntry(
+                rank=idx + 1,
+                user_address=addresses.get(user_id, ""),
+                total_points=int(score),
+            )
+            for idx, (user_id, (_, score)) in enumerate(zip(user_ids, top))
+        ]
+        total_users = await cache.zcard(LEADERBOARD_REDIS_KEY)
+    else:
+        # Query top users by points (idx_points_balance_leaderboard). Users
+        # without points are left out, as in the seeded sorted set.
+        stmt = (
+            select(
+                PointsBalance.user_id,
+                PointsBalance.total_earned,
+                User.address,
+            )
+            .join(User, PointsBalance.user_id == User.id)
+            .where(PointsBalance.total_earned > 0)
+            .order_by(PointsBalance.total_earned.desc())
+            .limit(limit)
         )
-        for idx, row in enumerate(rows)
-    ]
 
-    # Count total users
-    count_stmt = select(func.count(PointsBalance.user_id))
-    total_users = (await db.execute(count_stmt)).scalar() or 0
+        result = await db.execute(stmt)
+        rows = result.all()
+
+        leaderboard = [
+            LeaderboardEntry(
+                rank=idx + 1,
+                user_address=row.address,
+                total_points=row.total_earned,
+            )
+            for idx, row in enumerate(rows)
+        ]
+
+        # Count total users
+        count_stmt = select(func.count(PointsBalance.user_id)).where(
+            PointsBalance.total_earned > 0
+        )
+        total_users = (await db.execute(count_stmt)).scalar() or 0
 
     return LeaderboardResponse(
         leaderboard=leaderboard,
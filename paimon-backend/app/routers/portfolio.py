@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
+from app.core.database import get_db
 from app.models.indexer import (
     LPPosition,
     PortfolioSummary,
@@ -100,7 +100,7 @@ class PortfolioResponse(BaseModel):
 @router.get("/{address}", response_model=PortfolioResponse)
 async def get_portfolio(
     address: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> PortfolioResponse:
     """
     Get complete portfolio for address (cached data).
@@ -185,7 +185,7 @@ async def get_portfolio(
 @router.get("/{address}/lp", response_model=List[LPPositionResponse])
 async def get_lp_positions(
     address: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> List[LPPositionResponse]:
     """
     Get LP positions for address.
@@ -209,7 +209,7 @@ async def get_lp_positions(
 @router.get("/{address}/vault", response_model=List[VaultPositionResponse])
 async def get_vault_positions(
     address: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> List[VaultPositionResponse]:
     """
     Get Vault positions for address.
@@ -233,7 +233,7 @@ async def get_vault_positions(
 @router.get("/{address}/venft", response_model=List[VeNFTPositionResponse])
 async def get_venft_positions(
     address: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_db),
 ) -> List[VeNFTPositionResponse]:
     """
     Get veNFT positions for address.
@@ -12,7 +12,7 @@ from sqlalchemy import select, update
 import httpx
 
 from app.core.database import get_db
-from app.core.config import settings
+from app.core.config import get_settings
 from app.models.user import User
 
 
@@ -28,6 +28,7 @@ async def twitter_login_url():
 
     Returns redirect URL for user to authorize app.
     """
+    settings = get_settings()
     if not settings.TWITTER_CLIENT_ID:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
@@ -58,6 +59,7 @@ async def twitter_callback(
 
     Exchanges code for access token and retrieves user info.
     """
+    settings = get_settings()
     if not settings.TWITTER_CLIENT_ID or not settings.TWITTER_CLIENT_SECRET:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
@@ -122,7 +124,7 @@ async def discord_login_url():
 
     Returns redirect URL for user to authorize app.
     """
-    if not settings.DISCORD_BOT_TOKEN:
+    if not get_settings().DISCORD_BOT_TOKEN:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Discord OAuth not configured"
@@ -133,7 +135,7 @@ async def discord_login_url():
     oauth_url = (
         f"https://discord.com/api/oauth2/authorize"
         f"?client_id=YOUR_DISCORD_CLIENT_ID"
-        f"&redirect_uri={settings.ALLOWED_ORIGINS[0]}/api/social/discord/callback"
+        f"&redirect_uri={get_settings().ALLOWED_ORIGINS[0]}/api/social/discord/callback"
         f"&response_type=code"
         f"&scope=identify%20guilds"
     )
@@ -182,7 +184,7 @@ async def telegram_verify(
     Returns:
         Success message
     """
-    if not settings.TELEGRAM_BOT_TOKEN:
+    if not get_settings().TELEGRAM_BOT_TOKEN:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
             detail="Telegram Bot not configured"
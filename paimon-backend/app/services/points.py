@@ -12,6 +12,8 @@ from sqlalchemy import desc, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.points_rules import LEADERBOARD_REDIS_KEY
+from app.core.cache import cache
 from app.models.points import PointsBalance, PointsTransaction
 from app.models.user import User
 
@@ -128,6 +130,17 @@ class PointsService:
             logger.info(
                 f"Awarded {amount} points to user {user_id} (source: {source}, ref: {reference_id})"
             )
+
+            # Keep the leaderboard sorted set in step with total_earned. The
+            # absolute total is written with GT, so it never races a reseed
+            # (a stale snapshot can't lower it) and is correct even before
+            # the set is seeded.
+            await cache.zadd(
+                LEADERBOARD_REDIS_KEY,
+                {str(user_id): balance.total_earned},
+                gt=True,
+            )
+
             return transaction
 
         except IntegrityError as e:
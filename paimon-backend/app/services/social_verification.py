@@ -6,7 +6,7 @@ Verifies user completion of social tasks (Twitter, Discord, Telegram).
 
 import httpx
 from typing import Optional
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 class SocialVerificationService:
@@ -47,6 +47,7 @@ class SocialVerificationService:
         Requires:
             TWITTER_BEARER_TOKEN environment variable
         """
+        settings = get_settings()
         if not settings.TWITTER_BEARER_TOKEN:
             raise ValueError("TWITTER_BEARER_TOKEN not configured")
 
@@ -91,13 +92,13 @@ class SocialVerificationService:
         Returns:
             True if user retweeted, False otherwise
         """
-        if not settings.TWITTER_BEARER_TOKEN:
+        if not get_settings().TWITTER_BEARER_TOKEN:
             raise ValueError("TWITTER_BEARER_TOKEN not configured")
 
         try:
             response = await self.http_client.get(
                 f"https://api.twitter.com/2/tweets/{tweet_id}/retweeted_by",
-                headers={"Authorization": f"Bearer {settings.TWITTER_BEARER_TOKEN}"}
+                headers={"Authorization": f"Bearer {get_settings().TWITTER_BEARER_TOKEN}"}
             )
             response.raise_for_status()
 
@@ -123,13 +124,13 @@ class SocialVerificationService:
         Returns:
             True if user liked, False otherwise
         """
-        if not settings.TWITTER_BEARER_TOKEN:
+        if not get_settings().TWITTER_BEARER_TOKEN:
             raise ValueError("TWITTER_BEARER_TOKEN not configured")
 
         try:
             response = await self.http_client.get(
                 f"https://api.twitter.com/2/tweets/{tweet_id}/liking_users",
-                headers={"Authorization": f"Bearer {settings.TWITTER_BEARER_TOKEN}"}
+                headers={"Authorization": f"Bearer {get_settings().TWITTER_BEARER_TOKEN}"}
             )
             response.raise_for_status()
 
@@ -160,6 +161,7 @@ class SocialVerificationService:
         Requires:
             DISCORD_BOT_TOKEN environment variable
         """
+        settings = get_settings()
         if not settings.DISCORD_BOT_TOKEN:
             raise ValueError("DISCORD_BOT_TOKEN not configured")
 
@@ -204,6 +206,7 @@ class SocialVerificationService:
         Requires:
             TELEGRAM_BOT_TOKEN environment variable
         """
+        settings = get_settings()
         if not settings.TELEGRAM_BOT_TOKEN:
             raise ValueError("TELEGRAM_BOT_TOKEN not configured")
 
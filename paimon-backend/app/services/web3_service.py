@@ -12,7 +12,7 @@ from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import ContractLogicError
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ class Web3Service:
 
     def __init__(self):
         """Initialize Web3 service with RPC connection."""
+        settings = get_settings()
         self.w3 = Web3(Web3.HTTPProvider(settings.BSC_RPC_URL))
 
         if not self.w3.is_connected():
@@ -99,7 +100,7 @@ class Web3Service:
             # Sign transaction
             signed_txn = self.w3.eth.account.sign_transaction(
                 transaction,
-                private_key=settings.REDEMPTION_PRIVATE_KEY
+                private_key=get_settings().REDEMPTION_PRIVATE_KEY
             )
 
             # Send transaction
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from web3.exceptions import ContractLogicError
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.models.redemption import PointsRedemption, RedemptionStatus
 from app.models.user import User
 from app.services.web3_service import get_web3_service
@@ -34,7 +34,7 @@ class RedemptionProcessor:
         """Initialize redemption processor."""
         # Create async engine for background worker
         self.engine = create_async_engine(
-            settings.DATABASE_URL,
+            get_settings().DATABASE_URL,
             echo=False,
             pool_pre_ping=True,
         )
@@ -62,13 +62,15 @@ class RedemptionProcessor:
 
         async with self.async_session() as db:
             try:
-                # Query pending redemptions
+                # Query pending redemptions (served by idx_redemptions_worker_queue).
+                # SKIP LOCKED lets concurrent workers claim disjoint batches.
                 query = (
                     select(PointsRedemption)
                     .where(PointsRedemption.status == RedemptionStatus.PENDING)
                     .where(PointsRedemption.retry_count < MAX_RETRY_ATTEMPTS)
                     .order_by(PointsRedemption.created_at)
                     .limit(BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
                 )
 
                 result = await db.execute(query)
@@ -320,3 +320,23 @@ class TestTierBoundaries:
         data = response.json()
         assert data["tier"] == 0
         assert data["status"] == "expired"
+
+
+class TestKYCTierMapping:
+    """Test KYC record → tier mapping used by RequireTier."""
+
+    def test_no_record_is_tier_0(self):
+        """Users without a KYC record are Tier 0."""
+        from app.api.tier_auth import kyc_tier
+
+        assert kyc_tier(None) == 0
+
+    def test_only_approved_grants_tier(self):
+        """Non-approved records grant Tier 0 regardless of stored tier."""
+        from app.api.tier_auth import kyc_tier
+
+        approved = KYC(status=KYCStatus.APPROVED, tier=KYCTier.TIER_2)
+        pending = KYC(status=KYCStatus.PENDING, tier=KYCTier.TIER_2)
+
+        assert kyc_tier(approved) == 2
+        assert kyc_tier(pending) == 0
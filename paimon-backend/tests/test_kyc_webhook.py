@@ -20,7 +20,12 @@ from httpx import AsyncClient
 from sqlalchemy import select
 
 from app.core.config import settings
-from app.core.webhook_security import verify_blockpass_signature, generate_webhook_secret
+from app.core.webhook_security import (
+    HMAC_OFFLOAD_THRESHOLD,
+    generate_webhook_secret,
+    verify_blockpass_signature,
+    verify_blockpass_signature_async,
+)
 from app.models.kyc import KYC, KYCStatus, KYCTier
 from app.models.user import User
 
@@ -129,6 +134,18 @@ class TestSignatureVerification:
 
         assert is_valid is False
 
+    async def test_async_verification_large_payload(self):
+        """Should verify payloads above the offload threshold in a worker thread."""
+        payload = b"x" * (HMAC_OFFLOAD_THRESHOLD + 1)
+        signature = compute_signature(payload, TEST_WEBHOOK_SECRET)
+
+        assert await verify_blockpass_signature_async(
+            payload, signature, TEST_WEBHOOK_SECRET
+        ) is True
+        assert await verify_blockpass_signature_async(
+            payload, signature, "wrong-secret"
+        ) is False
+
     def test_generate_webhook_secret(self):
         """Should generate cryptographically secure secret."""
         secret1 = generate_webhook_secret()
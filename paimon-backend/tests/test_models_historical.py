@@ -44,7 +44,7 @@ class TestHistoricalAPR:
         await db_session.refresh(apr)
 
         # Assert
-        assert apr.id is not None
+        assert apr.pool_address == "0x1234567890123456789012345678901234567890"
         assert apr.apr == Decimal("25.5000")
         assert apr.tvl_usd == Decimal("1500000.00")
         assert apr.timestamp.tzinfo is not None  # Timezone-aware
@@ -176,7 +176,7 @@ class TestHistoricalRewards:
         await db_session.refresh(reward)
 
         # Assert
-        assert reward.id is not None
+        assert reward.reward_type == "lp"
         assert reward.amount == Decimal("125.500000000000000000")
         assert reward.cumulative_amount == Decimal("1250.750000000000000000")
 
@@ -12,6 +12,8 @@ Tests:
 
 import time
 from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException, status
@@ -168,7 +170,7 @@ class TestGetCurrentUserPerformance:
 class TestGetCurrentUserOptional:
     """Test get_current_user_optional FastAPI dependency."""
 
-    def test_get_current_user_optional_with_valid_token(self):
+    async def test_get_current_user_optional_with_valid_token(self):
         """Test optional dependency returns user with valid token."""
         from app.core.security import create_access_token
         from app.api.dependencies import get_current_user_optional
@@ -176,36 +178,218 @@ class TestGetCurrentUserOptional:
         data = {"sub": "0x1234567890abcdef"}
         token = create_access_token(data)
 
-        credentials = HTTPAuthorizationCredentials(
-            scheme="Bearer", credentials=token
-        )
-
-        user_data = get_current_user_optional(credentials)
+        user_data = await get_current_user_optional(f"Bearer {token}")
 
         assert user_data is not None
         assert user_data["sub"] == "0x1234567890abcdef"
 
-    def test_get_current_user_optional_without_token(self):
+    async def test_get_current_user_optional_without_token(self):
         """Test optional dependency returns None without token."""
         from app.api.dependencies import get_current_user_optional
 
         # No credentials provided
-        user_data = get_current_user_optional(None)
+        user_data = await get_current_user_optional(None)
 
         # Should return None, not raise exception
         assert user_data is None
 
-    def test_get_current_user_optional_with_invalid_token(self):
+    async def test_get_current_user_optional_with_invalid_token(self):
         """Test optional dependency returns None with invalid token."""
         from app.api.dependencies import get_current_user_optional
 
+        # Should return None, not raise exception
+        user_data = await get_current_user_optional("Bearer invalid.token")
+        assert user_data is None
+
+    async def test_get_current_user_optional_with_non_bearer_scheme(self):
+        """Test optional dependency ignores non-Bearer Authorization headers."""
+        from app.core.security import create_access_token
+        from app.api.dependencies import get_current_user_optional
+
+        token = create_access_token({"sub": "0x1234567890abcdef"})
+
+        assert await get_current_user_optional(f"Basic {token}") is None
+        assert await get_current_user_optional("Bearer") is None
+
+
+class TestLoadUserByAddress:
+    """Test address -> user id caching for user lookups."""
+
+    async def test_cache_miss_queries_by_address(self):
+        """Test first lookup queries by address and caches the user id."""
+        from app.core import security
+        from app.core.dependencies import load_user_by_address
+
+        security._user_cache.clear()
+        user = SimpleNamespace(id=7, address="0xmiss")
+        db = MagicMock()
+        db.get = AsyncMock()
+        db.scalar = AsyncMock(return_value=user)
+
+        assert await load_user_by_address(db, "0xmiss") is user
+        db.get.assert_not_awaited()
+        assert security.get_cached_user_id("0xmiss") == 7
+
+    async def test_cache_hit_uses_primary_key(self):
+        """Test cached address is resolved by primary key only."""
+        from app.core import security
+        from app.core.dependencies import load_user_by_address
+
+        security._user_cache.clear()
+        security.cache_user_id("0xhit", 3)
+        user = SimpleNamespace(id=3, address="0xhit")
+        db = MagicMock()
+        db.get = AsyncMock(return_value=user)
+        db.scalar = AsyncMock()
+
+        assert await load_user_by_address(db, "0xhit") is user
+        db.get.assert_awaited_once()
+        db.scalar.assert_not_awaited()
+
+    async def test_stale_mapping_falls_back_to_address(self):
+        """Test a cached id whose user no longer owns the address is ignored."""
+        from app.core import security
+        from app.core.dependencies import load_user_by_address
+
+        security._user_cache.clear()
+        security.cache_user_id("0xmoved", 3)
+        relinked = SimpleNamespace(id=3, address="0xother")
+        owner = SimpleNamespace(id=9, address="0xmoved")
+        db = MagicMock()
+        db.get = AsyncMock(return_value=relinked)
+        db.scalar = AsyncMock(return_value=owner)
+
+        assert await load_user_by_address(db, "0xmoved") is owner
+        assert security.get_cached_user_id("0xmoved") == 9
+
+    async def test_mixed_case_address_shares_cache_entry(self):
+        """Test checksummed and lowercase subjects resolve through one cache key."""
+        from app.core import security
+        from app.core.dependencies import load_user_by_address
+
+        security._user_cache.clear()
+        user = SimpleNamespace(id=5, address="0xAbCd")
+        db = MagicMock()
+        db.get = AsyncMock(return_value=user)
+        db.scalar = AsyncMock(return_value=user)
+
+        assert await load_user_by_address(db, "0xAbCd") is user
+        assert db.scalar.await_args.args[1] == {"address": "0xabcd"}
+        assert security.get_cached_user_id("0xabcd") == 5
+
+        assert await load_user_by_address(db, "0xABCD") is user
+        db.scalar.assert_awaited_once()
+
+
+class TestCurrentUserNotFoundStatus:
+    """Test the shared get_current_user implementation's unknown-user status."""
+
+    async def _call(self, dependency):
+        from app.core.security import create_access_token
+
+        token = create_access_token({"sub": "0xnobody"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        db = MagicMock()
+        db.get = AsyncMock(return_value=None)
+        db.scalar = AsyncMock(return_value=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(credentials, db)
+        return exc_info.value
+
+    async def test_core_dependency_raises_401(self):
+        """Test app.core get_current_user rejects unknown users with 401."""
+        from app.core.dependencies import get_current_user
+
+        exc = await self._call(get_current_user)
+        assert exc.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_api_dependency_raises_404(self):
+        """Test app.api get_current_user reports unknown users as 404."""
+        from app.api.dependencies import get_current_user
+
+        exc = await self._call(get_current_user)
+        assert exc.status_code == status.HTTP_404_NOT_FOUND
+        assert exc.detail == "User not found: 0xnobody"
+
+    async def test_api_dependency_invalid_token_detail(self):
+        """Test app.api get_current_user keeps its 401 detail for bad tokens."""
+        from app.api.dependencies import get_current_user
+
         credentials = HTTPAuthorizationCredentials(
-            scheme="Bearer", credentials="invalid.token"
+            scheme="Bearer", credentials="invalid.token.here"
         )
 
-        # Should return None, not raise exception
-        user_data = get_current_user_optional(credentials)
-        assert user_data is None
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials, MagicMock())
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Could not validate credentials"
+
+
+class TestTokenSubject:
+    """Test the token subject resolver shared by all auth dependencies."""
+
+    def test_wallet_subject_is_lowercased(self):
+        """Test a wallet address subject is returned lowercased."""
+        from app.core.dependencies import token_subject
+
+        assert token_subject({"sub": "0xAbCd"}) == "0xabcd"
+
+    def test_user_id_subject(self):
+        """Test "user_{id}" subjects and "user_id" claims resolve to ids."""
+        from app.core.dependencies import token_subject
+
+        assert token_subject({"sub": "user_42"}) == 42
+        assert token_subject({"sub": "0xabcd", "user_id": 7}) == 7
+
+    def test_missing_subject(self):
+        """Test a payload naming no user resolves to None."""
+        from app.core.dependencies import token_subject
+
+        assert token_subject({"name": "Test User"}) is None
+
+
+class TestGetCurrentUserWithKYC:
+    """Test get_current_user_with_kyc subject handling."""
+
+    async def _call(self, sub, row):
+        from app.api.dependencies import get_current_user_with_kyc
+        from app.core.security import create_access_token
+
+        token = create_access_token({"sub": sub})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        db = MagicMock()
+        db.execute = AsyncMock(
+            return_value=MagicMock(one_or_none=MagicMock(return_value=row))
+        )
+        return await get_current_user_with_kyc(credentials, db), db
+
+    async def test_user_id_subject_loads_by_id(self):
+        """Test a "user_{id}" token (accepted by get_current_user) is resolved."""
+        user, kyc = SimpleNamespace(id=42), SimpleNamespace(tier=1)
+
+        result, db = await self._call("user_42", SimpleNamespace(User=user, KYC=kyc))
+
+        assert result == (user, kyc)
+        assert db.execute.await_args.args[1] == {"user_id": 42}
+
+    async def test_wallet_subject_loads_by_address(self):
+        """Test a wallet token is resolved by lowercased address."""
+        user = SimpleNamespace(id=5)
+
+        result, db = await self._call("0xAbCd", SimpleNamespace(User=user, KYC=None))
+
+        assert result == (user, None)
+        assert db.execute.await_args.args[1] == {"address": "0xabcd"}
+
+    async def test_unknown_user_detail_includes_subject(self):
+        """Test an unknown user is a 404 naming the subject."""
+        with pytest.raises(HTTPException) as exc_info:
+            await self._call("0xnobody", None)
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert exc_info.value.detail == "User not found: 0xnobody"
 
 
 class TestAuthenticationSchemas:
@@ -0,0 +1,104 @@
+"""
+Unit tests for the blockchain event listener.
+
+Tests:
+1. Functional: Batches are scanned in order and progress is saved
+2. Error handling: Transient RPC errors are retried
+3. Error handling: A persistent log fetch failure stops the sync before the
+   failed batch
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.indexer import event_listener
+
+
+def _listener(monkeypatch, get_logs, current_block):
+    """EventListener over a mocked chain and database session."""
+    from app.indexer.event_listener import EventListener
+
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_db_session():
+        yield session
+
+    monkeypatch.setattr(event_listener, "get_db_session", fake_db_session)
+    monkeypatch.setattr(event_listener, "FETCH_LOGS_BACKOFF_SECONDS", 0)
+
+    async def block_number():
+        return current_block
+
+    w3 = MagicMock()
+    w3.eth.block_number = block_number()
+    w3.eth.get_logs = AsyncMock(side_effect=get_logs)
+
+    listener = EventListener(w3, "TestContract", MagicMock(address="0x" + "11" * 20))
+    listener._topic_filter = ["0x" + "22" * 32]
+    listener.load_state = AsyncMock()
+    listener.save_state = AsyncMock()
+    return listener
+
+
+class TestEventListenerSync:
+    """Test sync batching and checkpointing."""
+
+    async def test_sync_scans_all_batches(self, monkeypatch):
+        """Test every batch is fetched and the final block is saved."""
+        listener = _listener(monkeypatch, lambda params: [], current_block=2500)
+
+        await listener.sync(batch_size=1000)
+
+        ranges = [
+            (call.args[0]["fromBlock"], call.args[0]["toBlock"])
+            for call in listener.w3.eth.get_logs.await_args_list
+        ]
+        assert ranges == [(1, 1000), (1001, 2000), (2001, 2500)]
+        assert listener.save_state.await_args_list[-1].args[1:] == (2500,)
+        assert listener.save_state.await_args_list[-1].kwargs == {
+            "is_syncing": False
+        }
+
+    async def test_transient_fetch_error_is_retried(self, monkeypatch):
+        """Test a failed eth_getLogs attempt is retried and the batch scanned."""
+        failures = iter([TimeoutError("rate limited")])
+
+        def get_logs(params):
+            if params["fromBlock"] == 1001 and (error := next(failures, None)):
+                raise error
+            return []
+
+        listener = _listener(monkeypatch, get_logs, current_block=2500)
+
+        await listener.sync(batch_size=1000)
+
+        assert listener.w3.eth.get_logs.await_count == 4
+        assert listener.save_state.await_args_list[-1].args[1:] == (2500,)
+
+    async def test_failed_fetch_stops_before_failed_batch(self, monkeypatch):
+        """Test an RPC error is raised and progress stops before its batch."""
+
+        def get_logs(params):
+            if params["fromBlock"] == 2001:
+                raise ConnectionError("rpc unavailable")
+            return []
+
+        listener = _listener(monkeypatch, get_logs, current_block=3500)
+
+        with pytest.raises(ConnectionError):
+            await listener.sync(batch_size=1000)
+
+        failed_attempts = [
+            call
+            for call in listener.w3.eth.get_logs.await_args_list
+            if call.args[0]["fromBlock"] == 2001
+        ]
+        assert len(failed_attempts) == event_listener.FETCH_LOGS_ATTEMPTS
+
+        final_save = listener.save_state.await_args_list[-1]
+        assert final_save.args[1:] == (2000,)
+        assert final_save.kwargs == {"is_syncing": False}
@@ -0,0 +1,82 @@
+"""
+Unit tests for the historical rewards endpoint.
+
+Tests:
+1. Functional: limit returns only the latest rewards
+2. Functional: total_earned covers the whole period regardless of limit
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.models.historical import HistoricalRewards
+
+USER = "0x" + "ab" * 20
+POOL = "0x" + "cd" * 20
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database session with three rewards for USER."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        now = datetime.now(timezone.utc)
+        session.add_all(
+            HistoricalRewards(
+                user_address=USER,
+                pool_address=POOL,
+                timestamp=now - timedelta(days=days_ago),
+                reward_type="lp",
+                amount=Decimal(amount),
+                cumulative_amount=Decimal(0),
+            )
+            for days_ago, amount in [(1, "3.5"), (2, "2"), (3, "1.25")]
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+class TestRewardsHistory:
+    """Test GET /api/v2/historical/rewards/{user_address}."""
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_latest_rewards(self, db):
+        """Test limit keeps only the most recent rewards."""
+        from app.routers.historical import get_rewards_history
+
+        response = await get_rewards_history(
+            USER, pool_address=None, reward_type=None, period="7d", limit=2, session=db
+        )
+
+        assert [r.amount for r in response.rewards] == [Decimal("3.5"), Decimal("2")]
+
+    @pytest.mark.asyncio
+    async def test_total_earned_independent_of_limit(self, db):
+        """Test total_earned sums the whole period, not the returned page."""
+        from app.routers.historical import get_rewards_history
+
+        totals = [
+            (
+                await get_rewards_history(
+                    USER,
+                    pool_address=None,
+                    reward_type=None,
+                    period="7d",
+                    limit=limit,
+                    session=db,
+                )
+            ).total_earned
+            for limit in (None, 1, 2)
+        ]
+
+        assert totals == [Decimal("6.75")] * 3
@@ -0,0 +1,94 @@
+"""
+Unit tests for the indexer event handlers.
+
+Tests:
+1. Import: Handler modules and the indexer package import cleanly
+2. Functional: LTV/threshold basis points convert to ratios and are cached
+3. Functional: Liquidity USD for stablecoin pairs
+4. Boundary: RPC errors fall back to default ratios without caching
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from web3 import AsyncWeb3
+
+
+def _vault_handler(**view_results):
+    """VaultEventHandler with vault view functions returning the given values."""
+    from app.indexer.handlers.vault_handler import VaultEventHandler
+
+    vault = MagicMock()
+    for name, result in view_results.items():
+        if isinstance(result, Exception):
+            call = AsyncMock(side_effect=result)
+        else:
+            call = AsyncMock(return_value=result)
+        getattr(vault.functions, name).return_value.call = call
+    return VaultEventHandler(w3=AsyncWeb3(), vault_contract=vault), vault
+
+
+class TestIndexerImports:
+    """Test indexer modules import (module-level constants evaluate)."""
+
+    def test_import_indexer_package(self):
+        """Test the indexer package and all handlers import."""
+        from app.indexer import DEXEventHandler, EventListener  # noqa: F401
+        from app.indexer.handlers import dex_handler, vault_handler, venft_handler
+
+        assert vault_handler.BPS == Decimal(10000)
+        assert vault_handler.WAD == dex_handler.WAD == venft_handler.WAD == Decimal(
+            10**18
+        )
+
+
+class TestVaultRatios:
+    """Test vault LTV ratio and liquidation threshold lookups."""
+
+    async def test_ltv_and_threshold_from_basis_points(self):
+        """Test basis points are converted to ratios."""
+        handler, _ = _vault_handler(
+            collateralLTVRatio=8000, liquidationThreshold=8500
+        )
+
+        assert await handler._get_ltv_ratio("0xabc") == Decimal("0.8")
+        assert await handler._get_liquidation_threshold("0xabc") == Decimal("0.85")
+
+    async def test_ratios_are_cached(self):
+        """Test a second lookup does not query the vault again."""
+        handler, vault = _vault_handler(collateralLTVRatio=7500)
+
+        await handler._get_ltv_ratio("0xabc")
+        await handler._get_ltv_ratio("0xabc")
+
+        assert vault.functions.collateralLTVRatio.return_value.call.await_count == 1
+
+    async def test_rpc_error_falls_back_to_defaults(self):
+        """Test RPC errors return default ratios and are not cached."""
+        handler, _ = _vault_handler(
+            collateralLTVRatio=RuntimeError("rpc down"),
+            liquidationThreshold=RuntimeError("rpc down"),
+        )
+
+        assert await handler._get_ltv_ratio("0xabc") == Decimal("0.80")
+        assert await handler._get_liquidation_threshold("0xabc") == Decimal("0.85")
+        assert handler.ltv_ratios == {}
+        assert handler.liquidation_thresholds == {}
+
+
+class TestDEXLiquidity:
+    """Test DEX liquidity USD calculation."""
+
+    async def test_stablecoin_pair_sums_amounts(self):
+        """Test a stablecoin/stablecoin pair sums both sides."""
+        from app.indexer.handlers.dex_handler import DEXEventHandler
+
+        handler = DEXEventHandler(
+            w3=AsyncWeb3(), pair_contracts={}, gauge_controller=MagicMock()
+        )
+
+        liquidity = await handler._calculate_liquidity_usd(
+            "USDC", "USDP", Decimal(10**18), Decimal(2 * 10**18)
+        )
+
+        assert liquidity == Decimal("3.00")
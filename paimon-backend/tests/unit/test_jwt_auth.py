@@ -13,8 +13,8 @@ Tests:
 import time
 from datetime import datetime, timedelta, UTC
 
+import jwt
 import pytest
-from jose import jwt, JWTError
 
 
 class TestJWTGeneration:
@@ -239,6 +239,43 @@ class TestRefreshTokenMechanism:
         assert new_token is None
 
 
+class TestTokenDecodeCache:
+    """Test verified-token payload caching."""
+
+    async def test_repeated_token_skips_verification(self, monkeypatch):
+        """Test second decode of the same token is served from cache."""
+        from app.core import security
+
+        token = security.create_access_token({"sub": "0xcached"})
+        security._token_cache.clear()
+
+        assert (await security.decode_token_cached(token))["sub"] == "0xcached"
+
+        # Verification must not run again for a cached token
+        monkeypatch.setattr(security, "decode_token", lambda _: None)
+        assert (await security.decode_token_cached(token))["sub"] == "0xcached"
+
+    async def test_invalid_token_not_cached(self):
+        """Test failed verification is not stored in the cache."""
+        from app.core import security
+
+        security._token_cache.clear()
+
+        assert await security.decode_token_cached("invalid.token.here") is None
+        assert len(security._token_cache) == 0
+
+    def test_cache_entry_capped_at_token_exp(self):
+        """Test cached payload never outlives the token's exp claim."""
+        from app.core import security
+
+        now = 1000.0
+        expiring = {"sub": "0x1234", "exp": time.time() + 5}
+        long_lived = {"sub": "0x1234", "exp": time.time() + 3600}
+
+        assert security._token_ttu(b"k", expiring, now) <= now + 5
+        assert security._token_ttu(b"k", long_lived, now) == now + security.TOKEN_CACHE_TTL
+
+
 class TestJWTPerformance:
     """Test JWT operations performance."""
 
@@ -0,0 +1,167 @@
+"""
+Unit tests for the Redis-backed points leaderboard.
+
+Tests:
+1. Cold start: an award before the first read does not leave a one-user set
+2. Flush: the set is reseeded after Redis loses it
+3. Boundary: no users with points is served from Redis once seeded
+4. Concurrency: a reseed never lowers a newer awarded total
+5. Fallback: the SQL path counts the same users as the sorted set
+"""
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config.points_rules import LEADERBOARD_REDIS_KEY, LEADERBOARD_SEEDED_KEY
+from app.models.base import Base
+from app.models.points import PointsBalance
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    """Create a Redis client for testing."""
+    from app.core.config import settings
+
+    client = aioredis.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=True,
+    )
+    await client.delete(LEADERBOARD_REDIS_KEY, LEADERBOARD_SEEDED_KEY)
+    yield client
+    await client.delete(LEADERBOARD_REDIS_KEY, LEADERBOARD_SEEDED_KEY)
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def leaderboard_cache(redis_client):
+    """Point the shared cache helper at the test Redis client."""
+    from app.core.cache import cache
+
+    cache.client = redis_client
+    yield cache
+    cache._client = None
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database session with all tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+async def _create_user(db: AsyncSession, index: int, total_earned: int) -> User:
+    """Create a user with a points balance."""
+    user = User(address=f"0x{index:040x}", referral_code=f"LB{index:06d}")
+    db.add(user)
+    await db.flush()
+    db.add(
+        PointsBalance(user_id=user.id, balance=total_earned, total_earned=total_earned)
+    )
+    await db.commit()
+    return user
+
+
+class TestLeaderboardSeeding:
+    """Test the sorted set is seeded from points_balance when needed."""
+
+    @pytest.mark.asyncio
+    async def test_award_before_first_read_keeps_all_users(
+        self, db, leaderboard_cache
+    ):
+        """Test a cold-cache award does not hide users without recent awards."""
+        from app.routers.leaderboard import get_leaderboard
+        from app.services.points import PointsService
+
+        alice = await _create_user(db, 1, 100)
+        bob = await _create_user(db, 2, 50)
+
+        await PointsService(db).award_points(bob.id, 80, "test", "cold-start")
+
+        response = await get_leaderboard(limit=10, db=db)
+
+        assert [(e.user_address, e.total_points) for e in response.leaderboard] == [
+            (bob.address, 130),
+            (alice.address, 100),
+        ]
+        assert response.total_users == 2
+
+    @pytest.mark.asyncio
+    async def test_reseed_after_flush(self, db, leaderboard_cache, redis_client):
+        """Test the set is rebuilt after Redis loses it."""
+        from app.routers.leaderboard import get_leaderboard
+        from app.services.points import PointsService
+
+        alice = await _create_user(db, 1, 100)
+        bob = await _create_user(db, 2, 50)
+        await get_leaderboard(limit=10, db=db)
+
+        # Simulate FLUSHDB, then an award lands before the next read
+        await redis_client.delete(LEADERBOARD_REDIS_KEY, LEADERBOARD_SEEDED_KEY)
+        await PointsService(db).award_points(bob.id, 10, "test", "after-flush")
+
+        response = await get_leaderboard(limit=10, db=db)
+
+        assert [(e.user_address, e.total_points) for e in response.leaderboard] == [
+            (alice.address, 100),
+            (bob.address, 60),
+        ]
+        assert response.total_users == 2
+
+    @pytest.mark.asyncio
+    async def test_no_points_is_seeded_once(self, db, leaderboard_cache, redis_client):
+        """Test an empty leaderboard marks the set seeded (no rebuild per request)."""
+        from app.routers.leaderboard import get_leaderboard
+
+        response = await get_leaderboard(limit=10, db=db)
+
+        assert response.leaderboard == []
+        assert response.total_users == 0
+        assert await redis_client.exists(LEADERBOARD_SEEDED_KEY)
+
+    @pytest.mark.asyncio
+    async def test_reseed_does_not_lower_newer_total(
+        self, db, leaderboard_cache, redis_client
+    ):
+        """Test a stale snapshot cannot overwrite a total written after it."""
+        from app.routers.leaderboard import _rebuild_leaderboard
+
+        alice = await _create_user(db, 1, 100)
+        await redis_client.zadd(LEADERBOARD_REDIS_KEY, {str(alice.id): 150})
+
+        assert await _rebuild_leaderboard(db)
+
+        assert await redis_client.zscore(LEADERBOARD_REDIS_KEY, str(alice.id)) == 150
+
+
+class TestLeaderboardFallback:
+    """Test the SQL fallback used while Redis is down."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_skips_users_without_points(self, db, monkeypatch):
+        """Test total_users matches the sorted set, which only holds earners."""
+        from app.core.cache import cache
+        from app.routers.leaderboard import get_leaderboard
+
+        async def redis_down(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(cache, "ztop", redis_down)
+        alice = await _create_user(db, 1, 100)
+        await _create_user(db, 2, 0)
+
+        response = await get_leaderboard(limit=10, db=db)
+
+        assert [(e.user_address, e.total_points) for e in response.leaderboard] == [
+            (alice.address, 100),
+        ]
+        assert response.total_users == 1
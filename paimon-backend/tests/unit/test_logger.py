@@ -21,24 +21,36 @@ class TestLoggerConfiguration:
 
     def test_logger_has_console_handler(self):
         """Test logger has console handler for stdout."""
+        from app.core.logger import get_log_handlers
 
-        # Get root logger which has all handlers
-        root_logger = logging.getLogger()
+        # Handlers are fed by the root logger's queue
         console_handlers = [
             h
-            for h in root_logger.handlers
+            for h in get_log_handlers()
             if isinstance(h, logging.StreamHandler)
             and not isinstance(h, logging.handlers.RotatingFileHandler)
         ]
         assert len(console_handlers) > 0
 
+    def test_root_logger_only_enqueues(self):
+        """Test root logger hands records to a queue instead of writing directly."""
+        root_logger = logging.getLogger()
+        assert any(
+            isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers
+        )
+        assert not any(
+            isinstance(h, logging.handlers.RotatingFileHandler)
+            for h in root_logger.handlers
+        )
+
     def test_logger_has_file_handler(self):
         """Test logger has file handler for log files."""
-        # Get root logger which has all handlers
-        root_logger = logging.getLogger()
+        from app.core.logger import get_log_handlers
+
+        # Handlers are fed by the root logger's queue
         file_handlers = [
             h
-            for h in root_logger.handlers
+            for h in get_log_handlers()
             if isinstance(h, logging.handlers.RotatingFileHandler)
         ]
         assert len(file_handlers) > 0
@@ -59,13 +71,14 @@ class TestLoggerFunctionality:
 
     def test_logger_info_level(self, tmp_path):
         """Test logger logs INFO level messages."""
-        from app.core.logger import get_logger, setup_logging
+        from app.core.logger import flush_logs, get_logger, setup_logging
 
         log_file = tmp_path / "info.log"
         setup_logging(log_file=str(log_file), log_level="INFO")
 
         logger = get_logger(__name__)
         logger.info("Test INFO message")
+        flush_logs()
 
         # Read log file
         log_content = log_file.read_text()
@@ -74,13 +87,14 @@ class TestLoggerFunctionality:
 
     def test_logger_debug_level(self, tmp_path):
         """Test logger logs DEBUG level messages."""
-        from app.core.logger import get_logger, setup_logging
+        from app.core.logger import flush_logs, get_logger, setup_logging
 
         log_file = tmp_path / "debug.log"
         setup_logging(log_file=str(log_file), log_level="DEBUG")
 
         logger = get_logger(__name__)
         logger.debug("Test DEBUG message")
+        flush_logs()
 
         log_content = log_file.read_text()
         assert "Test DEBUG message" in log_content
@@ -88,13 +102,14 @@ class TestLoggerFunctionality:
 
     def test_logger_warning_level(self, tmp_path):
         """Test logger logs WARNING level messages."""
-        from app.core.logger import get_logger, setup_logging
+        from app.core.logger import flush_logs, get_logger, setup_logging
 
         log_file = tmp_path / "warning.log"
         setup_logging(log_file=str(log_file), log_level="WARNING")
 
         logger = get_logger(__name__)
         logger.warning("Test WARNING message")
+        flush_logs()
 
         log_content = log_file.read_text()
         assert "Test WARNING message" in log_content
@@ -102,13 +117,14 @@ class TestLoggerFunctionality:
 
     def test_logger_error_level(self, tmp_path):
         """Test logger logs ERROR level messages."""
-        from app.core.logger import get_logger, setup_logging
+        from app.core.logger import flush_logs, get_logger, setup_logging
 
         log_file = tmp_path / "error.log"
         setup_logging(log_file=str(log_file), log_level="ERROR")
 
         logger = get_logger(__name__)
         logger.error("Test ERROR message")
+        flush_logs()
 
         log_content = log_file.read_text()
         assert "Test ERROR message" in log_content
@@ -120,11 +136,12 @@ class TestLoggerRotation:
 
     def test_log_rotation_configured(self):
         """Test logger has rotation configured."""
-        # Get root logger which has all handlers
-        root_logger = logging.getLogger()
+        from app.core.logger import get_log_handlers
+
+        # Handlers are fed by the root logger's queue
         rotating_handlers = [
             h
-            for h in root_logger.handlers
+            for h in get_log_handlers()
             if isinstance(h, logging.handlers.RotatingFileHandler)
         ]
 
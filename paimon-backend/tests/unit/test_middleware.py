@@ -165,3 +165,84 @@ class TestMiddlewareExclusions:
         docs_response = client.get("/docs")
         # OpenAPI docs should be accessible
         assert docs_response.status_code in [200, 404]  # 404 if not configured yet
+
+    def test_already_wrapped_response_not_rewrapped(self):
+        """Test responses that already carry 'success' are returned unchanged."""
+        from app.core.middleware import setup_middleware
+
+        app = FastAPI()
+        setup_middleware(app)
+
+        @app.get("/test-prewrapped")
+        def test_prewrapped():
+            return {"success": True, "data": {"id": 1}}
+
+        client = TestClient(app)
+        response = client.get("/test-prewrapped")
+
+        assert response.json() == {"success": True, "data": {"id": 1}}
+
+
+class TestMiddlewareFallbackWrapping:
+    """Test JSON responses not rendered by WrappedORJSONResponse are wrapped."""
+
+    def test_route_registered_before_setup_is_wrapped(self):
+        """Test routes added before setup_middleware() still get the envelope."""
+        from app.core.middleware import setup_middleware
+
+        app = FastAPI()
+
+        @app.get("/test-early")
+        def test_early():
+            return {"a": 1}
+
+        setup_middleware(app)
+
+        client = TestClient(app)
+        data = client.get("/test-early").json()
+
+        assert data["success"] is True
+        assert data["data"] == {"a": 1}
+        assert isinstance(data["request_id"], str)
+
+    def test_explicit_json_response_is_wrapped(self):
+        """Test an explicit JSONResponse keeps its status and headers and is wrapped."""
+        from fastapi.responses import JSONResponse
+
+        from app.core.middleware import setup_middleware
+
+        app = FastAPI()
+        setup_middleware(app)
+
+        @app.get("/test-explicit")
+        def test_explicit():
+            return JSONResponse({"c": 3}, status_code=202, headers={"X-Test": "1"})
+
+        client = TestClient(app)
+        response = client.get("/test-explicit")
+
+        data = response.json()
+        assert response.status_code == 202
+        assert response.headers["x-test"] == "1"
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert data["success"] is True
+        assert data["data"] == {"c": 3}
+
+    def test_explicit_error_json_response_not_wrapped(self):
+        """Test explicit error responses pass through unchanged."""
+        from fastapi.responses import JSONResponse
+
+        from app.core.middleware import setup_middleware
+
+        app = FastAPI()
+        setup_middleware(app)
+
+        @app.get("/test-explicit-error")
+        def test_explicit_error():
+            return JSONResponse({"detail": "nope"}, status_code=409)
+
+        client = TestClient(app)
+        response = client.get("/test-explicit-error")
+
+        assert response.status_code == 409
+        assert response.json() == {"detail": "nope"}
@@ -15,6 +15,15 @@ import time
 import pytest
 
 
+@pytest.fixture(autouse=True)
+async def fresh_nonce_pool():
+    """Drop pooled Redis connections after each test (new event loop per test)."""
+    yield
+    from app.core.nonce import reset_pool
+
+    await reset_pool()
+
+
 class TestNonceGeneration:
     """Test nonce generation."""
 
@@ -162,6 +171,19 @@ class TestNonceConsumption:
 
         assert consumed is False
 
+    @pytest.mark.asyncio
+    async def test_validate_and_consume_nonce_single_use(self):
+        """Test atomic validate+consume accepts a nonce exactly once."""
+        from app.core.nonce import generate_nonce, validate_and_consume_nonce, validate_nonce
+
+        address = "0x1234567890abcdef1234567890abcdef12345678"
+
+        nonce = await generate_nonce(address)
+
+        assert await validate_and_consume_nonce(address, nonce) is True
+        assert await validate_nonce(address, nonce) is False
+        assert await validate_and_consume_nonce(address, nonce) is False
+
 
 class TestNonceExpiration:
     """Test nonce expiration."""
@@ -88,6 +88,55 @@ class TestRedisBasicOperations:
         # Cleanup
         await redis_cache.delete(key)
 
+    @pytest.mark.asyncio
+    async def test_set_many_and_get_many(self, redis_cache):
+        """Test batched set/get keeps key order and reports misses."""
+        mapping = {"test_key_many_1": "a", "test_key_many_2": "b"}
+
+        # Set values in one pipeline
+        assert await redis_cache.set_many(mapping, ttl=timedelta(seconds=60))
+
+        # Get values (plus one missing key) in one MGET
+        result = await redis_cache.get_many(
+            ["test_key_many_2", "test_key_many_missing", "test_key_many_1"]
+        )
+        assert result == ["b", None, "a"]
+
+        # Cleanup
+        for key in mapping:
+            await redis_cache.delete(key)
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_json_many(self, redis_cache):
+        """Test batched JSON set/get."""
+        mapping = {
+            "test_key_json_many_1": {"rank": 1, "points": 500},
+            "test_key_json_many_2": {"rank": 2, "points": 300},
+        }
+
+        await redis_cache.set_json_many(mapping)
+
+        result = await redis_cache.get_json_many(list(mapping) + ["test_key_json_many_missing"])
+        assert result == [mapping["test_key_json_many_1"], mapping["test_key_json_many_2"], None]
+
+        # Cleanup
+        for key in mapping:
+            await redis_cache.delete(key)
+
+    @pytest.mark.asyncio
+    async def test_sorted_set_top_n(self, redis_cache):
+        """Test sorted set increments and top-N read (leaderboard)."""
+        key = "test_key_zset"
+
+        await redis_cache.zadd(key, {"1": 10, "2": 50})
+        await redis_cache.zincrby(key, 45, "1")
+
+        assert await redis_cache.ztop(key, 2) == [("1", 55.0), ("2", 50.0)]
+        assert await redis_cache.zcard(key) == 2
+
+        # Cleanup
+        await redis_cache.delete(key)
+
     @pytest.mark.asyncio
     async def test_delete_key(self, redis_client):
         """Test deleting a key."""
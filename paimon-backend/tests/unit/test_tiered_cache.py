@@ -0,0 +1,164 @@
+"""
+Unit tests for the tiered cache.
+
+Tests:
+1. Functional: Expired entries are evicted on insert, bulk L1/L2 lookups
+2. Boundary: Nothing expired, every entry expired, cached L2 misses
+3. Compatibility: Size accounting matches cachetools.TTLCache, whose private
+   attributes FastTTLCache relies on still exist
+4. Concurrency: Concurrent misses share one producer call
+"""
+
+from cachetools import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFastTTLCache:
+    """Test FastTTLCache expiry matches TTLCache."""
+
+    def _pair(self, maxsize=10, ttl=10):
+        from app.core.tiered_cache import FastTTLCache
+
+        timer = FakeTimer()
+        fast = FastTTLCache(maxsize, ttl, timer=timer)
+        reference = TTLCache(maxsize, ttl, timer=timer)
+        return timer, fast, reference
+
+    def test_expire_evicts_only_expired_entries(self):
+        """Test sweep removes expired items and keeps fresh ones."""
+        timer, fast, reference = self._pair()
+
+        for cache in (fast, reference):
+            cache["a"] = 1
+        timer.now = 5
+        for cache in (fast, reference):
+            cache["b"] = 2
+        timer.now = 12
+        for cache in (fast, reference):
+            cache["c"] = 3
+
+        assert dict(fast.items()) == dict(reference.items()) == {"b": 2, "c": 3}
+        assert fast.currsize == reference.currsize == 2
+
+    def test_expire_all_and_reuse(self):
+        """Test cache stays consistent after every entry expires."""
+        timer, fast, _ = self._pair()
+
+        fast["a"] = 1
+        fast["b"] = 2
+        timer.now = 100
+        fast.expire()
+
+        assert len(fast) == 0
+        assert fast.currsize == 0
+
+        fast["a"] = 3
+        assert fast["a"] == 3
+        assert fast.currsize == 1
+
+    def test_cachetools_internals_present(self):
+        """Test the private cachetools attributes expire() relies on exist."""
+        timer, fast, _ = self._pair()
+        fast["a"] = 1
+
+        for name in (
+            "_TTLCache__root",
+            "_TTLCache__links",
+            "_Cache__data",
+            "_Cache__size",
+            "_Cache__currsize",
+        ):
+            assert hasattr(fast, name), f"cachetools no longer has {name}"
+
+        link = fast._TTLCache__root.next
+        for name in ("next", "key", "expires", "unlink"):
+            assert hasattr(link, name), f"cachetools TTL link has no {name}"
+
+    def test_expire_noop_when_nothing_expired(self):
+        """Test sweep is a no-op for an empty or fresh cache."""
+        timer, fast, _ = self._pair()
+
+        fast.expire()
+        fast["a"] = 1
+        timer.now = 9
+        fast.expire()
+
+        assert fast["a"] == 1
+
+
+class TestTieredCacheLookups:
+    """Test lookups across L1 and L2."""
+
+    async def test_get_many_reads_misses_with_one_l2_call(self):
+        """Test L1 hits skip Redis and L2 hits are promoted to L1."""
+        from unittest.mock import AsyncMock
+
+        from app.core.tiered_cache import TieredCache
+
+        cache = TieredCache()
+        cache.l2_cache = AsyncMock()
+        cache.l2_cache.get_json_many.return_value = [{"v": 2}, None]
+        cache.l1_cache["a"] = {"v": 1}
+
+        result = await cache.get_many(["a", "b", "c"])
+
+        assert result == {"a": {"v": 1}, "b": {"v": 2}}
+        cache.l2_cache.get_json_many.assert_awaited_once_with(["b", "c"])
+        assert cache.l1_cache["b"] == {"v": 2}
+        assert "c" not in cache.l1_cache
+
+    async def test_l2_miss_is_remembered_until_set(self):
+        """Test repeated misses skip Redis and a set clears the cached miss."""
+        from unittest.mock import AsyncMock
+
+        from app.core.tiered_cache import TieredCache
+
+        cache = TieredCache()
+        cache.l2_cache = AsyncMock()
+        cache.l2_cache.get_json.return_value = None
+
+        assert await cache.get("missing") is None
+        assert await cache.get("missing") is None
+        assert await cache.get_many(["missing"]) == {}
+        cache.l2_cache.get_json.assert_awaited_once_with("missing")
+        cache.l2_cache.get_json_many.assert_not_awaited()
+
+        await cache.set("missing", {"v": 1})
+        assert await cache.get("missing") == {"v": 1}
+
+    async def test_get_or_set_coalesces_concurrent_misses(self):
+        """Test concurrent misses for one key run the producer once."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from app.core.tiered_cache import TieredCache
+
+        cache = TieredCache()
+        cache.l2_cache = AsyncMock()
+        cache.l2_cache.get_json.return_value = None
+        calls = 0
+
+        async def producer():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"v": 1}
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("portfolio:0xabc", producer) for _ in range(20))
+        )
+
+        assert results == [{"v": 1}] * 20
+        assert calls == 1
+        cache.l2_cache.set_json.assert_awaited_once()
+        assert await cache.get_or_set("portfolio:0xabc", producer) == {"v": 1}
+        assert calls == 1
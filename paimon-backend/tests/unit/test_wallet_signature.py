@@ -217,3 +217,16 @@ class TestRecoverAddress:
         for invalid_sig in invalid_signatures:
             recovered = recover_address(message=message, signature=invalid_sig)
             assert recovered is None, f"Should return None for invalid signature: {invalid_sig}"
+
+    def test_recover_address_unicode_and_raw_recovery_id(self):
+        """Test non-ASCII messages and v given as 0/1 instead of 27/28."""
+        from app.core.wallet import recover_address
+
+        account = Account.create()
+        message = "Sign in to Paimon ✓ — nonce: abc"
+
+        signature = account.sign_message(encode_defunct(text=message)).signature
+        raw_v_signature = signature[:64] + bytes([signature[64] - 27])
+
+        assert recover_address(message, signature.hex()) == account.address
+        assert recover_address(message, raw_v_signature.hex()) == account.address